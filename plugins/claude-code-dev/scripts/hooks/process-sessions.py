@@ -6,27 +6,82 @@ Processes captured sessions with LLM analysis to extract feedback.
 Called by /sync-feedback command.
 
 Usage:
-    python3 process-sessions.py [--all] [--project <slug>] [--dry-run]
+    python3 process-sessions.py [--all] [--project <slug>] [--dry-run] [--retry]
 """
 
 import argparse
+import functools
+import hashlib
+import itertools
 import json
+import mmap
+import os
 import re
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
 
 
 # === CONFIGURATION ===
 
 LEARNINGS_DIR = Path.home() / ".claude" / "learnings"
 SESSIONS_DIR = LEARNINGS_DIR / "sessions"
+INDEX_FILE = SESSIONS_DIR / "index.jsonl"
 PROJECTS_FILE = LEARNINGS_DIR / "projects.json"
 STATS_FILE = LEARNINGS_DIR / "stats.json"
+SESSION_COUNTS_FILE = LEARNINGS_DIR / "session_counts.jsonl"
+SESSION_COUNTS_LOCK = LEARNINGS_DIR / "session_counts.lock"
+ANALYSIS_CACHE_DIR = LEARNINGS_DIR / "cache" / "analysis"
+ANALYSIS_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
+# Ordered for stable stats.json output; the set is for membership checks
+FEEDBACK_TYPES = ("improvement", "skill-idea", "command-idea", "bug-report", "pattern")
+_FEEDBACK_TYPES_SET = frozenset(FEEDBACK_TYPES)
+
+# Character budget for the user messages sent in one claude prompt
+ANALYSIS_CHAR_BUDGET = 15000
+MESSAGE_SEPARATOR = "\n---\n"
+
+# Precompiled patterns used per feedback item / per response
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# Markdown code fences (handles both actual and escaped newlines)
+_FENCE_HEAD_RE = re.compile(r'^```(?:json)?[\s\\n]*')
+_FENCE_TAIL_RE = re.compile(r'[\s\\n]*```$')
+
+# Transcripts larger than this are memory-mapped instead of read through a buffer
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
+# A session count fold lock older than this was left by a crashed run
+STALE_LOCK_SECONDS = 600
+
+# Don't repeat a failed analysis of an unchanged transcript within this window
+RETRY_AFTER_SECONDS = 3600
+
+# Sessions are analyzed concurrently; claude calls are I/O-bound
+MAX_WORKERS = 8
+
+# Serializes session index appends across worker threads
+_write_lock = threading.Lock()
+
+# Directories already created this run
+_mkdir_cache: Set[str] = set()
 
-FEEDBACK_TYPES = ["improvement", "skill-idea", "command-idea", "bug-report", "pattern"]
+# Lazily loaded projects.json, shared by every feedback item in a run
+_projects_cache: Optional[dict] = None
 
 
 # === UTILITY FUNCTIONS ===
@@ -36,57 +91,278 @@ def log(msg: str) -> None:
     print(f"[process-sessions] {msg}", file=sys.stderr)
 
 
+def atomic_write_json(path: Path, obj: dict) -> None:
+    """
+    Write indented JSON to a temp file and swap it into place.
+
+    The document is serialized straight to bytes (via orjson when available)
+    and the rename means a crash never leaves a truncated file behind.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode()
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def ensure_dir(path: Path) -> None:
+    """Create a directory once per run; later calls skip the syscalls."""
+    key = str(path)
+    if key not in _mkdir_cache:
+        path.mkdir(parents=True, exist_ok=True)
+        _mkdir_cache.add(key)
+
+
 def ensure_dirs() -> None:
     """Initialize directory structure."""
-    LEARNINGS_DIR.mkdir(parents=True, exist_ok=True)
-    SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+    ensure_dir(SESSIONS_DIR)
 
     if not STATS_FILE.exists():
-        STATS_FILE.write_text(json.dumps({
+        atomic_write_json(STATS_FILE, {
             "version": "1.0",
             "total_feedback": 0,
             "by_type": {t: 0 for t in FEEDBACK_TYPES},
             "by_project": {},
             "last_updated": datetime.now().isoformat()
-        }, indent=2))
+        })
 
 
-def get_pending_sessions(project_filter: Optional[str] = None) -> List[Path]:
-    """Get list of unprocessed session files."""
-    sessions = []
-    for f in SESSIONS_DIR.glob("*.json"):
+def append_index(row: dict) -> None:
+    """Append a row to the session index."""
+    with _write_lock, open(INDEX_FILE, "a") as f:
+        f.write(json.dumps(row) + "\n")
+
+
+def load_index() -> Tuple[Dict[str, dict], int]:
+    """
+    Fold the session index into the latest state per session file.
+
+    Rows are keyed by session filename ("f") and carry the project ("p")
+    and processed flag ("d"). Later rows override earlier ones, so marking
+    a session processed only needs a tombstone append.
+
+    Returns the folded entries and the number of raw rows read.
+    """
+    entries: Dict[str, dict] = {}
+    rows = 0
+    if not INDEX_FILE.exists():
+        return entries, rows
+
+    with open(INDEX_FILE, "rb") as f:
+        for line in f:
+            try:
+                row = _loads(line)
+            except ValueError:
+                continue
+            name = row.get("f")
+            if not name:
+                continue
+            rows += 1
+            entries.setdefault(name, {}).update(row)
+    return entries, rows
+
+
+def compact_index(entries: Dict[str, dict]) -> None:
+    """Rewrite the index with a single row per session file."""
+    tmp = INDEX_FILE.with_suffix(".jsonl.tmp")
+    with open(tmp, "w") as f:
+        for name in sorted(entries):
+            f.write(json.dumps(entries[name]) + "\n")
+    os.replace(tmp, INDEX_FILE)
+
+
+def acquire_fold_lock() -> bool:
+    """Create the session count fold lock; False if another run holds it."""
+    for _ in range(2):
         try:
-            data = json.loads(f.read_text())
-            if data.get("processed"):
+            fd = os.open(SESSION_COUNTS_LOCK, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            try:
+                age = time.time() - SESSION_COUNTS_LOCK.stat().st_mtime
+            except FileNotFoundError:
                 continue
-            if project_filter and data.get("project") != project_filter:
+            if age < STALE_LOCK_SECONDS:
+                return False
+            log("Removing stale session count lock")
+            SESSION_COUNTS_LOCK.unlink(missing_ok=True)
+            continue
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        return True
+    return False
+
+
+def fold_session_counts() -> None:
+    """
+    Fold session counts logged at capture time into projects.json.
+
+    save-feedback.py appends one {"p": slug, "t": captured_at} row per
+    session rather than rewriting projects.json. Only the run holding the
+    fold lock folds; it renames the log before reading so captures running
+    concurrently start a fresh one. Logs claimed by a run that crashed
+    before finishing are folded along with it, and rows for projects not
+    yet in projects.json are appended back for a later fold.
+    """
+    if not acquire_fold_lock():
+        return
+    try:
+        claimed = SESSION_COUNTS_FILE.with_suffix(f".jsonl.folding-{os.getpid()}")
+        try:
+            os.replace(SESSION_COUNTS_FILE, claimed)
+        except FileNotFoundError:
+            pass
+        sources = sorted(SESSION_COUNTS_FILE.parent.glob(SESSION_COUNTS_FILE.name + ".folding*"))
+        if not sources:
+            return
+
+        counts: Dict[str, int] = {}
+        last_seen: Dict[str, str] = {}
+        lines: Dict[str, List[bytes]] = {}
+        for source in sources:
+            with open(source, "rb") as f:
+                for line in f:
+                    try:
+                        row = _loads(line)
+                    except ValueError:
+                        continue
+                    slug = row.get("p")
+                    if not slug:
+                        continue
+                    counts[slug] = counts.get(slug, 0) + 1
+                    last_seen[slug] = max(last_seen.get(slug, ""), row.get("t") or "")
+                    lines.setdefault(slug, []).append(line.rstrip(b"\n") + b"\n")
+
+        try:
+            projects = json.loads(PROJECTS_FILE.read_text())
+        except (json.JSONDecodeError, IOError):
+            projects = {"version": "1.0", "projects": {}}
+
+        unknown: List[bytes] = []
+        for slug, count in counts.items():
+            info = projects.setdefault("projects", {}).get(slug)
+            if info is None:
+                unknown.extend(lines[slug])
                 continue
-            sessions.append(f)
+            info["session_count"] = info.get("session_count", 0) + count
+            if last_seen[slug] > info.get("last_session", ""):
+                info["last_session"] = last_seen[slug]
+
+        atomic_write_json(PROJECTS_FILE, projects)
+        if unknown:
+            fd = os.open(SESSION_COUNTS_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, b"".join(unknown))
+            finally:
+                os.close(fd)
+        for source in sources:
+            source.unlink()
+    finally:
+        SESSION_COUNTS_LOCK.unlink(missing_ok=True)
+
+
+def get_pending_sessions(project_filter: Optional[str] = None) -> List[Path]:
+    """
+    Get list of unprocessed session files.
+
+    Scans the session index instead of parsing every session file. Session
+    files missing from the index (e.g. captured by `forge session save`) are
+    read once and indexed so later runs skip them.
+    """
+    entries, rows = load_index()
+    with os.scandir(SESSIONS_DIR) as it:
+        on_disk = {
+            entry.name for entry in it
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+        }
+
+    for name in sorted(on_disk - entries.keys()):
+        try:
+            data = json.loads((SESSIONS_DIR / name).read_text())
         except (json.JSONDecodeError, IOError):
             continue
-    return sorted(sessions)
+        row = {"f": name, "p": data.get("project"), "d": bool(data.get("processed"))}
+        append_index(row)
+        entries[name] = row
+        rows += 1
+
+    stale = entries.keys() - on_disk
+    for name in stale:
+        del entries[name]
 
+    # Compact opportunistically once tombstones outnumber live rows
+    if stale or rows > 2 * len(entries):
+        compact_index(entries)
+
+    sessions = []
+    for name, row in entries.items():
+        if row.get("d"):
+            continue
+        if project_filter and row.get("p") != project_filter:
+            continue
+        sessions.append(name)
+    # Names are timestamp-prefixed, so lexical order is chronological
+    return [SESSIONS_DIR / name for name in sorted(sessions)]
+
+
+def iter_lines(path: str) -> Iterator[bytes]:
+    """Yield raw lines from a file, memory-mapping it when large."""
+    with open(path, "rb", buffering=1 << 16) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= MMAP_THRESHOLD:
+            yield from f
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            start = 0
+            while start < size:
+                end = mm.find(b"\n", start)
+                if end == -1:
+                    end = size
+                yield mm[start:end]
+                start = end + 1
+
+
+def iter_transcript(transcript_path: str, entry_type: Optional[str] = None) -> Iterator[dict]:
+    """
+    Stream entries from a transcript JSONL file.
+
+    With entry_type, lines that can't be of that type are rejected on the
+    raw bytes before JSON parsing. Callers must still check the parsed
+    type, since the marker may appear inside another field's value.
+    """
+    markers: Tuple[bytes, ...] = ()
+    if entry_type:
+        markers = (f'"type":"{entry_type}"'.encode(), f'"type": "{entry_type}"'.encode())
 
-def read_transcript(transcript_path: str) -> List[dict]:
-    """Read transcript JSONL file."""
-    entries = []
     try:
-        with open(transcript_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        entries.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+        # Read bytes: orjson parses them directly, stdlib json accepts them too
+        for line in iter_lines(transcript_path):
+            if markers and markers[0] not in line and markers[1] not in line:
+                continue
+            line = line.strip()
+            if line:
+                try:
+                    yield _loads(line)
+                except ValueError:
+                    continue
     except Exception as e:
         log(f"Failed to read transcript: {e}")
-    return entries
 
 
-def extract_user_messages(entries: List[dict]) -> str:
-    """Extract user messages from transcript entries."""
-    messages = []
+def extract_user_messages(entries: Iterable[dict]) -> str:
+    """
+    Extract the last 50 user messages from transcript entries.
+
+    Older messages are dropped while streaming once the joined result
+    would exceed ANALYSIS_CHAR_BUDGET, so the working set stays bounded
+    however long the transcript is and the newest messages survive whole.
+    """
+    messages: deque = deque(maxlen=50)
+    total_chars = 0
     for entry in entries:
         if entry.get("type") != "user":
             continue
@@ -102,19 +378,80 @@ def extract_user_messages(entries: List[dict]) -> str:
         if not content or not isinstance(content, str):
             continue
 
-        # Skip system/meta messages
-        if content.startswith("<") and content.endswith(">"):
-            continue
-        if "<local-command" in content or "<command-name>" in content:
+        # Skip system/meta messages; plain messages fail the first "<" scan
+        if "<" in content and (
+            (content[0] == "<" and content[-1] == ">")
+            or "<local-command" in content
+            or "<command-name>" in content
+        ):
             continue
 
         content = content.strip()
         if len(content) > 10:
-            messages.append(content[:1000])
+            content = content[:1000]
+            if len(messages) == messages.maxlen:
+                total_chars -= len(messages[0])
+            messages.append(content)
+            total_chars += len(content)
+            while total_chars + len(MESSAGE_SEPARATOR) * (len(messages) - 1) > ANALYSIS_CHAR_BUDGET:
+                total_chars -= len(messages.popleft())
+
+    return MESSAGE_SEPARATOR.join(messages)
+
 
-    return "\n---\n".join(messages[-50:])
+def analysis_cache_path(user_messages: str) -> Path:
+    """Cache file for the analysis of a given set of user messages."""
+    key = hashlib.blake2b(user_messages.encode(), digest_size=16).hexdigest()
+    return ANALYSIS_CACHE_DIR / f"{key}.json"
 
 
+def load_cached_analysis(user_messages: str) -> Optional[List[dict]]:
+    """Return feedback from a prior analysis of the same messages, if any."""
+    path = analysis_cache_path(user_messages)
+    try:
+        data = _loads(path.read_bytes())
+        # Bump atime explicitly; eviction must not depend on mount options
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+    feedback = data.get("feedback") if isinstance(data, dict) else None
+    return feedback if isinstance(feedback, list) else None
+
+
+def store_cached_analysis(user_messages: str, feedback: List[dict]) -> None:
+    """Cache the feedback extracted from a set of user messages."""
+    try:
+        ensure_dir(ANALYSIS_CACHE_DIR)
+        atomic_write_json(analysis_cache_path(user_messages), {"feedback": feedback})
+    except OSError as e:
+        log(f"Failed to cache analysis: {e}")
+
+
+def evict_analysis_cache(max_bytes: int = ANALYSIS_CACHE_MAX_BYTES) -> None:
+    """Drop least recently used cache entries until the cache fits max_bytes."""
+    try:
+        with os.scandir(ANALYSIS_CACHE_DIR) as it:
+            entries = [
+                (st.st_atime, st.st_size, entry.path)
+                for entry in it
+                if entry.name.endswith(".json")
+                for st in (entry.stat(),)
+            ]
+    except FileNotFoundError:
+        return
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
+@functools.lru_cache(maxsize=1)
 def load_prompt_template() -> str:
     """Load the analysis prompt template."""
     script_dir = Path(__file__).parent
@@ -135,14 +472,8 @@ Respond with JSON: {{"feedback": [{{"type": "improvement|skill-idea|command-idea
 If none found: {{"feedback": []}}'''
 
 
-def analyze_with_claude(user_messages: str) -> List[dict]:
-    """Use claude -p to analyze user messages for feedback."""
-    if not user_messages or len(user_messages) < 50:
-        return []
-
-    template = load_prompt_template()
-    prompt = template.format(messages=user_messages[:15000])
-
+def run_claude_once(prompt: str) -> Optional[dict]:
+    """Run a one-shot `claude -p` call and return its JSON output."""
     try:
         result = subprocess.run(
             ["claude", "-p", prompt, "--output-format", "json"],
@@ -150,55 +481,160 @@ def analyze_with_claude(user_messages: str) -> List[dict]:
             text=True,
             timeout=60
         )
+    except subprocess.TimeoutExpired:
+        log("claude -p timed out")
+        return None
+    except FileNotFoundError:
+        log("claude CLI not found")
+        return None
 
-        if result.returncode != 0:
-            log(f"claude -p failed: {result.stderr[:200]}")
-            return []
+    if result.returncode != 0:
+        log(f"claude -p failed: {result.stderr[:200]}")
+        return None
 
-        output = result.stdout.strip()
+    try:
+        return json.loads(result.stdout.strip())
+    except json.JSONDecodeError as e:
+        log(f"JSON parse error: {e}")
+        return None
 
-        # Parse response (claude wraps in {"result": "..."})
-        data = None
-        try:
-            wrapper = json.loads(output)
-            if "result" in wrapper:
-                inner = wrapper["result"]
-                # Strip markdown code fences (handles both actual and escaped newlines)
-                inner = re.sub(r'^```(?:json)?[\s\\n]*', '', inner)
-                inner = re.sub(r'[\s\\n]*```$', '', inner)
-                inner = inner.strip()
-                data = json.loads(inner)
-            elif "feedback" in wrapper:
-                data = wrapper
-        except json.JSONDecodeError as e:
-            log(f"JSON parse error: {e}, inner={inner[:100] if 'inner' in dir() else 'N/A'}")
-            pass
 
-        if data:
-            feedback = data.get("feedback", [])
-            if isinstance(feedback, list):
-                return feedback[:10]
-        return []
+@functools.lru_cache(maxsize=1)
+def load_batch_prompt_template() -> str:
+    """Load the multi-session analysis prompt template."""
+    prompt_file = Path(__file__).parent / "prompts" / "analyze-sessions-batch.txt"
 
-    except subprocess.TimeoutExpired:
-        log("claude -p timed out")
-        return []
-    except FileNotFoundError:
-        log("claude CLI not found")
+    if prompt_file.exists():
+        return prompt_file.read_text()
+
+    return '''Analyze these user messages from several Claude Code sessions. Each session starts with a "SESSION <id>:" line. Identify actionable feedback per session.
+
+USER MESSAGES:
+"""
+{sessions}
+"""
+
+Respond with JSON: {{"sessions": {{"<id>": {{"feedback": [{{"type": "improvement|skill-idea|command-idea|bug-report|pattern", "title": "...", "description": "...", "target": "..."}}]}}}}}}
+Use {{"feedback": []}} for sessions with nothing found.'''
+
+
+def parse_claude_response(wrapper: dict) -> Optional[dict]:
+    """Extract the JSON payload from a claude response."""
+    # claude wraps the answer in {"result": "..."}
+    if "result" not in wrapper:
+        return wrapper
+
+    inner = wrapper["result"]
+    inner = _FENCE_HEAD_RE.sub('', inner)
+    inner = _FENCE_TAIL_RE.sub('', inner)
+    inner = inner.strip()
+    try:
+        return json.loads(inner)
+    except json.JSONDecodeError as e:
+        log(f"JSON parse error: {e}, inner={inner[:100]}")
+        return None
+
+
+def ask_claude(prompt: str) -> Optional[dict]:
+    """Send a prompt as a one-shot call and parse the answer."""
+    wrapper = run_claude_once(prompt)
+    if not wrapper:
+        return None
+    return parse_claude_response(wrapper)
+
+
+def analyze_with_claude(user_messages: str) -> Optional[List[dict]]:
+    """Use claude -p to analyze user messages for feedback. Returns None on failure."""
+    if not user_messages or len(user_messages) < 50:
         return []
+
+    cached = load_cached_analysis(user_messages)
+    if cached is not None:
+        return cached
+
+    template = load_prompt_template()
+    prompt = template.format(messages=user_messages)
+
+    try:
+        data = ask_claude(prompt)
+        if data is None:
+            return None
+        feedback = data.get("feedback", [])
+        feedback = feedback[:10] if isinstance(feedback, list) else []
+        store_cached_analysis(user_messages, feedback)
+        return feedback
+
     except Exception as e:
         log(f"LLM analysis error: {e}")
-        return []
+        return None
+
+
+def batch_analyze_with_claude(
+    sessions: List[Tuple[str, str]]
+) -> Dict[str, Optional[List[dict]]]:
+    """
+    Analyze several sessions in a single claude call.
+
+    Takes (session key, user messages) pairs and returns feedback items per
+    session key. Sessions the call failed for, or that are missing from the
+    response, map to None. Cached sessions are left out of the prompt.
+    """
+    results: Dict[str, Optional[List[dict]]] = {}
+    uncached: Dict[str, str] = {}
+    for key, messages in sessions:
+        results[key] = load_cached_analysis(messages)
+        if results[key] is None:
+            uncached[key] = messages
+    if not uncached:
+        return results
+
+    blocks = "\n\n".join(f"SESSION {key}:\n{messages}" for key, messages in uncached.items())
+    prompt = load_batch_prompt_template().format(sessions=blocks)
+
+    try:
+        data = ask_claude(prompt)
+        by_session = data.get("sessions") if data else None
+        if not isinstance(by_session, dict):
+            return results
+
+        for key, messages in uncached.items():
+            entry = by_session.get(key)
+            if not isinstance(entry, dict):
+                continue
+            feedback = entry.get("feedback", [])
+            results[key] = feedback[:10] if isinstance(feedback, list) else []
+            store_cached_analysis(messages, results[key])
+    except Exception as e:
+        log(f"LLM batch analysis error: {e}")
+
+    return results
+
+
+def get_projects() -> dict:
+    """Load projects.json once per run."""
+    global _projects_cache
+    if _projects_cache is None:
+        try:
+            _projects_cache = json.loads(PROJECTS_FILE.read_text())
+        except (json.JSONDecodeError, IOError):
+            _projects_cache = {"projects": {}}
+    return _projects_cache
 
 
 def save_feedback_item(
     item: dict,
     project_slug: str,
-    session_id: str
-) -> Optional[Path]:
-    """Save a single feedback item."""
+    session_id: str,
+    now: datetime
+) -> Path:
+    """
+    Save a single feedback item.
+
+    Items saved in the same second get an increasing -NN suffix so they
+    never overwrite each other.
+    """
     feedback_type = item.get("type", "improvement")
-    if feedback_type not in FEEDBACK_TYPES:
+    if feedback_type not in _FEEDBACK_TYPES_SET:
         feedback_type = "improvement"
 
     title = item.get("title", "Untitled feedback")
@@ -206,21 +642,18 @@ def save_feedback_item(
     target = item.get("target", "")
 
     feedback_dir = LEARNINGS_DIR / "projects" / project_slug / "feedback" / feedback_type
-    feedback_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(feedback_dir)
 
-    date_str = datetime.now().strftime("%Y%m%d-%H%M%S")
-    title_slug = re.sub(r"[^a-z0-9]+", "-", title.lower())[:30].strip("-")
-    filename = f"{date_str}-{title_slug}.md"
-    filepath = feedback_dir / filename
+    date_str = now.strftime("%Y%m%d-%H%M%S")
+    title_slug = _SLUG_RE.sub("-", title.lower())[:30].strip("-")
 
     # Get project info
-    projects = json.loads(PROJECTS_FILE.read_text()) if PROJECTS_FILE.exists() else {"projects": {}}
-    project_info = projects.get("projects", {}).get(project_slug, {})
+    project_info = get_projects().get("projects", {}).get(project_slug, {})
 
     content = f"""---
 type: {feedback_type}
 status: pending
-captured: {datetime.now().isoformat()}
+captured: {now.isoformat()}
 session_id: {session_id}
 project: {project_slug}
 repo: {project_info.get('repo', '')}
@@ -232,72 +665,175 @@ target: {target}
 {description}
 """
 
-    filepath.write_text(content)
-    return filepath
-
+    # Raw fd + one write: skips the buffered/text layer's extra syscalls
+    data = content.encode()
+    for seq in itertools.count(1):
+        filepath = feedback_dir / f"{date_str}-{seq:02d}-{title_slug}.md"
+        try:
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            continue
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        return filepath
+    raise AssertionError("unreachable")
 
-def update_stats(project_slug: str, feedback_items: List[dict]) -> None:
-    """Update global statistics."""
-    stats = json.loads(STATS_FILE.read_text()) if STATS_FILE.exists() else {
-        "total_feedback": 0,
-        "by_type": {t: 0 for t in FEEDBACK_TYPES},
-        "by_project": {}
-    }
 
-    for item in feedback_items:
-        feedback_type = item.get("type", "improvement")
-        if feedback_type in FEEDBACK_TYPES:
-            stats["total_feedback"] += 1
-            stats["by_type"][feedback_type] = stats["by_type"].get(feedback_type, 0) + 1
-            stats["by_project"][project_slug] = stats["by_project"].get(project_slug, 0) + 1
+class StatsAggregator:
+    """
+    Accumulates feedback counts for a batch and writes stats.json once.
 
-    stats["last_updated"] = datetime.now().isoformat()
-    STATS_FILE.write_text(json.dumps(stats, indent=2))
+    Use as a context manager: stats.json is loaded on enter and atomically
+    replaced on exit, instead of a full rewrite per session.
+    """
 
+    def __init__(self, stats_file: Path = STATS_FILE):
+        self.stats_file = stats_file
+        self.stats: dict = {}
+        self.last_updated: Optional[datetime] = None
+        self._lock = threading.Lock()
 
-def process_session(session_file: Path, dry_run: bool = False) -> int:
-    """Process a single session file. Returns number of feedback items."""
+    def __enter__(self) -> "StatsAggregator":
+        self.stats = json.loads(self.stats_file.read_text()) if self.stats_file.exists() else {
+            "total_feedback": 0,
+            "by_type": {t: 0 for t in FEEDBACK_TYPES},
+            "by_project": {}
+        }
+        return self
+
+    def add(self, project_slug: str, feedback_items: List[dict], now: datetime) -> None:
+        """Count a session's feedback items."""
+        stats = self.stats
+        with self._lock:
+            for item in feedback_items:
+                feedback_type = item.get("type", "improvement")
+                if feedback_type in _FEEDBACK_TYPES_SET:
+                    stats["total_feedback"] += 1
+                    stats["by_type"][feedback_type] = stats["by_type"].get(feedback_type, 0) + 1
+                    stats["by_project"][project_slug] = stats["by_project"].get(project_slug, 0) + 1
+            if self.last_updated is None or now > self.last_updated:
+                self.last_updated = now
+
+    def __exit__(self, *exc) -> None:
+        # Sessions already marked processed must be counted even on error
+        if self.last_updated:
+            self.stats["last_updated"] = self.last_updated.isoformat()
+            atomic_write_json(self.stats_file, self.stats)
+
+
+@dataclass
+class PendingSession:
+    """A captured session whose user messages are ready for analysis."""
+
+    session_file: Path
+    data: dict
+    user_messages: str
+    transcript_size: int
+
+    @property
+    def key(self) -> str:
+        """Unique id for the session within a batch prompt."""
+        return self.session_file.stem
+
+
+def failed_recently(session_data: dict, transcript_size: int) -> bool:
+    """Whether analysis of this unchanged transcript failed within RETRY_AFTER_SECONDS."""
+    failed_at = session_data.get("analysis_failed_at")
+    if not failed_at or session_data.get("transcript_size") != transcript_size:
+        return False
+    try:
+        elapsed = datetime.now() - datetime.fromisoformat(failed_at)
+    except ValueError:
+        return False
+    return elapsed.total_seconds() < RETRY_AFTER_SECONDS
+
+
+def prepare_session(
+    session_file: Path,
+    dry_run: bool = False,
+    retry: bool = False
+) -> Optional[PendingSession]:
+    """Read a session file and extract its user messages for analysis."""
     try:
         session_data = json.loads(session_file.read_text())
     except (json.JSONDecodeError, IOError) as e:
         log(f"Failed to read session file: {e}")
-        return 0
+        return None
+
+    if session_data.get("processed"):
+        # Processed outside this script; bring the index back in sync
+        append_index({"f": session_file.name, "d": True})
+        return None
 
     transcript_path = session_data.get("transcript_path", "")
-    if not transcript_path or not Path(transcript_path).exists():
+    try:
+        transcript_size = os.stat(transcript_path).st_size if transcript_path else None
+    except OSError:
+        transcript_size = None
+    if transcript_size is None:
         log(f"Transcript not found: {transcript_path}")
-        return 0
+        return None
 
     project_slug = session_data.get("project", "unknown")
     session_id = session_data.get("session_id", "unknown")
 
-    log(f"Processing session {session_id[:8]} for project '{project_slug}'")
+    # A failed call on the same transcript would most likely fail again
+    if not retry and failed_recently(session_data, transcript_size):
+        log(f"Skipping session {session_id[:8]}: analysis failed recently (use --retry)")
+        return None
 
-    # Read and analyze transcript
-    entries = read_transcript(transcript_path)
-    if not entries:
-        log("No transcript entries")
-        return 0
+    log(f"Processing session {session_id[:8]} for project '{project_slug}'")
 
-    user_messages = extract_user_messages(entries)
+    # Stream and analyze transcript
+    user_messages = extract_user_messages(iter_transcript(transcript_path, "user"))
     if not user_messages:
         log("No user messages to analyze")
-        return 0
+        return None
 
     if dry_run:
         log(f"[dry-run] Would analyze {len(user_messages)} chars of messages")
+        return None
+
+    return PendingSession(session_file, session_data, user_messages, transcript_size)
+
+
+def finish_session(
+    session: PendingSession,
+    feedback_items: Optional[List[dict]],
+    stats: StatsAggregator
+) -> int:
+    """
+    Save feedback for an analyzed session. Returns number of feedback items.
+
+    feedback_items is None when analysis failed; the session then stays
+    pending with the failure recorded.
+    """
+    session_file = session.session_file
+    session_data = session.data
+    project_slug = session_data.get("project", "unknown")
+    session_id = session_data.get("session_id", "unknown")
+    now = datetime.now()
+    now_iso = now.isoformat()
+
+    if feedback_items is None:
+        log(f"Analysis failed for session {session_id[:8]}, leaving it pending")
+        session_data["analysis_failed_at"] = now_iso
+        session_data["transcript_size"] = session.transcript_size
+        atomic_write_json(session_file, session_data)
         return 0
 
-    # Analyze with LLM
-    feedback_items = analyze_with_claude(user_messages)
+    session_data.pop("analysis_failed_at", None)
 
     if not feedback_items:
-        log("No feedback found")
+        log(f"No feedback found in session {session_id[:8]}")
         # Mark as processed even if no feedback
         session_data["processed"] = True
-        session_data["processed_at"] = datetime.now().isoformat()
+        session_data["processed_at"] = now_iso
         session_data["feedback_count"] = 0
-        session_file.write_text(json.dumps(session_data, indent=2))
+        atomic_write_json(session_file, session_data)
+        append_index({"f": session_file.name, "d": True})
         return 0
 
     # Save feedback items
@@ -305,33 +841,68 @@ def process_session(session_file: Path, dry_run: bool = False) -> int:
     for item in feedback_items:
         if not isinstance(item, dict):
             continue
-        filepath = save_feedback_item(item, project_slug, session_id)
+        filepath = save_feedback_item(item, project_slug, session_id, now)
         if filepath:
             saved_count += 1
             log(f"  Saved: {filepath.name}")
 
     # Update stats
     if saved_count > 0:
-        update_stats(project_slug, feedback_items)
+        stats.add(project_slug, feedback_items, now)
 
     # Mark session as processed
     session_data["processed"] = True
-    session_data["processed_at"] = datetime.now().isoformat()
+    session_data["processed_at"] = now_iso
     session_data["feedback_count"] = saved_count
-    session_file.write_text(json.dumps(session_data, indent=2))
+    atomic_write_json(session_file, session_data)
+    append_index({"f": session_file.name, "d": True})
 
     return saved_count
 
 
+def chunk_sessions(sessions: List[PendingSession]) -> List[List[PendingSession]]:
+    """Group sessions so each chunk's messages fit in one prompt's budget."""
+    chunks: List[List[PendingSession]] = []
+    current: List[PendingSession] = []
+    size = 0
+    for session in sessions:
+        length = len(session.user_messages)
+        if current and size + length > ANALYSIS_CHAR_BUDGET:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(session)
+        size += length
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def process_chunk(
+    chunk: List[PendingSession],
+    stats: StatsAggregator
+) -> int:
+    """Analyze a chunk of sessions with one claude call. Returns number of feedback items."""
+    if len(chunk) == 1:
+        results = {chunk[0].key: analyze_with_claude(chunk[0].user_messages)}
+    else:
+        results = batch_analyze_with_claude(
+            [(session.key, session.user_messages) for session in chunk]
+        )
+    return sum(finish_session(session, results[session.key], stats) for session in chunk)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Process captured sessions with LLM analysis")
     parser.add_argument("--all", action="store_true", help="Process all pending sessions")
     parser.add_argument("--project", type=str, help="Only process sessions for this project")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be processed")
     parser.add_argument("--status", action="store_true", help="Show pending session count")
+    parser.add_argument("--retry", action="store_true",
+                        help="Retry sessions whose analysis failed recently")
     args = parser.parse_args()
 
     ensure_dirs()
+    fold_session_counts()
 
     pending = get_pending_sessions(args.project)
 
@@ -352,10 +923,19 @@ def main() -> int:
         print(f"Found {len(pending)} pending sessions. Use --all to process all, or specify --project")
         return 0
 
-    total_feedback = 0
-    for session_file in pending:
-        count = process_session(session_file, args.dry_run)
-        total_feedback += count
+    def prepare(session_file: Path) -> Optional[PendingSession]:
+        return prepare_session(session_file, args.dry_run, args.retry)
+
+    def run(chunk: List[PendingSession]) -> int:
+        return process_chunk(chunk, stats)
+
+    with StatsAggregator() as stats, \
+            ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(pending))) as executor:
+        prepared = [session for session in executor.map(prepare, pending) if session]
+        # Small sessions share a prompt so the instructions are sent once
+        total_feedback = sum(executor.map(run, chunk_sessions(prepared)))
+
+    evict_analysis_cache()
 
     print(f"\nProcessed {len(pending)} sessions, found {total_feedback} feedback items")
     return 0
@@ -20,12 +20,21 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # === CONFIGURATION ===
 
 LEARNINGS_DIR = Path.home() / ".claude" / "learnings"
 SESSIONS_DIR = LEARNINGS_DIR / "sessions"
+INDEX_FILE = SESSIONS_DIR / "index.jsonl"
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 PROJECTS_FILE = LEARNINGS_DIR / "projects.json"
+SESSION_COUNTS_FILE = LEARNINGS_DIR / "session_counts.jsonl"
 
 
 # === UTILITY FUNCTIONS ===
@@ -35,20 +44,80 @@ def log(msg: str) -> None:
     print(f"[session-capture] {msg}", file=sys.stderr)
 
 
+def atomic_write_json(path: Path, obj: dict) -> None:
+    """Write indented JSON to a temp file and swap it into place."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode()
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
 def ensure_dirs() -> None:
     """Initialize directory structure."""
     LEARNINGS_DIR.mkdir(parents=True, exist_ok=True)
     SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
 
     if not PROJECTS_FILE.exists():
-        PROJECTS_FILE.write_text(json.dumps({
+        atomic_write_json(PROJECTS_FILE, {
             "version": "1.0",
             "projects": {}
-        }, indent=2))
+        })
+
+
+def find_git_config(cwd: str) -> Optional[Path]:
+    """Locate the config file of the git repository containing cwd."""
+    start = Path(cwd)
+    for directory in (start, *start.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git / "config"
+        if dot_git.is_file():
+            # Worktrees and submodules: ".git" is a "gitdir: <path>" pointer
+            content = dot_git.read_text().strip()
+            if not content.startswith("gitdir:"):
+                return None
+            gitdir = directory / content[len("gitdir:"):].strip()
+            # Worktree gitdirs share the main repository's config
+            commondir = gitdir / "commondir"
+            if commondir.is_file():
+                gitdir = gitdir / commondir.read_text().strip()
+            return gitdir / "config"
+    return None
+
+
+def read_origin_url(config_file: Path) -> Optional[str]:
+    """Read remote.origin.url from a git config file."""
+    in_origin = False
+    for line in config_file.read_text().splitlines():
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            in_origin = line == '[remote "origin"]'
+            continue
+        key, sep, value = line.partition("=")
+        if in_origin and sep and key.strip().lower() == "url":
+            return value.strip().strip('"')
+    return None
 
 
 def get_git_remote_url(cwd: str) -> Optional[str]:
-    """Extract the git remote URL from a directory."""
+    """
+    Extract the git remote URL from a directory.
+
+    Reads the repository's config file directly to avoid spawning git;
+    falls back to `git remote get-url` when the config can't be found.
+    """
+    try:
+        config_file = find_git_config(cwd)
+        if config_file is not None:
+            return read_origin_url(config_file)
+    except OSError:
+        pass
+
     try:
         result = subprocess.run(
             ["git", "-C", cwd, "remote", "get-url", "origin"],
@@ -67,7 +136,7 @@ def get_project_slug(cwd: str) -> str:
     """Generate a slug for the project based on its path."""
     path = Path(cwd)
     slug = path.name.lower()
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
+    slug = _SLUG_RE.sub("-", slug)
     slug = slug.strip("-")
     return slug or "unknown-project"
 
@@ -86,7 +155,7 @@ def register_project(cwd: str) -> str:
             "registered": datetime.now().isoformat(),
             "session_count": 0
         }
-        PROJECTS_FILE.write_text(json.dumps(projects, indent=2))
+        atomic_write_json(PROJECTS_FILE, projects)
 
     return slug
 
@@ -116,27 +185,34 @@ def save_session(hook_data: dict) -> Optional[Path]:
     project_slug = register_project(cwd)
 
     # Create session record
+    captured_at = datetime.now().isoformat()
     session_record = {
         "session_id": session_id,
         "project": project_slug,
         "cwd": cwd,
         "transcript_path": transcript_path,
-        "captured_at": datetime.now().isoformat(),
+        "transcript_size": Path(transcript_path).stat().st_size,
+        "captured_at": captured_at,
         "processed": False
     }
 
     # Save to sessions directory
     date_str = datetime.now().strftime("%Y%m%d-%H%M%S")
     session_file = SESSIONS_DIR / f"{date_str}-{session_id[:8]}.json"
-    session_file.write_text(json.dumps(session_record, indent=2))
+    atomic_write_json(session_file, session_record)
 
-    # Update project session count
-    projects = json.loads(PROJECTS_FILE.read_text())
-    if project_slug in projects["projects"]:
-        projects["projects"][project_slug]["session_count"] = \
-            projects["projects"][project_slug].get("session_count", 0) + 1
-        projects["projects"][project_slug]["last_session"] = datetime.now().isoformat()
-        PROJECTS_FILE.write_text(json.dumps(projects, indent=2))
+    # Index the session so process-sessions.py doesn't parse every file
+    with open(INDEX_FILE, "a") as f:
+        f.write(json.dumps({"f": session_file.name, "p": project_slug, "d": False}) + "\n")
+
+    # Log the session for the project's session count instead of rewriting
+    # projects.json; process-sessions.py folds these deltas in later
+    line = json.dumps({"p": project_slug, "t": captured_at}) + "\n"
+    fd = os.open(SESSION_COUNTS_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line.encode())
+    finally:
+        os.close(fd)
 
     return session_file
 
@@ -3,53 +3,179 @@
 Django Parallel Readiness Analyzer
 
 Analyzes a Django codebase for parallelization readiness.
-Run from project root: python analyze-readiness.py [apps_dir]
+Run from project root: python analyze-readiness.py [apps_dir] [--jobs N] [--no-cache] [--quick]
 
-Requirements: None (uses only stdlib)
+Requirements: None (uses only stdlib; google-re2 is used when installed)
 """
 
 import os
 import re
-import sys
+import mmap
 import json
-import subprocess
+import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import TypedDict
+from typing import Any, Optional, Union
 
+try:
+    # Optional linear-time engine; every pattern below is RE2-compatible
+    # (no backreferences or lookaround), with flags written inline
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
 
-class DimensionResult(TypedDict):
-    score: int
-    max: int
-    issues: list[str]
-    good: list[str]
+
+class Dimension:
+    """Score, issues and strengths for one readiness dimension."""
+
+    __slots__ = ("max", "score", "issues", "good")
+
+    def __init__(self, max: int) -> None:
+        self.max = max
+        self.score = 0
+        self.issues: list[str] = []
+        self.good: list[str] = []
 
 
-@dataclass
 class AnalysisResults:
-    app_boundaries: DimensionResult = field(
-        default_factory=lambda: {"score": 0, "max": 20, "issues": [], "good": []}
-    )
-    shared_state: DimensionResult = field(
-        default_factory=lambda: {"score": 0, "max": 20, "issues": [], "good": []}
-    )
-    contracts: DimensionResult = field(
-        default_factory=lambda: {"score": 0, "max": 20, "issues": [], "good": []}
-    )
-    tests: DimensionResult = field(
-        default_factory=lambda: {"score": 0, "max": 15, "issues": [], "good": []}
+    __slots__ = (
+        "app_boundaries", "shared_state", "contracts", "tests", "documentation", "dependencies",
     )
-    documentation: DimensionResult = field(
-        default_factory=lambda: {"score": 0, "max": 15, "issues": [], "good": []}
-    )
-    dependencies: DimensionResult = field(
-        default_factory=lambda: {"score": 0, "max": 10, "issues": [], "good": []}
+
+    def __init__(self) -> None:
+        self.app_boundaries = Dimension(max=20)
+        self.shared_state = Dimension(max=20)
+        self.contracts = Dimension(max=20)
+        self.tests = Dimension(max=15)
+        self.documentation = Dimension(max=15)
+        self.dependencies = Dimension(max=10)
+
+
+class RepoFiles:
+    """Files classified by name during a single walk of the project tree."""
+
+    __slots__ = ("unscanned_files", "test_files", "migrations")
+
+    def __init__(self) -> None:
+        # Python files outside the source scan, which still need a factory check
+        self.unscanned_files: list[str] = []
+        self.test_files = 0
+        self.migrations = 0
+
+
+class ScanCounts:
+    """Pattern counts from scanning source files, summed across files."""
+
+    __slots__ = (
+        "total_imports", "cross_app_imports", "global_patterns", "signals",
+        "bad_serializers", "factory_files", "app_imports",
     )
 
+    def __init__(
+        self,
+        total_imports: int = 0,
+        cross_app_imports: int = 0,
+        global_patterns: int = 0,
+        signals: int = 0,
+        bad_serializers: int = 0,
+        factory_files: int = 0,
+        app_imports: Optional[dict[str, list[str]]] = None,
+    ) -> None:
+        self.total_imports = total_imports
+        self.cross_app_imports = cross_app_imports
+        self.global_patterns = global_patterns
+        self.signals = signals
+        self.bad_serializers = bad_serializers
+        self.factory_files = factory_files
+        # App import graph: app name -> other apps it imports via "apps.<name>"
+        self.app_imports = {} if app_imports is None else app_imports
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counts as a plain dict, for pickling and the scan cache."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def merge(self, other: "ScanCounts") -> None:
+        self.total_imports += other.total_imports
+        self.cross_app_imports += other.cross_app_imports
+        self.global_patterns += other.global_patterns
+        self.signals += other.signals
+        self.bad_serializers += other.bad_serializers
+        self.factory_files += other.factory_files
+        for app, targets in other.app_imports.items():
+            known = self.app_imports.setdefault(app, [])
+            known.extend(t for t in targets if t not in known)
+
 
 # Configuration
-APPS_DIR = sys.argv[1] if len(sys.argv) > 1 else "apps"
-EXCLUDE_DIRS = {"__pycache__", ".git", "node_modules", "venv", ".venv", "env", ".env", "migrations"}
+APPS_DIR = "apps"  # overridden by the apps_dir argument in main()
+EXCLUDE_DIRS = frozenset({"__pycache__", ".git", "node_modules", "venv", ".venv", "env", ".env", "migrations"})
+
+# Compiled once; each is applied to every scanned file. Source patterns are
+# bytes so files are scanned without decoding them (all patterns are ASCII).
+IMPORT_RE = regex_engine.compile(rb"(?m)from\s+[\w.]+\s+import|^import\s+[\w.]+")
+# Only imports that can cross apps: "apps.<app>..." (app captured) or relative
+# "..x" (captured as empty). One group per statement form; one is always empty.
+CROSS_APP_IMPORT_RE = regex_engine.compile(
+    rb"(?m)from\s+(?:apps\.(\w*)|\.\.)[\w.]*\s+import|^import\s+(?:apps\.(\w*)|\.\.)"
+)
+MODEL_RE = regex_engine.compile(rb"class\s+\w+\(.*Model.*\):")
+SERIALIZER_ALL_RE = regex_engine.compile(rb'fields\s*=\s*["\']__all__["\']')
+PINNED_RE = regex_engine.compile(r"==\d")
+
+# Files handed to each worker per round trip when scanning with --jobs
+SCAN_CHUNKSIZE = 32
+
+# Larger source files (generated or vendored code) are skipped, not scanned
+MAX_SCAN_BYTES = 2 << 20
+
+# Files above this are memory-mapped rather than copied into a bytes object.
+# Only stdlib re can search an mmap; with re2 every file is read normally.
+MMAP_THRESHOLD = 64 << 10
+
+# Scanned content: file bytes, or a read-only mmap of a large file. Substring
+# tests use .find() because `in` on an mmap only checks single bytes.
+SourceBuffer = Union[bytes, mmap.mmap]
+
+# Totals at which a ScanCounts field can no longer change its dimension's
+# score (see the analyzer thresholds); with --quick, counting stops there
+SATURATION = {"global_patterns": 20, "signals": 10, "bad_serializers": 1, "factory_files": 1}
+
+# Per-file scan results keyed by (mtime_ns, size); bump the version whenever
+# scan_file or its patterns change so stale counts are discarded
+SCAN_CACHE_FILE = Path(".claude") / ".readiness-cache.json"
+SCAN_CACHE_VERSION = 6
+
+# Patterns indicating shared mutable state
+STATE_PATTERNS = [
+    rb"^[a-z_][a-z0-9_]*\s*=\s*\[\]",  # module-level empty list
+    rb"^[a-z_][a-z0-9_]*\s*=\s*\{\}",  # module-level empty dict
+    rb"^[a-z_][a-z0-9_]*\s*=\s*set\(\)",  # module-level empty set
+    rb"global\s+\w+",  # global keyword usage
+    rb"_instance\s*=",  # singleton pattern
+]
+
+SIGNAL_PATTERNS = [
+    rb"@receiver\s*\(",
+    rb"\.connect\s*\(",
+    rb"post_save\.",
+    rb"pre_save\.",
+    rb"post_delete\.",
+]
+
+# Each pattern is compiled and counted on its own, so a line matching two of
+# them (e.g. "post_save.connect(") counts once per pattern, as it always has
+STATE_RES = tuple(regex_engine.compile(b"(?m)" + p) for p in STATE_PATTERNS)
+
+# Each signal pattern with a literal it contains; the regex only runs on files
+# where that literal occurs
+SIGNAL_CHECKS = tuple(
+    (literal, regex_engine.compile(p))
+    for literal, p in zip(
+        (b"@receiver", b".connect", b"post_save.", b"pre_save.", b"post_delete."),
+        SIGNAL_PATTERNS,
+    )
+)
 
 results = AnalysisResults()
 
@@ -63,15 +189,51 @@ def find_python_files(directory: str) -> list[Path]:
     """Find all Python files in directory, excluding certain folders."""
     files = []
     root = Path(directory)
-    if not root.exists():
+    if not root.exists() or not EXCLUDE_DIRS.isdisjoint(root.parts):
         return files
 
-    for path in root.rglob("*.py"):
-        if not any(excluded in path.parts for excluded in EXCLUDE_DIRS):
-            files.append(path)
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Prune in place so excluded subtrees are never descended into
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDE_DIRS]
+        base = Path(dirpath)
+        files.extend(base / name for name in filenames if name.endswith(".py"))
     return files
 
 
+def walk_repo(scanned: list[Path], root: str = ".") -> RepoFiles:
+    """Walk the project once, classifying files for the tree-wide analyzers.
+
+    Files in ``scanned`` were already read by the source scan and are not
+    listed again for the factory check.
+    """
+    repo = RepoFiles()
+    scanned_paths = {os.path.abspath(p) for p in scanned}
+    # migrations/ is walked (to count migrations) but its files are not
+    # treated as source, tests, or factories
+    prune = EXCLUDE_DIRS - {"migrations"}
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in prune]
+        in_migrations = os.path.basename(dirpath) == "migrations"
+        if in_migrations:
+            dirnames.clear()
+
+        for name in filenames:
+            if not name.endswith(".py"):
+                continue
+            if in_migrations:
+                if name != "__init__.py":
+                    repo.migrations += 1
+                continue
+            path = os.path.join(dirpath, name)
+            if os.path.abspath(path) not in scanned_paths:
+                repo.unscanned_files.append(path)
+            if name.startswith("test_") or name.endswith("_test.py"):
+                repo.test_files += 1
+
+    return repo
+
+
 def read_file_safe(path: Path) -> str:
     """Safely read a file, returning empty string on error."""
     try:
@@ -80,39 +242,77 @@ def read_file_safe(path: Path) -> str:
         return ""
 
 
-def count_cross_app_imports(file_path: Path) -> dict[str, int]:
-    """Count imports in a file, identifying cross-app imports."""
-    content = read_file_safe(file_path)
+@functools.lru_cache(maxsize=64)
+def read_config(path: str) -> Optional[str]:
+    """Read a project config file once for all analyzers; None if missing."""
+    if not file_exists(path):
+        return None
+    return read_file_safe(Path(path))
+
+
+def count_matches(pattern: Any, content: Union[SourceBuffer, str]) -> int:
+    """Count pattern matches without building the list findall would return."""
+    return sum(1 for _ in pattern.finditer(content))
+
+
+def read_source_bytes(path: Path, limit: int = MAX_SCAN_BYTES) -> bytes:
+    """Read a source file as bytes, returning b"" on error or above the size cap."""
+    try:
+        if path.stat().st_size > limit:
+            return b""
+        return path.read_bytes()
+    except OSError:
+        return b""
+
+
+def app_for_parts(parts: tuple[str, ...]) -> Optional[bytes]:
+    """Return the app a path belongs to: its first non-"apps", non-excluded part."""
+    for part in parts:
+        if part != "apps" and part not in EXCLUDE_DIRS:
+            return part.encode()
+    return None
+
+
+# Files in one directory share an app, so lookups are cached per parent
+_APP_CACHE: dict[Path, Optional[bytes]] = {}
+
 
-    # Find all imports
-    from_imports = re.findall(r"from\s+([\w.]+)\s+import", content)
-    direct_imports = re.findall(r"^import\s+([\w.]+)", content, re.MULTILINE)
+def app_for_file(file_path: Path) -> Optional[bytes]:
+    """Return the app name of a source file, as bytes for import comparisons."""
+    parent = file_path.parent
+    if parent not in _APP_CACHE:
+        _APP_CACHE[parent] = app_for_parts(parent.parts)
+    app = _APP_CACHE[parent]
+    # Top-level files have no qualifying directory; fall back to the file name
+    return app if app is not None else app_for_parts((file_path.name,))
 
-    all_imports = from_imports + direct_imports
-    total = len(all_imports)
+
+def count_cross_app_imports(file_path: Path, content: SourceBuffer) -> dict[str, Any]:
+    """Count imports in a file, identifying cross-app imports."""
+    total = count_matches(IMPORT_RE, content)
 
     # Count cross-app imports (imports from other apps)
     cross_app = 0
-    for imp in all_imports:
-        # Check if it's importing from another app
-        if imp.startswith("apps.") or imp.startswith(".."):
-            # Get the app name from the import
-            parts = imp.split(".")
-            if len(parts) >= 2:
-                # Check if it's a different app than the current file's app
-                file_app = None
-                for part in file_path.parts:
-                    if part != "apps" and part not in EXCLUDE_DIRS:
-                        file_app = part
-                        break
-                if file_app and parts[1] != file_app:
-                    cross_app += 1
-
-    return {"total": total, "cross_app": cross_app}
-
-
-def analyze_app_boundaries() -> None:
-    """Analyze Django app separation and module boundaries."""
+    imported_apps: set[bytes] = set()
+    file_app = app_for_file(file_path)
+    if file_app is None:
+        return {"total": total, "cross_app": 0, "imported_apps": {}}
+
+    for from_app, import_app in CROSS_APP_IMPORT_RE.findall(content):
+        app = from_app or import_app
+        if app != file_app:
+            cross_app += 1
+            # Relative imports don't name their target app; only absolute
+            # ones become edges in the app import graph
+            if app:
+                imported_apps.add(app)
+
+    graph = {file_app.decode(): sorted(a.decode() for a in imported_apps)} if imported_apps else {}
+    return {"total": total, "cross_app": cross_app, "imported_apps": graph}
+
+
+def find_source_files() -> list[Path]:
+    """Find the Python files to scan, falling back to common layouts."""
     python_files = find_python_files(APPS_DIR)
 
     if not python_files:
@@ -122,46 +322,222 @@ def analyze_app_boundaries() -> None:
             if python_files:
                 break
 
-    total_imports = 0
-    cross_app_imports = 0
+    return python_files
+
+
+def is_factory_source(content: SourceBuffer) -> bool:
+    """Check whether a file defines Factory Boy factories."""
+    return content.find(b"factory.Factory") != -1 or content.find(b"DjangoModelFactory") != -1
+
+
+def scan_file(file_path: Path, content: SourceBuffer, skip: frozenset[str] = frozenset()) -> ScanCounts:
+    """Run every per-file check against one file's content.
+
+    Checks for the ScanCounts fields named in ``skip`` are not run.
+    """
+    imports = count_cross_app_imports(file_path, content)
+    counts = ScanCounts(
+        total_imports=imports["total"],
+        cross_app_imports=imports["cross_app"],
+        app_imports=imports["imported_apps"],
+    )
+
+    if "global_patterns" not in skip:
+        counts.global_patterns = sum(count_matches(pattern, content) for pattern in STATE_RES)
+
+    if "signals" not in skip:
+        counts.signals = sum(
+            count_matches(pattern, content)
+            for literal, pattern in SIGNAL_CHECKS
+            if content.find(literal) != -1
+        )
+
+    if "bad_serializers" not in skip and "serializer" in file_path.name.lower():
+        counts.bad_serializers = count_matches(SERIALIZER_ALL_RE, content)
+
+    if "factory_files" not in skip and is_factory_source(content):
+        counts.factory_files = 1
+
+    return counts
+
+
+def saturated_fields(totals: ScanCounts) -> frozenset[str]:
+    """Return the ScanCounts fields whose totals have reached SATURATION."""
+    return frozenset(name for name, limit in SATURATION.items() if getattr(totals, name) >= limit)
+
+
+def scan_file_worker(path_str: str, skip: frozenset[str] = frozenset()) -> dict[str, Any]:
+    """Scan one file in a worker process; plain str/dict keep pickling cheap."""
+    file_path = Path(path_str)
+    try:
+        size = file_path.stat().st_size
+    except OSError:
+        size = 0
+
+    if MMAP_THRESHOLD < size <= MAX_SCAN_BYTES and regex_engine is re:
+        try:
+            with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return scan_file(file_path, mm, skip).as_dict()
+        except (OSError, ValueError):
+            pass  # Fall back to a plain read below
+
+    return scan_file(file_path, read_source_bytes(file_path), skip).as_dict()
+
+
+def load_scan_cache() -> dict[str, list]:
+    """Load cached per-file scan results, or an empty cache if unusable."""
+    try:
+        data = json.loads(SCAN_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != SCAN_CACHE_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def save_scan_cache(cache: dict[str, list]) -> None:
+    """Write per-file scan results back for the next run."""
+    try:
+        SCAN_CACHE_FILE.parent.mkdir(exist_ok=True)
+        SCAN_CACHE_FILE.write_text(
+            json.dumps({"version": SCAN_CACHE_VERSION, "files": cache}), encoding="utf-8"
+        )
+    except OSError:
+        pass
 
-    for file_path in python_files:
-        counts = count_cross_app_imports(file_path)
-        total_imports += counts["total"]
-        cross_app_imports += counts["cross_app"]
+
+def scan_source_files(
+    python_files: list[Path],
+    jobs: int = 1,
+    cache: Optional[dict[str, list]] = None,
+    quick: bool = False,
+) -> ScanCounts:
+    """Scan all source files once, aggregating counts for the analyzers.
+
+    With a cache, files whose (mtime_ns, size) are unchanged reuse their
+    stored counts; the cache is updated in place to match the current tree.
+
+    With ``quick``, checks whose totals have saturated are skipped for the
+    remaining files, so those totals are lower bounds. Import checks always
+    run: the cross-app ratio and cycle detection need every file.
+    """
+    totals = ScanCounts()
+    stats: dict[str, list[int]] = {}
+
+    if cache is not None:
+        pending = []
+        for file_path in python_files:
+            key = str(file_path)
+            try:
+                st = file_path.stat()
+            except OSError:
+                continue
+            stats[key] = [st.st_mtime_ns, st.st_size]
+            entry = cache.get(key)
+            if entry and entry[:2] == stats[key]:
+                totals.merge(ScanCounts(**entry[2]))
+            else:
+                pending.append(file_path)
+        # Drop entries for files that no longer exist
+        for key in cache.keys() - stats.keys():
+            del cache[key]
+        python_files = pending
+
+    def record(path_str: str, counts: dict[str, Any], partial: bool = False) -> None:
+        totals.merge(ScanCounts(**counts))
+        # Partial counts from a quick scan would be wrong on the next run
+        if cache is not None and path_str in stats and not partial:
+            cache[path_str] = stats[path_str] + [counts]
+
+    paths = [str(p) for p in python_files]
+
+    # Quick scans need running totals, which pool workers can't see. Pool
+    # startup also costs more than it saves on small trees.
+    if quick or jobs <= 1 or len(paths) < SCAN_CHUNKSIZE * 2:
+        for path_str in paths:
+            skip = saturated_fields(totals) if quick else frozenset()
+            record(path_str, scan_file_worker(path_str, skip), partial=bool(skip))
+        return totals
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for path_str, counts in zip(paths, executor.map(scan_file_worker, paths, chunksize=SCAN_CHUNKSIZE)):
+            record(path_str, counts)
+    return totals
+
+
+def find_import_cycles(graph: dict[str, list[str]]) -> list[list[str]]:
+    """Return the import cycles in an app graph as sorted lists of app names.
+
+    Tarjan's algorithm: every strongly connected component with more than
+    one app is a set of apps that (transitively) import each other.
+    """
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    cycles: list[list[str]] = []
+
+    def visit(app: str) -> None:
+        index[app] = lowlink[app] = len(index)
+        stack.append(app)
+        on_stack.add(app)
+
+        for target in graph.get(app, ()):
+            if target not in index:
+                visit(target)
+                lowlink[app] = min(lowlink[app], lowlink[target])
+            elif target in on_stack:
+                lowlink[app] = min(lowlink[app], index[target])
+
+        if lowlink[app] == index[app]:
+            component = []
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                component.append(member)
+                if member == app:
+                    break
+            if len(component) > 1:
+                cycles.append(sorted(component))
+
+    for app in sorted(graph):
+        if app not in index:
+            visit(app)
+
+    return sorted(cycles)
+
+
+def analyze_app_boundaries(counts: ScanCounts) -> None:
+    """Analyze Django app separation and module boundaries."""
+    total_imports = counts.total_imports
+    cross_app_imports = counts.cross_app_imports
 
     cross_ratio = cross_app_imports / total_imports if total_imports > 0 else 0
 
     if cross_ratio < 0.1:
-        results.app_boundaries["score"] = 20
-        results.app_boundaries["good"].append("Low cross-app imports (<10%)")
+        results.app_boundaries.score = 20
+        results.app_boundaries.good.append("Low cross-app imports (<10%)")
     elif cross_ratio < 0.3:
-        results.app_boundaries["score"] = 12
-        results.app_boundaries["issues"].append(
+        results.app_boundaries.score = 12
+        results.app_boundaries.issues.append(
             f"Moderate cross-app imports ({cross_ratio * 100:.1f}%)"
         )
     else:
-        results.app_boundaries["score"] = 5
-        results.app_boundaries["issues"].append(
+        results.app_boundaries.score = 5
+        results.app_boundaries.issues.append(
             f"High cross-app imports ({cross_ratio * 100:.1f}%)"
         )
 
-    # Check for circular imports
-    try:
-        # Try to import the apps module to detect circular imports
-        result = subprocess.run(
-            [sys.executable, "-c", f"import sys; sys.setrecursionlimit(100); import {APPS_DIR.replace('/', '.')}"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if "RecursionError" in result.stderr or "circular" in result.stderr.lower():
-            results.app_boundaries["score"] -= 5
-            results.app_boundaries["issues"].append("Circular imports detected")
-        else:
-            results.app_boundaries["good"].append("No obvious circular imports")
-    except Exception:
-        pass
+    # Check for circular imports between apps
+    cycles = find_import_cycles(counts.app_imports)
+    if cycles:
+        results.app_boundaries.score -= 5
+        for cycle in cycles:
+            results.app_boundaries.issues.append(
+                f"Circular imports between apps: {', '.join(cycle)}"
+            )
+    else:
+        results.app_boundaries.good.append("No circular imports between apps")
 
     # Count models per app to detect god apps
     apps_path = Path(APPS_DIR)
@@ -170,80 +546,50 @@ def analyze_app_boundaries() -> None:
             if app_dir.is_dir() and app_dir.name not in EXCLUDE_DIRS:
                 models_file = app_dir / "models.py"
                 if models_file.exists():
-                    content = read_file_safe(models_file)
-                    model_count = len(re.findall(r"class\s+\w+\(.*Model.*\):", content))
+                    content = read_source_bytes(models_file)
+                    model_count = count_matches(MODEL_RE, content)
                     if model_count > 15:
-                        results.app_boundaries["issues"].append(
+                        results.app_boundaries.issues.append(
                             f"App '{app_dir.name}' has {model_count} models (consider splitting)"
                         )
 
 
-def analyze_shared_state() -> None:
+def analyze_shared_state(counts: ScanCounts) -> None:
     """Analyze global state and shared mutable patterns."""
-    python_files = find_python_files(APPS_DIR) or find_python_files(".")
-
-    global_patterns = 0
-    signal_count = 0
-
-    # Patterns indicating shared mutable state
-    state_patterns = [
-        r"^[a-z_][a-z0-9_]*\s*=\s*\[\]",  # module-level empty list
-        r"^[a-z_][a-z0-9_]*\s*=\s*\{\}",  # module-level empty dict
-        r"^[a-z_][a-z0-9_]*\s*=\s*set\(\)",  # module-level empty set
-        r"global\s+\w+",  # global keyword usage
-        r"_instance\s*=",  # singleton pattern
-    ]
-
-    signal_patterns = [
-        r"@receiver\s*\(",
-        r"\.connect\s*\(",
-        r"post_save\.",
-        r"pre_save\.",
-        r"post_delete\.",
-    ]
-
-    for file_path in python_files:
-        content = read_file_safe(file_path)
-
-        for pattern in state_patterns:
-            matches = re.findall(pattern, content, re.MULTILINE)
-            global_patterns += len(matches)
-
-        for pattern in signal_patterns:
-            matches = re.findall(pattern, content)
-            signal_count += len(matches)
+    global_patterns = counts.global_patterns
+    signal_count = counts.signals
 
     # Score based on global patterns
     if global_patterns < 5:
-        results.shared_state["score"] = 15
-        results.shared_state["good"].append("Minimal global state patterns")
+        results.shared_state.score = 15
+        results.shared_state.good.append("Minimal global state patterns")
     elif global_patterns < 20:
-        results.shared_state["score"] = 10
-        results.shared_state["issues"].append(
+        results.shared_state.score = 10
+        results.shared_state.issues.append(
             f"Some global state patterns ({global_patterns} found)"
         )
     else:
-        results.shared_state["score"] = 3
-        results.shared_state["issues"].append(
+        results.shared_state.score = 3
+        results.shared_state.issues.append(
             f"Heavy global state usage ({global_patterns} patterns)"
         )
 
     # Check signals
     if signal_count == 0:
-        results.shared_state["score"] += 5
-        results.shared_state["good"].append("No Django signals found")
+        results.shared_state.score += 5
+        results.shared_state.good.append("No Django signals found")
     elif signal_count < 10:
-        results.shared_state["score"] += 3
-        results.shared_state["issues"].append(
+        results.shared_state.score += 3
+        results.shared_state.issues.append(
             f"Some Django signals ({signal_count} found) - document side effects"
         )
     else:
-        results.shared_state["issues"].append(
+        results.shared_state.issues.append(
             f"Heavy signal usage ({signal_count} signals) - may cause parallel issues"
         )
 
 
-def analyze_contracts() -> None:
+def analyze_contracts(counts: ScanCounts) -> None:
     """Analyze API contracts, type hints, and serializers."""
     # Check for OpenAPI/Swagger
     openapi_files = [
@@ -253,19 +599,19 @@ def analyze_contracts() -> None:
     has_openapi = any(file_exists(f) for f in openapi_files)
 
     if has_openapi:
-        results.contracts["score"] += 6
-        results.contracts["good"].append("OpenAPI/Swagger spec found")
+        results.contracts.score += 6
+        results.contracts.good.append("OpenAPI/Swagger spec found")
     else:
         # Check for drf-spectacular or similar
         for config_file in ["pyproject.toml", "setup.cfg", "settings.py", "settings/base.py"]:
-            if file_exists(config_file):
-                content = read_file_safe(Path(config_file))
+            content = read_config(config_file)
+            if content is not None:
                 if "spectacular" in content.lower() or "swagger" in content.lower():
-                    results.contracts["score"] += 4
-                    results.contracts["good"].append("OpenAPI generator configured")
+                    results.contracts.score += 4
+                    results.contracts.good.append("OpenAPI generator configured")
                     break
         else:
-            results.contracts["issues"].append("No OpenAPI spec or generator found")
+            results.contracts.issues.append("No OpenAPI spec or generator found")
 
     # Check for mypy configuration
     mypy_configs = ["mypy.ini", "pyproject.toml", "setup.cfg", ".mypy.ini"]
@@ -273,8 +619,8 @@ def analyze_contracts() -> None:
     is_strict = False
 
     for config_file in mypy_configs:
-        if file_exists(config_file):
-            content = read_file_safe(Path(config_file))
+        content = read_config(config_file)
+        if content is not None:
             if "[tool.mypy]" in content or "[mypy]" in content:
                 has_mypy = True
                 if "strict = true" in content.lower() or "strict=true" in content.lower():
@@ -282,105 +628,88 @@ def analyze_contracts() -> None:
                 break
 
     if has_mypy:
-        results.contracts["score"] += 6
-        results.contracts["good"].append("Mypy configured")
+        results.contracts.score += 6
+        results.contracts.good.append("Mypy configured")
         if is_strict:
-            results.contracts["score"] += 4
-            results.contracts["good"].append("Mypy strict mode enabled")
+            results.contracts.score += 4
+            results.contracts.good.append("Mypy strict mode enabled")
         else:
-            results.contracts["issues"].append("Mypy strict mode not enabled")
+            results.contracts.issues.append("Mypy strict mode not enabled")
     else:
-        results.contracts["issues"].append("No mypy configuration found")
+        results.contracts.issues.append("No mypy configuration found")
 
     # Check serializers for __all__ usage
-    python_files = find_python_files(APPS_DIR) or find_python_files(".")
-    bad_serializers = 0
-
-    for file_path in python_files:
-        if "serializer" in file_path.name.lower():
-            content = read_file_safe(file_path)
-            matches = re.findall(r'fields\s*=\s*["\']__all__["\']', content)
-            bad_serializers += len(matches)
+    bad_serializers = counts.bad_serializers
 
     if bad_serializers == 0:
-        results.contracts["score"] += 4
-        results.contracts["good"].append("No serializers using __all__")
+        results.contracts.score += 4
+        results.contracts.good.append("No serializers using __all__")
     else:
-        results.contracts["issues"].append(
+        results.contracts.issues.append(
             f"{bad_serializers} serializers using __all__ (use explicit fields)"
         )
 
 
-def analyze_tests() -> None:
+def analyze_tests(repo: RepoFiles, counts: ScanCounts) -> None:
     """Analyze test infrastructure and coverage."""
-    # Find test files
-    test_patterns = ["test_*.py", "*_test.py", "tests.py"]
-    test_files = []
-
-    for pattern in ["test_*.py", "*_test.py"]:
-        test_files.extend(Path(".").rglob(pattern))
-
-    # Filter out __pycache__ etc
-    test_files = [f for f in test_files if not any(ex in f.parts for ex in EXCLUDE_DIRS)]
-
-    if len(test_files) > 20:
-        results.tests["score"] = 10
-        results.tests["good"].append(f"Good test coverage ({len(test_files)} test files)")
-    elif len(test_files) > 5:
-        results.tests["score"] = 6
-        results.tests["issues"].append(f"Moderate test coverage ({len(test_files)} test files)")
-    elif len(test_files) > 0:
-        results.tests["score"] = 3
-        results.tests["issues"].append(f"Limited test coverage ({len(test_files)} test files)")
+    test_files = repo.test_files
+
+    if test_files > 20:
+        results.tests.score = 10
+        results.tests.good.append(f"Good test coverage ({test_files} test files)")
+    elif test_files > 5:
+        results.tests.score = 6
+        results.tests.issues.append(f"Moderate test coverage ({test_files} test files)")
+    elif test_files > 0:
+        results.tests.score = 3
+        results.tests.issues.append(f"Limited test coverage ({test_files} test files)")
     else:
-        results.tests["score"] = 0
-        results.tests["issues"].append("No test files found")
+        results.tests.score = 0
+        results.tests.issues.append("No test files found")
 
     # Check for pytest configuration
     pytest_configs = ["pytest.ini", "pyproject.toml", "setup.cfg", "conftest.py"]
     has_pytest = False
 
     for config_file in pytest_configs:
-        if file_exists(config_file):
-            content = read_file_safe(Path(config_file))
+        content = read_config(config_file)
+        if content is not None:
             if "pytest" in content.lower() or config_file == "conftest.py":
                 has_pytest = True
                 break
 
     if has_pytest:
-        results.tests["score"] += 3
-        results.tests["good"].append("Pytest configured")
+        results.tests.score += 3
+        results.tests.good.append("Pytest configured")
     else:
-        results.tests["issues"].append("No pytest configuration found")
+        results.tests.issues.append("No pytest configuration found")
 
-    # Check for factories
-    factory_count = 0
-    for file_path in Path(".").rglob("*.py"):
-        if not any(ex in file_path.parts for ex in EXCLUDE_DIRS):
-            content = read_file_safe(file_path)
-            if "factory.Factory" in content or "DjangoModelFactory" in content:
-                factory_count += 1
+    # Check for factories; files under the source scan were checked there
+    factory_count = counts.factory_files
+    for file_path in repo.unscanned_files:
+        if is_factory_source(read_source_bytes(Path(file_path))):
+            factory_count += 1
 
     if factory_count > 0:
-        results.tests["score"] += 2
-        results.tests["good"].append(f"Factory Boy factories found ({factory_count} files)")
+        results.tests.score += 2
+        results.tests.good.append(f"Factory Boy factories found ({factory_count} files)")
     else:
-        results.tests["issues"].append("No Factory Boy factories found (recommended)")
+        results.tests.issues.append("No Factory Boy factories found (recommended)")
 
 
 def analyze_documentation() -> None:
     """Analyze documentation and conventions."""
     # Check for CLAUDE.md
     if file_exists("CLAUDE.md"):
-        results.documentation["score"] += 8
-        results.documentation["good"].append("CLAUDE.md exists")
+        results.documentation.score += 8
+        results.documentation.good.append("CLAUDE.md exists")
     else:
-        results.documentation["issues"].append("CLAUDE.md missing")
+        results.documentation.issues.append("CLAUDE.md missing")
 
     # Check for README
     if file_exists("README.md") or file_exists("README.rst"):
-        results.documentation["score"] += 2
-        results.documentation["good"].append("README exists")
+        results.documentation.score += 2
+        results.documentation.good.append("README exists")
 
     # Check for ruff/linting config
     linting_configs = [
@@ -393,68 +722,63 @@ def analyze_documentation() -> None:
 
     has_linting = False
     for config_file, marker in linting_configs:
-        if file_exists(config_file):
-            if not marker:
-                has_linting = True
-                break
-            content = read_file_safe(Path(config_file))
+        content = read_config(config_file)
+        if content is not None:
             if marker in content:
                 has_linting = True
                 break
 
     if has_linting:
-        results.documentation["score"] += 3
-        results.documentation["good"].append("Linting configured (ruff/flake8)")
+        results.documentation.score += 3
+        results.documentation.good.append("Linting configured (ruff/flake8)")
     else:
-        results.documentation["issues"].append("No linting configuration found")
+        results.documentation.issues.append("No linting configuration found")
 
     # Check for .claude directory
     if file_exists(".claude"):
-        results.documentation["score"] += 2
-        results.documentation["good"].append(".claude/ directory exists")
+        results.documentation.score += 2
+        results.documentation.good.append(".claude/ directory exists")
 
 
-def analyze_dependencies() -> None:
+def analyze_dependencies(repo: RepoFiles) -> None:
     """Analyze dependency management."""
     # Check for lock files or pinned requirements
     if file_exists("poetry.lock"):
-        results.dependencies["score"] += 5
-        results.dependencies["good"].append("Poetry lock file present")
+        results.dependencies.score += 5
+        results.dependencies.good.append("Poetry lock file present")
     elif file_exists("Pipfile.lock"):
-        results.dependencies["score"] += 5
-        results.dependencies["good"].append("Pipfile.lock present")
-    elif file_exists("requirements.txt"):
-        content = read_file_safe(Path("requirements.txt"))
-        pinned = len(re.findall(r"==\d", content))
+        results.dependencies.score += 5
+        results.dependencies.good.append("Pipfile.lock present")
+    elif (content := read_config("requirements.txt")) is not None:
+        pinned = count_matches(PINNED_RE, content)
         total = len([line for line in content.split("\n") if line.strip() and not line.startswith("#")])
 
         if total > 0 and pinned / total > 0.8:
-            results.dependencies["score"] += 4
-            results.dependencies["good"].append("Most dependencies pinned in requirements.txt")
+            results.dependencies.score += 4
+            results.dependencies.good.append("Most dependencies pinned in requirements.txt")
         elif pinned > 0:
-            results.dependencies["score"] += 2
-            results.dependencies["issues"].append("Some dependencies not pinned")
+            results.dependencies.score += 2
+            results.dependencies.issues.append("Some dependencies not pinned")
         else:
-            results.dependencies["issues"].append("Dependencies not pinned in requirements.txt")
+            results.dependencies.issues.append("Dependencies not pinned in requirements.txt")
     else:
-        results.dependencies["issues"].append("No dependency lock file found")
+        results.dependencies.issues.append("No dependency lock file found")
 
     # Check for pyproject.toml
-    if file_exists("pyproject.toml"):
-        results.dependencies["score"] += 3
-        results.dependencies["good"].append("pyproject.toml present")
+    if read_config("pyproject.toml") is not None:
+        results.dependencies.score += 3
+        results.dependencies.good.append("pyproject.toml present")
 
     # Check migrations health
-    migration_count = len(list(Path(".").rglob("*/migrations/*.py")))
-    migration_count -= len(list(Path(".").rglob("*/migrations/__init__.py")))
+    migration_count = repo.migrations
 
     if migration_count > 100:
-        results.dependencies["issues"].append(
+        results.dependencies.issues.append(
             f"Many migrations ({migration_count}) - consider squashing before parallel work"
         )
     elif migration_count > 0:
-        results.dependencies["score"] += 2
-        results.dependencies["good"].append(f"Manageable migration count ({migration_count})")
+        results.dependencies.score += 2
+        results.dependencies.good.append(f"Manageable migration count ({migration_count})")
 
 
 def generate_report() -> str:
@@ -468,11 +792,19 @@ def generate_report() -> str:
         "Dependencies": results.dependencies,
     }
 
-    total_score = sum(d["score"] for d in dimensions.values())
-    max_score = sum(d["max"] for d in dimensions.values())
+    # One row per dimension, with its ratio computed once for every section
+    rows = [
+        (name, d.score, d.max, d.score / d.max if d.max > 0 else 0.0, d.issues, d.good)
+        for name, d in dimensions.items()
+    ]
+
+    total_score = sum(row[1] for row in rows)
+    max_score = sum(row[2] for row in rows)
     percentage = round(total_score / max_score * 100) if max_score > 0 else 0
 
-    report = f"""# Django Parallelization Readiness Report
+    # Sections are collected and joined once rather than grown with +=
+    parts: list[str] = []
+    parts.append(f"""# Django Parallelization Readiness Report
 
 ## Overall Score: {total_score}/{max_score} ({percentage}%)
 
@@ -480,83 +812,72 @@ def generate_report() -> str:
 
 | Dimension | Score | Status |
 |-----------|-------|--------|
-"""
+""")
 
-    for name, data in dimensions.items():
-        pct = data["score"] / data["max"] if data["max"] > 0 else 0
+    # Blockers score < 50%, risks 50-80%; both sections are filled in this pass
+    blockers: list[str] = []
+    risks: list[str] = []
+    good_items: list[str] = []
+    for name, score, max_points, pct, issues, good in rows:
         if pct >= 0.8:
             status = "✅"
         elif pct >= 0.5:
             status = "⚠️"
+            risks.extend(f"- **{name}**: {issue}" for issue in issues)
         else:
             status = "❌"
-        report += f"| {name} | {data['score']}/{data['max']} | {status} |\n"
-
-    # Blockers (score < 50%)
-    report += "\n## Blockers (Must Fix)\n\n"
-    blockers = []
-    for name, data in dimensions.items():
-        if data["score"] / data["max"] < 0.5 if data["max"] > 0 else True:
-            for issue in data["issues"]:
-                blockers.append(f"- **{name}**: {issue}")
+            blockers.extend(f"- **{name}**: {issue}" for issue in issues)
+        parts.append(f"| {name} | {score}/{max_points} | {status} |\n")
+        good_items.extend(f"- ✅ {item}\n" for item in good)
 
+    parts.append("\n## Blockers (Must Fix)\n\n")
     if blockers:
-        report += "\n".join(blockers) + "\n"
+        parts.append("\n".join(blockers) + "\n")
     else:
-        report += "_No critical blockers found._\n"
-
-    # Risks (50-80%)
-    report += "\n## Risks (Should Fix)\n\n"
-    risks = []
-    for name, data in dimensions.items():
-        pct = data["score"] / data["max"] if data["max"] > 0 else 0
-        if 0.5 <= pct < 0.8:
-            for issue in data["issues"]:
-                risks.append(f"- **{name}**: {issue}")
+        parts.append("_No critical blockers found._\n")
 
+    parts.append("\n## Risks (Should Fix)\n\n")
     if risks:
-        report += "\n".join(risks) + "\n"
+        parts.append("\n".join(risks) + "\n")
     else:
-        report += "_No significant risks identified._\n"
+        parts.append("_No significant risks identified._\n")
 
     # What's working well
-    report += "\n## What's Working Well\n\n"
-    for name, data in dimensions.items():
-        for good in data["good"]:
-            report += f"- ✅ {good}\n"
+    parts.append("\n## What's Working Well\n\n")
+    parts.extend(good_items)
 
     # Recommendations
-    report += "\n## Recommendations\n\n"
+    parts.append("\n## Recommendations\n\n")
 
     if percentage < 50:
-        report += """### Priority Actions (Score < 50%)
+        parts.append("""### Priority Actions (Score < 50%)
 
 1. **Create CLAUDE.md** with project conventions
 2. **Add type hints** to public APIs and run mypy
 3. **Set up pytest** with Factory Boy
 4. **Configure ruff** for consistent code style
 5. **Document API contracts** with OpenAPI
-"""
+""")
     elif percentage < 80:
-        report += """### Improvement Actions (Score 50-80%)
+        parts.append("""### Improvement Actions (Score 50-80%)
 
 1. **Enable mypy strict mode** for better type safety
 2. **Convert signals to explicit service calls** where possible
 3. **Use explicit serializer fields** (no `__all__`)
 4. **Increase test coverage** in critical paths
 5. **Set up .claude/ directory** for orchestration
-"""
+""")
     else:
-        report += """### Ready for Parallel Development (Score ≥ 80%)
+        parts.append("""### Ready for Parallel Development (Score ≥ 80%)
 
 1. **Create task specs** in `.claude/tasks/`
 2. **Define interface contracts** in `.claude/contracts/`
 3. **Plan parallel work boundaries** by app
 4. **Set up git worktrees** for isolated development
-"""
+""")
 
     # Parallelization potential
-    report += f"""
+    parts.append(f"""
 ## Parallelization Potential
 
 Based on the analysis:
@@ -570,9 +891,9 @@ Based on the analysis:
 2. Squash migrations if count > 50 per app
 3. Document cross-app dependencies in contracts
 4. Set up integration test suite
-"""
+""")
 
-    return report
+    return "".join(parts)
 
 
 def estimate_parallel_tracks(score_pct: int) -> str:
@@ -589,14 +910,37 @@ def estimate_parallel_tracks(score_pct: int) -> str:
 
 def main() -> None:
     """Run the analysis and generate report."""
+    global APPS_DIR
+
+    parser = argparse.ArgumentParser(description="Analyze a Django codebase for parallelization readiness")
+    parser.add_argument("apps_dir", nargs="?", default=APPS_DIR, help="Directory containing Django apps (default: apps)")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Worker processes for file scanning (default: CPU count, 1 disables)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help=f"Rescan every file, ignoring {SCAN_CACHE_FILE}")
+    parser.add_argument(
+        "--quick", action="store_true",
+        help="Stop counting patterns once they can no longer change the score (counts become lower bounds)",
+    )
+    args = parser.parse_args()
+    APPS_DIR = args.apps_dir
+
     print("🔍 Analyzing Django codebase for parallelization readiness...\n")
 
-    analyze_app_boundaries()
-    analyze_shared_state()
-    analyze_contracts()
-    analyze_tests()
+    cache = None if args.no_cache else load_scan_cache()
+    source_files = find_source_files()
+    counts = scan_source_files(source_files, args.jobs, cache, args.quick)
+    if args.quick and saturated_fields(counts):
+        print("⚡ Quick scan: counts that reached their scoring thresholds are lower bounds\n")
+    repo = walk_repo(source_files)
+
+    analyze_app_boundaries(counts)
+    analyze_shared_state(counts)
+    analyze_contracts(counts)
+    analyze_tests(repo, counts)
     analyze_documentation()
-    analyze_dependencies()
+    analyze_dependencies(repo)
 
     report = generate_report()
 
@@ -610,6 +954,10 @@ def main() -> None:
     report_path = claude_dir / "readiness-report.md"
     report_path.write_text(report, encoding="utf-8")
 
+    # Written last: creating .claude/ earlier would change the documentation score
+    if cache is not None:
+        save_scan_cache(cache)
+
     print(f"\n📄 Report saved to {report_path}")
 
 
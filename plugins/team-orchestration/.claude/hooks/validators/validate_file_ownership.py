@@ -35,24 +35,36 @@ Frontmatter example:
 """
 
 import argparse
+import hashlib
 import json
 import logging
+import logging.handlers
+import os
 import re
-import subprocess
 import sys
 import time
+from collections import defaultdict
 from pathlib import Path
-from typing import Optional, Dict, List, Set, Tuple
+from typing import Iterator, NamedTuple, Optional, Dict, List, Set, Tuple
 
 # Logging setup - log file next to this script
 SCRIPT_DIR = Path(__file__).parent
 LOG_FILE = SCRIPT_DIR / "validate_file_ownership.log"
-
+CACHE_FILE = SCRIPT_DIR / "validate_file_ownership.cache"
+
+# Records are buffered in memory and written in one go at exit (or right away on ERROR)
+_log_file_handler = logging.FileHandler(LOG_FILE, mode='a', delay=True)
+_log_file_handler.setFormatter(logging.Formatter(
+    "%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+))
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[logging.FileHandler(LOG_FILE, mode='a')]
+    handlers=[logging.handlers.MemoryHandler(
+        capacity=100,
+        flushLevel=logging.ERROR,
+        target=_log_file_handler
+    )]
 )
 logger = logging.getLogger(__name__)
 
@@ -61,6 +73,30 @@ DEFAULT_DIRECTORY = "specs"
 DEFAULT_EXTENSION = ".md"
 DEFAULT_MAX_AGE_MINUTES = 5
 
+# File Ownership Matrix section: body runs to the next ## heading or end of file
+MATRIX_HEADING = '## File Ownership Matrix'
+
+# Task section parsing: anchored per-line patterns, no DOTALL scanning
+TASK_ID_RE = re.compile(r'\*\*Task ID:\*\* (task-\d+)')
+WAVE_RE = re.compile(r'\*\*Wave:\*\* (\d+|W\d+)')
+# Plain-text markers checked before running the regexes above on a line
+TASK_ID_MARKER = '**Task ID:**'
+WAVE_MARKER = '**Wave:**'
+OWNERSHIP_MARKER = '**File Ownership:**'
+OWNERSHIP_PREFIXES = (('- CREATE:', 'create'), ('- MODIFY:', 'modify'), ('- BOUNDARY:', 'boundary'))
+
+# File Ownership section states within a task
+OUTSIDE_OWNERSHIP, IN_OWNERSHIP, AFTER_OWNERSHIP = range(3)
+
+
+class TaskOwnership(NamedTuple):
+    """Wave and file ownership lists parsed from one task section."""
+
+    wave: int
+    create: List[str]
+    modify: List[str]
+    boundary: List[str]
+
 # Error messages
 NO_FILE_ERROR = (
     "VALIDATION FAILED: No plan file found matching {pattern}.\n\n"
@@ -78,6 +114,9 @@ OWNERSHIP_CONFLICT_ERROR = (
 
 def get_git_untracked_files(directory: str, extension: str) -> List[str]:
     """Get list of untracked files in directory from git."""
+    # Only needed when no recent plan file exists; keep it off the hot import path
+    import subprocess
+
     try:
         result = subprocess.run(
             ["git", "status", "--porcelain", f"{directory}/"],
@@ -106,64 +145,48 @@ def get_git_untracked_files(directory: str, extension: str) -> List[str]:
         return []
 
 
-def get_recent_files(directory: str, extension: str, max_age_minutes: int) -> List[str]:
-    """Get list of files in directory modified within the last N minutes."""
-    target_dir = Path(directory)
-    if not target_dir.exists():
-        return []
-
-    recent = []
-    now = time.time()
-    max_age_seconds = max_age_minutes * 60
-
-    ext = extension if extension.startswith('.') else f'.{extension}'
-    pattern = f"*{ext}"
-
-    for filepath in target_dir.glob(pattern):
-        try:
-            mtime = filepath.stat().st_mtime
-            age = now - mtime
-            if age <= max_age_seconds:
-                recent.append(str(filepath))
-        except OSError:
-            continue
-
-    return recent
-
-
 def find_newest_file(directory: str, extension: str, max_age_minutes: int) -> Optional[str]:
     """
     Find the most recently created/modified file in directory.
 
+    One scandir pass finds the newest recent file, which is then compared
+    against git untracked files (including those in subdirectories).
+
     Returns:
         Path to the newest file, or None if no recent files found.
     """
-    # Check git for untracked/new files
-    git_new = get_git_untracked_files(directory, extension)
-
-    # Check for recently modified files
-    recent_files = get_recent_files(directory, extension, max_age_minutes)
+    ext = extension if extension.startswith('.') else f'.{extension}'
+    cutoff = time.time() - max_age_minutes * 60
 
-    # Combine and deduplicate
-    all_files = list(set(git_new + recent_files))
+    newest_name = None
+    newest_mtime = 0.0
 
-    if not all_files:
-        return None
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(ext) or not entry.is_file():
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if mtime >= cutoff and mtime > newest_mtime:
+                    newest_mtime = mtime
+                    newest_name = entry.name
+    except OSError:
+        pass
 
-    # Find the newest file by modification time
-    newest = None
-    newest_mtime = 0
+    newest = None if newest_name is None else str(Path(directory) / newest_name)
 
-    for filepath in all_files:
+    # Merge in git untracked files, which may be older or in subdirectories
+    for filepath in get_git_untracked_files(directory, extension):
         try:
-            path = Path(filepath)
-            if path.exists():
-                mtime = path.stat().st_mtime
-                if mtime > newest_mtime:
-                    newest_mtime = mtime
-                    newest = str(path)
+            mtime = Path(filepath).stat().st_mtime
         except OSError:
             continue
+        if mtime > newest_mtime:
+            newest_mtime = mtime
+            newest = str(Path(filepath))
 
     return newest
 
@@ -176,96 +199,156 @@ def parse_file_ownership_matrix(content: str) -> List[Dict[str, str]]:
     """
     matrix = []
 
-    # Find the File Ownership Matrix section
-    matrix_pattern = r'## File Ownership Matrix\s*\n\n(.*?)(?:\n##|\Z)'
-    match = re.search(matrix_pattern, content, re.DOTALL)
-    if not match:
-        logger.warning("No File Ownership Matrix found in plan")
-        return matrix
-
-    matrix_section = match.group(1)
+    # Find the File Ownership Matrix heading line
+    if content.startswith(MATRIX_HEADING):
+        start = 0
+    else:
+        start = content.find('\n' + MATRIX_HEADING)
+        if start == -1:
+            logger.warning("No File Ownership Matrix found in plan")
+            return matrix
+        start += 1
+
+    # Section body: from the line after the heading to the next ## heading
+    body_start = content.find('\n', start)
+    if body_start == -1:
+        body_start = len(content)
+    body_end = content.find('\n##', body_start)
+    if body_end == -1:
+        body_end = len(content)
 
     # Parse table rows (skip header and separator)
-    lines = matrix_section.strip().split('\n')
+    lines = content[body_start:body_end].strip().split('\n')
     for line in lines[2:]:  # Skip header and separator
         if not line.strip() or line.startswith('**'):
             continue
 
-        # Parse table columns
-        parts = [p.strip() for p in line.split('|')[1:-1]]  # Skip empty first/last
-        if len(parts) >= 5:
-            matrix.append({
-                'file': parts[0],
-                'create': parts[1],
-                'modify_scope': parts[2],
-                'task_id': parts[3],
-                'wave': parts[4]
-            })
+        # Locate the pipes around the first five columns; later columns are ignored
+        pipes = [line.find('|')]
+        while len(pipes) < 6 and pipes[-1] != -1:
+            pipes.append(line.find('|', pipes[-1] + 1))
+        if pipes[-1] == -1:
+            continue
+
+        parts = [line[pipes[k] + 1:pipes[k + 1]].strip() for k in range(5)]
+        matrix.append({
+            'file': parts[0],
+            'create': parts[1],
+            'modify_scope': parts[2],
+            'task_id': parts[3],
+            'wave': parts[4]
+        })
 
     logger.info(f"Parsed {len(matrix)} entries from File Ownership Matrix")
     return matrix
 
 
-def parse_task_metadata(content: str) -> Dict[str, Dict[str, any]]:
+def _iter_task_blocks(lines: List[str]) -> Iterator[List[str]]:
+    """Yield the lines of each ###/#### section, heading line included."""
+    block = None
+    for line in lines:
+        if line.startswith('###'):
+            if block is not None:
+                yield block
+            block = [line]
+        elif block is not None:
+            block.append(line)
+    if block is not None:
+        yield block
+
+
+def _split_file_list(text: str) -> List[str]:
+    """Split a comma-separated ownership value; '-' or empty means none."""
+    text = text.strip()
+    if not text or text == '-':
+        return []
+    return [f.strip() for f in text.split(',') if f.strip()]
+
+
+def _parse_task_block(block: List[str]) -> Optional[Tuple[str, TaskOwnership]]:
     """
-    Parse task sections to extract Wave numbers and file ownership.
+    Parse one task section line by line.
 
-    Returns dict mapping task_id -> {wave, create, modify, boundary}
+    Returns (task_id, TaskOwnership), or None when the
+    section has no Task ID followed by a Wave.
     """
-    tasks = {}
+    task_id = None
+    wave_str = None
+    values: Dict[str, List[str]] = {}
+    current = None  # ownership key whose value is being continued
+    ownership = OUTSIDE_OWNERSHIP
+
+    for line in block:
+        if task_id is None and line.startswith(TASK_ID_MARKER):
+            match = TASK_ID_RE.match(line)
+            if match:
+                task_id = match.group(1)
+        if task_id is not None and wave_str is None and WAVE_MARKER in line:
+            match = WAVE_RE.search(line)
+            if match:
+                wave_str = match.group(1)
+
+        if ownership == OUTSIDE_OWNERSHIP:
+            idx = line.find(OWNERSHIP_MARKER)
+            if idx == -1:
+                continue
+            ownership = IN_OWNERSHIP
+            line = line[idx + len(OWNERSHIP_MARKER):]
+        elif ownership == IN_OWNERSHIP:
+            # Only the first File Ownership section counts; the next **Field** ends it
+            if line.startswith('**') and line[2:3].isupper():
+                ownership = AFTER_OWNERSHIP
+                continue
+        elif wave_str is not None:
+            break  # ID, wave and ownership all read; the rest of the section is prose
+        else:
+            continue
 
-    # Find all task sections
-    # Pattern: #### or ### followed by Task ID
-    task_pattern = r'###[#]?\s+.*?\n\*\*Task ID:\*\* (task-\d+).*?\*\*Wave:\*\* (\d+|W\d+).*?(?=###[#]?|\Z)'
-    matches = re.finditer(task_pattern, content, re.DOTALL)
-
-    for match in matches:
-        task_id = match.group(1)
-        wave_str = match.group(2).replace('W', '')  # Handle both "1" and "W1"
-        task_content = match.group(0)
-
-        # Extract File Ownership section
-        create_files = []
-        modify_files = []
-        boundary_files = []
-
-        ownership_pattern = r'\*\*File Ownership:\*\*(.*?)(?=\n\*\*[A-Z]|\Z)'
-        ownership_match = re.search(ownership_pattern, task_content, re.DOTALL)
-        if ownership_match:
-            ownership_text = ownership_match.group(1)
-
-            # Parse CREATE
-            create_match = re.search(r'- CREATE:\s*(.*?)(?=\n\s*-|\Z)', ownership_text, re.DOTALL)
-            if create_match:
-                create_text = create_match.group(1).strip()
-                if create_text and create_text != '-':
-                    create_files = [f.strip() for f in create_text.split(',') if f.strip()]
-
-            # Parse MODIFY
-            modify_match = re.search(r'- MODIFY:\s*(.*?)(?=\n\s*-|\Z)', ownership_text, re.DOTALL)
-            if modify_match:
-                modify_text = modify_match.group(1).strip()
-                if modify_text and modify_text != '-':
-                    modify_files = [f.strip() for f in modify_text.split(',') if f.strip()]
-
-            # Parse BOUNDARY
-            boundary_match = re.search(r'- BOUNDARY:\s*(.*?)(?=\n\s*-|\n\*\*|\Z)', ownership_text, re.DOTALL)
-            if boundary_match:
-                boundary_text = boundary_match.group(1).strip()
-                if boundary_text and boundary_text != '-':
-                    boundary_files = [f.strip() for f in boundary_text.split(',') if f.strip()]
+        stripped = line.strip()
+        for prefix, key in OWNERSHIP_PREFIXES:
+            if stripped.startswith(prefix):
+                current = key if key not in values else None
+                if current is not None:
+                    values[key] = [stripped[len(prefix):]]
+                break
+        else:
+            if stripped.startswith(('-', '**')):
+                current = None
+            elif current is not None:
+                values[current].append(stripped)
 
-        try:
-            wave = int(wave_str)
-        except ValueError:
-            wave = 0
+    if task_id is None or wave_str is None:
+        return None
+
+    try:
+        wave = int(wave_str.replace('W', ''))  # Handle both "1" and "W1"
+    except ValueError:
+        wave = 0
+
+    return task_id, TaskOwnership(
+        wave=wave,
+        create=_split_file_list('\n'.join(values.get('create', []))),
+        modify=_split_file_list('\n'.join(values.get('modify', []))),
+        boundary=_split_file_list('\n'.join(values.get('boundary', []))),
+    )
+
+
+def parse_task_metadata(content: str) -> Dict[str, TaskOwnership]:
+    """
+    Parse task sections to extract Wave numbers and file ownership.
+
+    Single pass over the lines: each ###/#### heading starts a section, and
+    values continue onto following lines until the next "-" item.
 
-        tasks[task_id] = {
-            'wave': wave,
-            'create': create_files,
-            'modify': modify_files,
-            'boundary': boundary_files
-        }
+    Returns dict mapping task_id -> TaskOwnership
+    """
+    tasks = {}
+
+    for block in _iter_task_blocks(content.splitlines()):
+        parsed = _parse_task_block(block)
+        if parsed is not None:
+            task_id, task = parsed
+            tasks[task_id] = task
 
     logger.info(f"Parsed {len(tasks)} tasks from plan")
     return tasks
@@ -281,10 +364,8 @@ def parse_scope(file_str: str) -> Tuple[str, Optional[str]]:
         "file.py::ClassName" -> ("file.py", "ClassName")
         "file.py::ClassName.method" -> ("file.py", "ClassName.method")
     """
-    if '::' in file_str:
-        parts = file_str.split('::', 1)
-        return parts[0].strip(), parts[1].strip()
-    return file_str.strip(), None
+    filename, sep, scope = file_str.partition('::')
+    return filename.strip(), (scope.strip() if sep else None)
 
 
 def scopes_overlap(scope1: Optional[str], scope2: Optional[str]) -> bool:
@@ -310,7 +391,47 @@ def scopes_overlap(scope1: Optional[str], scope2: Optional[str]) -> bool:
     return False
 
 
-def validate_ownership_rules(tasks: Dict[str, Dict[str, any]]) -> Tuple[bool, List[str]]:
+def _overlapping_pairs(modifiers: List[Tuple[str, Optional[str]]]) -> List[Tuple[int, int]]:
+    """
+    Find every pair of (task_id, scope) modifiers whose scopes overlap.
+
+    Unscoped entries overlap everything. Scoped entries are sorted by their
+    dotted parts so each scope directly follows its ancestors, and a stack of
+    the current ancestor chain yields the nested pairs without comparing
+    unrelated scopes.
+
+    Returns sorted (i, j) index pairs with i < j, matching pairwise order.
+    """
+    pairs = []
+    unscoped = set()
+    scoped = []
+    for i, (_, scope) in enumerate(modifiers):
+        if scope is None:
+            unscoped.add(i)
+        else:
+            scoped.append(i)
+
+    for i in unscoped:
+        for j in range(len(modifiers)):
+            if j != i and not (j in unscoped and j < i):
+                pairs.append((min(i, j), max(i, j)))
+
+    scoped.sort(key=lambda i: modifiers[i][1].split('.'))
+    # (index, scope, scope + '.') for each scope containing the current one; this
+    # is the root-to-node path a trie over the dotted parts would walk
+    chain = []
+    for i in scoped:
+        scope = modifiers[i][1]
+        while chain and not (scope == chain[-1][1] or scope.startswith(chain[-1][2])):
+            chain.pop()
+        pairs.extend((min(i, j), max(i, j)) for j, _, _ in chain)
+        chain.append((i, scope, scope + '.'))
+
+    pairs.sort()
+    return pairs
+
+
+def validate_ownership_rules(tasks: Dict[str, TaskOwnership]) -> Tuple[bool, List[str]]:
     """
     Validate the four ownership rules.
 
@@ -318,41 +439,46 @@ def validate_ownership_rules(tasks: Dict[str, Dict[str, any]]) -> Tuple[bool, Li
     """
     conflicts = []
 
-    # Rule 1: Each file appears in CREATE for at most ONE task (across all waves)
-    create_map = {}  # file -> list of task_ids that CREATE it
+    # One pass over the tasks: parse every file::scope entry once, collect
+    # CREATE owners and wave membership, and check Rule 4 while the task's
+    # MODIFY filenames are at hand
+    create_map = defaultdict(list)  # file -> list of task_ids that CREATE it
+    waves = defaultdict(list)  # wave -> list of task_ids
+    modify_scopes = {}  # task_id -> list of (filename, scope) it MODIFYs
+    boundary_conflicts = []
     for task_id, task_data in tasks.items():
-        for file in task_data['create']:
-            filename, _ = parse_scope(file)
-            if filename not in create_map:
-                create_map[filename] = []
+        for filename in dict.fromkeys(parse_scope(f)[0] for f in task_data.create):
             create_map[filename].append(task_id)
 
+        waves[task_data.wave].append(task_id)
+
+        modify_scopes[task_id] = [parse_scope(f) for f in task_data.modify]
+
+        # Rule 4: No task modifies files in its BOUNDARY list
+        if task_data.boundary:
+            boundary_files = {parse_scope(f)[0] for f in task_data.boundary}
+            violations = {filename for filename, _ in modify_scopes[task_id]} & boundary_files
+            if violations:
+                boundary_conflicts.append(
+                    f"Rule 4 violation: Task {task_id} modifies files in its BOUNDARY: {', '.join(violations)}"
+                )
+
+    # Rule 1: Each file appears in CREATE for at most ONE task (across all waves)
     for file, task_ids in create_map.items():
         if len(task_ids) > 1:
             conflicts.append(
                 f"Rule 1 violation: File '{file}' is CREATEd by multiple tasks: {', '.join(task_ids)}"
             )
 
-    # Group tasks by wave for Rules 2 and 3
-    waves = {}  # wave -> list of task_ids
-    for task_id, task_data in tasks.items():
-        wave = task_data['wave']
-        if wave not in waves:
-            waves[wave] = []
-        waves[wave].append(task_id)
-
     # Rules 2 & 3: Check parallel tasks (same wave) for MODIFY conflicts
     for wave, task_ids in waves.items():
         if len(task_ids) < 2:
             continue  # No conflicts possible with single task
 
         # Build modify map for this wave: file -> list of (task_id, scope)
-        modify_map = {}
+        modify_map = defaultdict(list)
         for task_id in task_ids:
-            for file_str in tasks[task_id]['modify']:
-                filename, scope = parse_scope(file_str)
-                if filename not in modify_map:
-                    modify_map[filename] = []
+            for filename, scope in modify_scopes[task_id]:
                 modify_map[filename].append((task_id, scope))
 
         # Check for conflicts
@@ -360,35 +486,62 @@ def validate_ownership_rules(tasks: Dict[str, Dict[str, any]]) -> Tuple[bool, Li
             if len(modifiers) < 2:
                 continue
 
-            # Check all pairs for scope overlap
-            for i in range(len(modifiers)):
-                for j in range(i + 1, len(modifiers)):
-                    task1, scope1 = modifiers[i]
-                    task2, scope2 = modifiers[j]
-
-                    if scopes_overlap(scope1, scope2):
-                        scope1_str = f"::{scope1}" if scope1 else " (unscoped)"
-                        scope2_str = f"::{scope2}" if scope2 else " (unscoped)"
-                        conflicts.append(
-                            f"Rule 2/3 violation: Tasks {task1} and {task2} in Wave {wave} "
-                            f"both MODIFY '{filename}' with overlapping scopes: "
-                            f"{scope1_str} vs {scope2_str}"
-                        )
-
-    # Rule 4: No task modifies files in its BOUNDARY list
-    for task_id, task_data in tasks.items():
-        modify_files = {parse_scope(f)[0] for f in task_data['modify']}
-        boundary_files = {parse_scope(f)[0] for f in task_data['boundary']}
+            for i, j in _overlapping_pairs(modifiers):
+                task1, scope1 = modifiers[i]
+                task2, scope2 = modifiers[j]
+                scope1_str = f"::{scope1}" if scope1 else " (unscoped)"
+                scope2_str = f"::{scope2}" if scope2 else " (unscoped)"
+                conflicts.append(
+                    f"Rule 2/3 violation: Tasks {task1} and {task2} in Wave {wave} "
+                    f"both MODIFY '{filename}' with overlapping scopes: "
+                    f"{scope1_str} vs {scope2_str}"
+                )
 
-        violations = modify_files & boundary_files
-        if violations:
-            conflicts.append(
-                f"Rule 4 violation: Task {task_id} modifies files in its BOUNDARY: {', '.join(violations)}"
-            )
+    conflicts.extend(boundary_conflicts)
 
     return len(conflicts) == 0, conflicts
 
 
+def load_result_cache() -> Dict[str, list]:
+    """
+    Load cached validation results, keyed by absolute plan file path.
+
+    Each entry is [mtime_ns, size, digest, success, message]; a missing or
+    corrupt cache file just means every plan gets validated again.
+    """
+    try:
+        cache = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def task_sections_digest(data: bytes) -> str:
+    """
+    Hash the part of a plan that task parsing reads.
+
+    Everything before the first ### heading (title, overview, matrix) is
+    ignored by parse_task_metadata, so edits there keep the same digest.
+    Works on the raw bytes so an unchanged plan is never decoded.
+    """
+    if data.startswith(b'###'):
+        region = data
+    else:
+        start = data.find(b'\n###')
+        region = data[start + 1:] if start != -1 else b''
+    return hashlib.blake2b(region, digest_size=16).hexdigest()
+
+
+def save_result_cache(cache: Dict[str, list]) -> None:
+    """Write the result cache atomically so concurrent hooks never see a partial file."""
+    tmp_file = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.tmp")
+    try:
+        tmp_file.write_text(json.dumps(cache), encoding='utf-8')
+        os.replace(tmp_file, CACHE_FILE)
+    except OSError as e:
+        logger.warning(f"Could not write result cache {CACHE_FILE}: {e}")
+
+
 def validate_file_ownership(
     directory: str,
     extension: str,
@@ -413,15 +566,57 @@ def validate_file_ownership(
 
     logger.info(f"Found newest file: {newest_file}")
 
-    # Step 2: Read and parse the plan file
+    # Step 2: Reuse the previous result if the plan file is unchanged
     try:
-        content = Path(newest_file).read_text(encoding='utf-8')
-    except (OSError, UnicodeDecodeError) as e:
+        st = os.stat(newest_file)
+    except OSError as e:
         msg = f"Failed to read plan file {newest_file}: {e}"
         logger.error(msg)
         return False, msg
 
-    # Step 3: Parse ownership data
+    cache = load_result_cache()
+    cache_key = os.path.abspath(newest_file)
+    stamp = [st.st_mtime_ns, st.st_size]
+    entry = cache.get(cache_key)
+    if not isinstance(entry, list) or len(entry) != 5:
+        entry = None
+    if entry and entry[:2] == stamp:
+        logger.info(f"Cache hit for {newest_file}: {'PASS' if entry[3] else 'FAIL'}")
+        return entry[3], entry[4]
+
+    # Step 3: Read the plan file; it is only decoded if it has to be parsed
+    try:
+        data = Path(newest_file).read_bytes()
+    except OSError as e:
+        msg = f"Failed to read plan file {newest_file}: {e}"
+        logger.error(msg)
+        return False, msg
+
+    # Step 4: Reuse the result if only text outside the task sections changed
+    digest = task_sections_digest(data)
+    if entry and entry[2] == digest:
+        success, msg = entry[3], entry[4]
+        logger.info(f"Task sections unchanged in {newest_file}: {'PASS' if success else 'FAIL'}")
+    else:
+        try:
+            content = data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            msg = f"Failed to read plan file {newest_file}: {e}"
+            logger.error(msg)
+            return False, msg
+        success, msg = validate_plan_content(newest_file, content)
+    cache[cache_key] = stamp + [digest, success, msg]
+    save_result_cache(cache)
+    return success, msg
+
+
+def validate_plan_content(newest_file: str, content: str) -> Tuple[bool, str]:
+    """
+    Parse a plan file's content and check its ownership rules.
+
+    Returns:
+        tuple: (success: bool, message: str)
+    """
     tasks = parse_task_metadata(content)
 
     if not tasks:
@@ -429,7 +624,6 @@ def validate_file_ownership(
         logger.info(f"PASS: {msg}")
         return True, msg
 
-    # Step 4: Validate ownership rules
     success, conflicts = validate_ownership_rules(tasks)
 
     if success:
@@ -482,11 +676,11 @@ def main():
         logger.info(f"Args: directory={args.directory}, extension={args.extension}, max_age={args.max_age}")
 
         # Read hook input from stdin (if provided)
+        raw_input = sys.stdin.buffer.read()
         try:
-            input_data = json.load(sys.stdin)
-            logger.info(f"Stdin input received: {len(json.dumps(input_data))} bytes")
-        except (json.JSONDecodeError, EOFError):
-            input_data = {}
+            json.loads(raw_input)
+            logger.info(f"Stdin input received: {len(raw_input)} bytes")
+        except json.JSONDecodeError:
             logger.info("No stdin input or invalid JSON")
 
         # Run validation
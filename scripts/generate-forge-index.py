@@ -3,7 +3,7 @@
 Generate a compact index of all Product Forge agents, skills, commands, and processes.
 
 Usage:
-    python generate-forge-index.py [--output index.md] [--format md|json]
+    python generate-forge-index.py [--output index.md] [--format md|json] [--no-cache]
 
 This script scans the plugins directory and extracts metadata from:
 - agents/*.md files
@@ -21,10 +21,16 @@ Output is a compact markdown or JSON file that Claude can read quickly.
 
 import argparse
 import json
+import os
 import re
+import string
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional, TextIO
 
 # Categories based on plugin names
 PLUGIN_CATEGORIES = {
@@ -39,10 +45,73 @@ PLUGIN_CATEGORIES = {
     "atlassian-integration": "Atlassian Integration",
 }
 
+# Parsed frontmatter of unchanged files is reused between runs
+CACHE_FILE = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "product-forge" / "frontmatter.json"
+CACHE_VERSION = 1
+
+# Frontmatter sits at the top of the file; read this much before looking for it
+FRONTMATTER_READ_SIZE = 8192
+
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
+# Characters allowed in a frontmatter key (the part before the first ":")
+_KEY_CHARS = frozenset(string.ascii_letters + "_-")
+_H1_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_FIRST_PARA_RE = re.compile(r"^#.+\n\n(.+?)(?:\n\n|$)", re.MULTILINE)
+
+
+class Agent(NamedTuple):
+    """An agent entry in the index."""
+
+    name: str
+    short: str
+    description: str
+    when: str
+    model: str
+    plugin: str
+    category: str
+
+
+class Skill(NamedTuple):
+    """A skill entry in the index."""
+
+    name: str
+    short: str
+    description: str
+    when: str
+    plugin: str
+    category: str
+
+
+class Command(NamedTuple):
+    """A command entry in the index."""
+
+    name: str
+    short: str
+    description: str
+    when: str
+    args: str
+    plugin: str
+    category: str
+
+
+class Process(NamedTuple):
+    """A process documentation entry in the index."""
+
+    name: str
+    title: str
+    short: str
+    description: str
+    when: str
+    plugin: str
+    category: str
+
+
+_BY_CATEGORY_AND_NAME = attrgetter("category", "name")
+
 
 def parse_frontmatter(content: str) -> dict[str, Any]:
     """Extract YAML frontmatter from markdown content."""
-    match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
     if not match:
         return {}
 
@@ -52,14 +121,14 @@ def parse_frontmatter(content: str) -> dict[str, Any]:
 
     for line in match.group(1).strip().split("\n"):
         # Check if this is a new key
-        if re.match(r"^[a-zA-Z_-]+:", line) and not line.startswith(" "):
+        colon = line.find(":")
+        if colon > 0 and _KEY_CHARS.issuperset(line[:colon]):
             # Save previous key if exists
             if current_key:
                 frontmatter[current_key] = "\n".join(current_value_lines).strip().strip('"\'')
             # Start new key
-            key, value = line.split(":", 1)
-            current_key = key.strip()
-            current_value_lines = [value.strip()]
+            current_key = line[:colon]
+            current_value_lines = [line[colon + 1:].strip()]
         elif current_key:
             # Continue previous value (multiline)
             current_value_lines.append(line)
@@ -71,93 +140,181 @@ def parse_frontmatter(content: str) -> dict[str, Any]:
     return frontmatter
 
 
-def scan_agents(plugins_dir: Path) -> list[dict]:
+def iter_plugin_files(plugins_dir: Path, subdir: str, filename: Optional[str] = None) -> Iterator[tuple[str, str]]:
+    """
+    Yield (plugin_name, path) for each *.md file in <plugin>/<subdir>/.
+
+    With filename set, yield <plugin>/<subdir>/*/<filename> instead (the skills
+    layout). Walks each level with one os.scandir call rather than globbing.
+    """
+    with os.scandir(plugins_dir) as entries:
+        plugins = [entry for entry in entries if entry.is_dir()]
+
+    for plugin in plugins:
+        try:
+            with os.scandir(os.path.join(plugin.path, subdir)) as entries:
+                for entry in entries:
+                    if filename is None:
+                        if entry.name.endswith(".md"):
+                            yield plugin.name, entry.path
+                    elif entry.is_dir():
+                        path = os.path.join(entry.path, filename)
+                        if os.path.isfile(path):
+                            yield plugin.name, path
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+
+def read_text(path: str) -> str:
+    """Read a UTF-8 file in one binary read and a single decode."""
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
+def read_frontmatter(path: str) -> dict[str, Any]:
+    """
+    Parse the frontmatter of a file without reading its markdown body.
+
+    Only the first FRONTMATTER_READ_SIZE bytes are read, unless the closing
+    "---" isn't among them, in which case the rest of the file is read too.
+    """
+    with open(path, "rb") as f:
+        head = f.read(FRONTMATTER_READ_SIZE)
+        if len(head) == FRONTMATTER_READ_SIZE and head.find(b"\n---", 3) == -1:
+            head += f.read()
+    # The head may end mid-character; that only affects the body, never the frontmatter
+    return parse_frontmatter(head.decode("utf-8", errors="replace"))
+
+
+def load_cache() -> dict[str, list]:
+    """
+    Load cached frontmatter, keyed by absolute file path.
+
+    Each entry is [mtime_ns, size, frontmatter]; a missing, corrupt or
+    outdated cache file just means every file gets parsed again.
+    """
+    try:
+        data = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("entries", {})
+
+
+def save_cache(cache: dict[str, list]) -> None:
+    """Write the frontmatter cache atomically; failures only cost the next run a re-parse."""
+    tmp_file = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.tmp")
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_file.open("w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "entries": cache}, f)
+        os.replace(tmp_file, CACHE_FILE)
+    except OSError as e:
+        print(f"Warning: Could not write cache {CACHE_FILE}: {e}", file=sys.stderr)
+
+
+def load_frontmatter(path: str, cache: Optional[dict[str, list]]) -> dict[str, Any]:
+    """Parse a file's frontmatter, reusing the cached result while its mtime and size match."""
+    if cache is None:
+        return read_frontmatter(path)
+
+    st = os.stat(path)
+    key = os.path.abspath(path)
+    entry = cache.get(key)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+
+    meta = read_frontmatter(path)
+    cache[key] = [st.st_mtime_ns, st.st_size, meta]
+    return meta
+
+
+def file_stem(path: str) -> str:
+    """Return the file name without its extension, like Path.stem."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def scan_agents(plugins_dir: Path, cache: Optional[dict[str, list]] = None) -> list[Agent]:
     """Scan all agent files."""
     agents = []
-    for agent_file in plugins_dir.glob("*/agents/*.md"):
-        content = agent_file.read_text()
-        meta = parse_frontmatter(content)
+    for plugin_name, agent_file in iter_plugin_files(plugins_dir, "agents"):
+        meta = load_frontmatter(agent_file, cache)
         if meta.get("name"):
-            plugin_name = agent_file.parent.parent.name
             category = meta.get("category", PLUGIN_CATEGORIES.get(plugin_name, "Other"))
             agents.append(
-                {
-                    "name": meta["name"],
-                    "short": meta.get("short", ""),
-                    "description": meta.get("description", ""),
-                    "when": meta.get("when", ""),
-                    "model": meta.get("model", "sonnet"),
-                    "plugin": plugin_name,
-                    "category": category,
-                }
+                Agent(
+                    name=meta["name"],
+                    short=meta.get("short", ""),
+                    description=meta.get("description", ""),
+                    when=meta.get("when", ""),
+                    model=meta.get("model", "sonnet"),
+                    plugin=plugin_name,
+                    category=category,
+                )
             )
-    return sorted(agents, key=lambda x: (x["category"], x["name"]))
+    return sorted(agents, key=_BY_CATEGORY_AND_NAME)
 
 
-def scan_skills(plugins_dir: Path) -> list[dict]:
+def scan_skills(plugins_dir: Path, cache: Optional[dict[str, list]] = None) -> list[Skill]:
     """Scan all skill files."""
     skills = []
-    for skill_file in plugins_dir.glob("*/skills/*/SKILL.md"):
-        content = skill_file.read_text()
-        meta = parse_frontmatter(content)
+    for plugin_name, skill_file in iter_plugin_files(plugins_dir, "skills", "SKILL.md"):
+        meta = load_frontmatter(skill_file, cache)
         if meta.get("name"):
-            plugin_name = skill_file.parent.parent.parent.name
             category = meta.get("category", PLUGIN_CATEGORIES.get(plugin_name, "Other"))
             skills.append(
-                {
-                    "name": meta["name"],
-                    "short": meta.get("short", ""),
-                    "description": meta.get("description", ""),
-                    "when": meta.get("when", ""),
-                    "plugin": plugin_name,
-                    "category": category,
-                }
+                Skill(
+                    name=meta["name"],
+                    short=meta.get("short", ""),
+                    description=meta.get("description", ""),
+                    when=meta.get("when", ""),
+                    plugin=plugin_name,
+                    category=category,
+                )
             )
-    return sorted(skills, key=lambda x: (x["category"], x["name"]))
+    return sorted(skills, key=_BY_CATEGORY_AND_NAME)
 
 
-def scan_commands(plugins_dir: Path) -> list[dict]:
+def scan_commands(plugins_dir: Path, cache: Optional[dict[str, list]] = None) -> list[Command]:
     """Scan all command files."""
     commands = []
-    for cmd_file in plugins_dir.glob("*/commands/*.md"):
-        content = cmd_file.read_text()
-        meta = parse_frontmatter(content)
+    for plugin_name, cmd_file in iter_plugin_files(plugins_dir, "commands"):
+        meta = load_frontmatter(cmd_file, cache)
         if meta.get("description"):
-            plugin_name = cmd_file.parent.parent.name
-            cmd_name = cmd_file.stem
+            cmd_name = file_stem(cmd_file)
             category = meta.get("category", PLUGIN_CATEGORIES.get(plugin_name, "Other"))
             commands.append(
-                {
-                    "name": cmd_name,
-                    "short": meta.get("short", ""),
-                    "description": meta["description"],
-                    "when": meta.get("when", ""),
-                    "args": meta.get("argument-hint", ""),
-                    "plugin": plugin_name,
-                    "category": category,
-                }
+                Command(
+                    name=cmd_name,
+                    short=meta.get("short", ""),
+                    description=meta["description"],
+                    when=meta.get("when", ""),
+                    args=meta.get("argument-hint", ""),
+                    plugin=plugin_name,
+                    category=category,
+                )
             )
-    return sorted(commands, key=lambda x: (x["category"], x["name"]))
+    return sorted(commands, key=_BY_CATEGORY_AND_NAME)
 
 
-def scan_processes(plugins_dir: Path) -> list[dict]:
+def scan_processes(plugins_dir: Path) -> list[Process]:
     """Scan all process documentation files."""
     processes = []
-    for proc_file in plugins_dir.glob("*/processes/*.md"):
+    for plugin_name, proc_file in iter_plugin_files(plugins_dir, "processes"):
         try:
-            content = proc_file.read_text(encoding="utf-8")
+            content = read_text(proc_file)
         except UnicodeDecodeError:
             print(f"Warning: Skipping {proc_file} - encoding error")
             continue
         meta = parse_frontmatter(content)
-        plugin_name = proc_file.parent.parent.name
-        proc_name = proc_file.stem
+        proc_name = file_stem(proc_file)
         category = meta.get("category", PLUGIN_CATEGORIES.get(plugin_name, "Other"))
 
         # Extract title from first H1 if no frontmatter
         title = meta.get("title", "")
         if not title:
-            title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+            title_match = _H1_RE.search(content)
             if title_match:
                 title = title_match.group(1).strip()
             else:
@@ -167,28 +324,35 @@ def scan_processes(plugins_dir: Path) -> list[dict]:
         description = meta.get("description", "")
         if not description:
             # Try to get first paragraph after title
-            para_match = re.search(r"^#.+\n\n(.+?)(?:\n\n|$)", content, re.MULTILINE)
+            para_match = _FIRST_PARA_RE.search(content)
             if para_match:
                 description = para_match.group(1).strip()[:100]
                 if len(para_match.group(1).strip()) > 100:
                     description += "..."
 
         processes.append(
-            {
-                "name": proc_name,
-                "title": title,
-                "short": meta.get("short", ""),
-                "description": description,
-                "when": meta.get("when", ""),
-                "plugin": plugin_name,
-                "category": category,
-            }
+            Process(
+                name=proc_name,
+                title=title,
+                short=meta.get("short", ""),
+                description=description,
+                when=meta.get("when", ""),
+                plugin=plugin_name,
+                category=category,
+            )
         )
-    return sorted(processes, key=lambda x: (x["category"], x["name"]))
+    return sorted(processes, key=_BY_CATEGORY_AND_NAME)
+
 
+def generate_markdown(
+    agents: list[Agent], skills: list[Skill], commands: list[Command], processes: Optional[list[Process]] = None
+) -> str:
+    """
+    Generate compact markdown index.
 
-def generate_markdown(agents: list, skills: list, commands: list, processes: Optional[list] = None) -> str:
-    """Generate compact markdown index."""
+    Expects each list sorted by (category, name), as the scan_* functions
+    return them, so entries are grouped by category in a single pass.
+    """
     lines = [
         "# Product Forge Index",
         "",
@@ -200,24 +364,15 @@ def generate_markdown(agents: list, skills: list, commands: list, processes: Opt
         "",
     ]
 
-    # Group agents by category
-    agent_by_cat: dict[str, list] = {}
-    for a in agents:
-        cat = a["category"]
-        if cat not in agent_by_cat:
-            agent_by_cat[cat] = []
-        agent_by_cat[cat].append(a)
-
-    for cat_name in sorted(agent_by_cat.keys()):
-        lines.append(f"### {cat_name}")
-        lines.append("")
-        for a in agent_by_cat[cat_name]:
-            desc = a["short"] if a["short"] else a["description"][:60]
-            if not a["short"] and len(a["description"]) > 60:
+    for cat_name, group in groupby(agents, key=attrgetter("category")):
+        lines.extend((f"### {cat_name}", ""))
+        for a in group:
+            desc = a.short if a.short else a.description[:60]
+            if not a.short and len(a.description) > 60:
                 desc += "..."
-            lines.append(f"- **@{a['name']}** ({a['model']}) - {desc}")
-            if a["when"]:
-                lines.append(f"  - _When: {a['when']}_")
+            lines.append(f"- **@{a.name}** ({a.model}) - {desc}")
+            if a.when:
+                lines.append(f"  - _When: {a.when}_")
         lines.append("")
 
     lines.extend(
@@ -229,24 +384,15 @@ def generate_markdown(agents: list, skills: list, commands: list, processes: Opt
         ]
     )
 
-    # Group skills by category
-    skill_by_cat: dict[str, list] = {}
-    for s in skills:
-        cat = s["category"]
-        if cat not in skill_by_cat:
-            skill_by_cat[cat] = []
-        skill_by_cat[cat].append(s)
-
-    for cat_name in sorted(skill_by_cat.keys()):
-        lines.append(f"### {cat_name}")
-        lines.append("")
-        for s in skill_by_cat[cat_name]:
-            desc = s["short"] if s["short"] else s["description"][:60]
-            if not s["short"] and len(s["description"]) > 60:
+    for cat_name, group in groupby(skills, key=attrgetter("category")):
+        lines.extend((f"### {cat_name}", ""))
+        for s in group:
+            desc = s.short if s.short else s.description[:60]
+            if not s.short and len(s.description) > 60:
                 desc += "..."
-            lines.append(f"- **{s['name']}** - {desc}")
-            if s["when"]:
-                lines.append(f"  - _When: {s['when']}_")
+            lines.append(f"- **{s.name}** - {desc}")
+            if s.when:
+                lines.append(f"  - _When: {s.when}_")
         lines.append("")
 
     lines.extend(
@@ -258,25 +404,16 @@ def generate_markdown(agents: list, skills: list, commands: list, processes: Opt
         ]
     )
 
-    # Group commands by category
-    cmd_by_cat: dict[str, list] = {}
-    for c in commands:
-        cat = c["category"]
-        if cat not in cmd_by_cat:
-            cmd_by_cat[cat] = []
-        cmd_by_cat[cat].append(c)
-
-    for cat_name in sorted(cmd_by_cat.keys()):
-        lines.append(f"### {cat_name}")
-        lines.append("")
-        for c in cmd_by_cat[cat_name]:
-            desc = c["short"] if c["short"] else c["description"][:50]
-            if not c["short"] and len(c["description"]) > 50:
+    for cat_name, group in groupby(commands, key=attrgetter("category")):
+        lines.extend((f"### {cat_name}", ""))
+        for c in group:
+            desc = c.short if c.short else c.description[:50]
+            if not c.short and len(c.description) > 50:
                 desc += "..."
-            args = f" {c['args']}" if c["args"] else ""
-            lines.append(f"- **/{c['name']}**{args} - {desc}")
-            if c["when"]:
-                lines.append(f"  - _When: {c['when']}_")
+            args = f" {c.args}" if c.args else ""
+            lines.append(f"- **/{c.name}**{args} - {desc}")
+            if c.when:
+                lines.append(f"  - _When: {c.when}_")
         lines.append("")
 
     # Add processes section if provided
@@ -290,35 +427,36 @@ def generate_markdown(agents: list, skills: list, commands: list, processes: Opt
             ]
         )
 
-        # Group processes by category
-        proc_by_cat: dict[str, list] = {}
-        for p in processes:
-            cat = p["category"]
-            if cat not in proc_by_cat:
-                proc_by_cat[cat] = []
-            proc_by_cat[cat].append(p)
-
-        for cat_name in sorted(proc_by_cat.keys()):
-            lines.append(f"### {cat_name}")
-            lines.append("")
-            for p in proc_by_cat[cat_name]:
-                desc = p["short"] if p["short"] else p["description"][:60]
-                if not p["short"] and len(p["description"]) > 60:
+        for cat_name, group in groupby(processes, key=attrgetter("category")):
+            lines.extend((f"### {cat_name}", ""))
+            for p in group:
+                desc = p.short if p.short else p.description[:60]
+                if not p.short and len(p.description) > 60:
                     desc += "..."
-                lines.append(f"- **{p['title']}** (`{p['name']}.md`) - {desc}")
-                if p["when"]:
-                    lines.append(f"  - _When: {p['when']}_")
+                lines.append(f"- **{p.title}** (`{p.name}.md`) - {desc}")
+                if p.when:
+                    lines.append(f"  - _When: {p.when}_")
             lines.append("")
 
     return "\n".join(lines)
 
 
-def generate_json(agents: list, skills: list, commands: list, processes: Optional[list] = None) -> str:
-    """Generate JSON index."""
-    data = {"agents": agents, "skills": skills, "commands": commands}
+def write_json(
+    fp: TextIO,
+    agents: list[Agent],
+    skills: list[Skill],
+    commands: list[Command],
+    processes: Optional[list[Process]] = None,
+) -> None:
+    """Write JSON index straight to fp, without building the whole document as one string."""
+    data = {
+        "agents": [a._asdict() for a in agents],
+        "skills": [s._asdict() for s in skills],
+        "commands": [c._asdict() for c in commands],
+    }
     if processes:
-        data["processes"] = processes
-    return json.dumps(data, indent=2)
+        data["processes"] = [p._asdict() for p in processes]
+    json.dump(data, fp, indent=2)
 
 
 def main():
@@ -342,6 +480,11 @@ def main():
         default=None,
         help="Path to plugins directory",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Parse every file instead of reusing {CACHE_FILE}",
+    )
     args = parser.parse_args()
 
     # Find plugins directory
@@ -361,20 +504,28 @@ def main():
 
     print(f"Scanning plugins in: {plugins_dir}")
 
-    agents = scan_agents(plugins_dir)
-    skills = scan_skills(plugins_dir)
-    commands = scan_commands(plugins_dir)
-    processes = scan_processes(plugins_dir)
+    cache = None if args.no_cache else load_cache()
+    # The scanners are independent and mostly waiting on file reads, so run them side by side
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        agents_future = pool.submit(scan_agents, plugins_dir, cache)
+        skills_future = pool.submit(scan_skills, plugins_dir, cache)
+        commands_future = pool.submit(scan_commands, plugins_dir, cache)
+        processes_future = pool.submit(scan_processes, plugins_dir)
+        agents = agents_future.result()
+        skills = skills_future.result()
+        commands = commands_future.result()
+        processes = processes_future.result()
+    if cache is not None:
+        save_cache(cache)
 
     print(f"Found: {len(agents)} agents, {len(skills)} skills, {len(commands)} commands, {len(processes)} processes")
 
-    if args.format == "json":
-        output = generate_json(agents, skills, commands, processes)
-    else:
-        output = generate_markdown(agents, skills, commands, processes)
-
     output_path = Path(args.output)
-    output_path.write_text(output)
+    with output_path.open("w") as f:
+        if args.format == "json":
+            write_json(f, agents, skills, commands, processes)
+        else:
+            f.write(generate_markdown(agents, skills, commands, processes))
     print(f"Index written to: {output_path}")
 
 
@@ -14,9 +14,10 @@ Output: Saves feedback files to ~/.claude/learnings/projects/{slug}/feedback/
 
 import json
 import os
-import re
+import string
 import subprocess
 import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -27,39 +28,136 @@ from typing import Optional
 LEARNINGS_DIR = Path.home() / ".claude" / "learnings"
 PROJECTS_FILE = LEARNINGS_DIR / "projects.json"
 STATS_FILE = LEARNINGS_DIR / "stats.json"
+# Plain string so per-item feedback paths are joined without building Path objects
+PROJECTS_ROOT = os.path.join(LEARNINGS_DIR, "projects")
 
 FEEDBACK_TYPES = ["improvement", "skill-idea", "command-idea", "bug-report", "pattern"]
+_FEEDBACK_TYPE_SET = frozenset(FEEDBACK_TYPES)
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+class _SlugTable(dict):
+    """str.translate table mapping every character except [a-z0-9] to '-'."""
+
+    def __missing__(self, codepoint: int) -> str:
+        self[codepoint] = "-"
+        return "-"
+
+
+_SLUG_TABLE = _SlugTable({ord(c): c for c in string.ascii_lowercase + string.digits})
+
+
+# Log lines are written to stderr in one go by flush_log() when the hook exits
+_log_lines: list = []
 
 
 # === UTILITY FUNCTIONS ===
 
 def log(msg: str) -> None:
     """Log message to stderr (visible in verbose mode)."""
-    print(f"[feedback-hook] {msg}", file=sys.stderr)
+    _log_lines.append(f"[feedback-hook] {msg}\n")
+
+
+def flush_log() -> None:
+    """Write all pending log lines to stderr with a single write."""
+    if _log_lines:
+        sys.stderr.write("".join(_log_lines))
+        sys.stderr.flush()
+        _log_lines.clear()
 
 
-def ensure_learnings_dir() -> None:
-    """Initialize the learnings directory structure if it doesn't exist."""
-    LEARNINGS_DIR.mkdir(parents=True, exist_ok=True)
+def write_json(path: Path, data: dict) -> None:
+    """Serialize data as indented JSON directly into path."""
+    with path.open("w") as f:
+        json.dump(data, f, indent=2)
 
-    if not PROJECTS_FILE.exists():
-        PROJECTS_FILE.write_text(json.dumps({
-            "version": "1.0",
-            "projects": {}
-        }, indent=2))
 
-    if not STATS_FILE.exists():
-        STATS_FILE.write_text(json.dumps({
-            "version": "1.0",
-            "total_feedback": 0,
-            "by_type": {t: 0 for t in FEEDBACK_TYPES},
-            "by_project": {},
-            "last_updated": datetime.now().isoformat()
-        }, indent=2))
+def load_or_init(path: Path, default: dict) -> dict:
+    """Load a learnings JSON file, creating it from default if it doesn't exist."""
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        LEARNINGS_DIR.mkdir(parents=True, exist_ok=True)
+        write_json(path, default)
+        return default
+
+
+def load_learnings(now_iso: str) -> tuple[dict, dict]:
+    """
+    Load the projects and stats files, initializing the learnings directory
+    structure on first use. Returns (projects, stats).
+
+    The common case of both files existing costs one open per file; the
+    directory is only created when a file turns out to be missing.
+    """
+    projects = load_or_init(PROJECTS_FILE, {
+        "version": "1.0",
+        "projects": {}
+    })
+    stats = load_or_init(STATS_FILE, {
+        "version": "1.0",
+        "total_feedback": 0,
+        "by_type": {t: 0 for t in FEEDBACK_TYPES},
+        "by_project": {},
+        "last_updated": now_iso
+    })
+    return projects, stats
+
+
+def find_git_config(cwd: str) -> Optional[Path]:
+    """Locate the config file of the git repository containing cwd."""
+    start = Path(cwd)
+    for directory in (start, *start.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git / "config"
+        if dot_git.is_file():
+            # Worktrees and submodules: ".git" is a "gitdir: <path>" pointer
+            content = dot_git.read_text().strip()
+            if not content.startswith("gitdir:"):
+                return None
+            gitdir = directory / content[len("gitdir:"):].strip()
+            # Worktree gitdirs share the main repository's config
+            commondir = gitdir / "commondir"
+            if commondir.is_file():
+                gitdir = gitdir / commondir.read_text().strip()
+            return gitdir / "config"
+    return None
+
+
+def read_origin_url(config_file: Path) -> Optional[str]:
+    """Read remote.origin.url from a git config file."""
+    in_origin = False
+    for line in config_file.read_text().splitlines():
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            in_origin = line == '[remote "origin"]'
+            continue
+        key, sep, value = line.partition("=")
+        if in_origin and sep and key.strip().lower() == "url":
+            return value.strip().strip('"')
+    return None
 
 
 def get_git_remote_url(cwd: str) -> Optional[str]:
-    """Extract the git remote URL from a directory."""
+    """
+    Extract the git remote URL from a directory.
+
+    Reads the repository's config file directly to avoid spawning git, and
+    returns None without running git when cwd isn't inside a repository.
+    Falls back to `git remote get-url` only if the config can't be read.
+    """
+    try:
+        config_file = find_git_config(cwd)
+        if config_file is None:
+            return None
+        return read_origin_url(config_file)
+    except OSError:
+        pass
+
     try:
         result = subprocess.run(
             ["git", "-C", cwd, "remote", "get-url", "origin"],
@@ -74,32 +172,35 @@ def get_git_remote_url(cwd: str) -> Optional[str]:
     return None
 
 
+def dashify(text: str) -> str:
+    """Lowercase text and replace each run of non-alphanumeric characters with one dash."""
+    text = text.lower().translate(_SLUG_TABLE)
+    while "--" in text:
+        text = text.replace("--", "-")
+    return text
+
+
 def get_project_slug(cwd: str) -> str:
     """Generate a slug for the project based on its path."""
     # Use the directory name as the slug
     path = Path(cwd)
-    slug = path.name.lower()
     # Sanitize: replace non-alphanumeric with dashes
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
-    slug = slug.strip("-")
+    slug = dashify(path.name).strip("-")
     return slug or "unknown-project"
 
 
-def register_project(cwd: str) -> str:
-    """Register a project if not already registered. Returns the project slug."""
+def register_project(cwd: str, projects: dict, now_iso: str) -> str:
+    """Register a project in the loaded projects data if needed. Returns the project slug."""
     slug = get_project_slug(cwd)
 
-    projects = json.loads(PROJECTS_FILE.read_text())
-
     if slug not in projects["projects"]:
         log(f"Registering new project: {slug}")
         projects["projects"][slug] = {
             "path": cwd,
             "repo": get_git_remote_url(cwd),
-            "registered": datetime.now().isoformat(),
+            "registered": now_iso,
             "feedback_count": 0
         }
-        PROJECTS_FILE.write_text(json.dumps(projects, indent=2))
 
     return slug
 
@@ -108,11 +209,14 @@ def save_feedback_item(
     item: dict,
     project_slug: str,
     session_id: str,
-    cwd: str
-) -> Optional[Path]:
+    cwd: str,
+    project_info: dict,
+    now_iso: str,
+    date_str: str
+) -> Optional[str]:
     """Save a single feedback item to the appropriate directory."""
     feedback_type = item.get("type", "improvement")
-    if feedback_type not in FEEDBACK_TYPES:
+    if feedback_type not in _FEEDBACK_TYPE_SET:
         log(f"Unknown feedback type: {feedback_type}, using 'improvement'")
         feedback_type = "improvement"
 
@@ -120,25 +224,19 @@ def save_feedback_item(
     description = item.get("description", "")
     target = item.get("target", "")
 
-    # Create the feedback directory
-    feedback_dir = LEARNINGS_DIR / "projects" / project_slug / "feedback" / feedback_type
-    feedback_dir.mkdir(parents=True, exist_ok=True)
+    # main() has already created the feedback directory
+    feedback_dir = os.path.join(PROJECTS_ROOT, project_slug, "feedback", feedback_type)
 
     # Generate filename
-    date_str = datetime.now().strftime("%Y%m%d-%H%M%S")
-    title_slug = re.sub(r"[^a-z0-9]+", "-", title.lower())[:30].strip("-")
+    title_slug = dashify(title)[:30].strip("-")
     filename = f"{date_str}-{title_slug}.md"
-    filepath = feedback_dir / filename
-
-    # Get project info
-    projects = json.loads(PROJECTS_FILE.read_text())
-    project_info = projects["projects"].get(project_slug, {})
+    filepath = os.path.join(feedback_dir, filename)
 
     # Build the markdown content
     content = f"""---
 type: {feedback_type}
 status: pending
-captured: {datetime.now().isoformat()}
+captured: {now_iso}
 session_id: {session_id}
 project: {project_slug}
 repo: {project_info.get('repo', '')}
@@ -150,30 +248,29 @@ target: {target}
 {description}
 """
 
-    filepath.write_text(content)
+    with open(filepath, "w") as f:
+        f.write(content)
     log(f"Saved feedback: {filepath}")
     return filepath
 
 
-def update_stats(project_slug: str, feedback_items: list) -> None:
-    """Update the global statistics."""
-    stats = json.loads(STATS_FILE.read_text())
-    projects = json.loads(PROJECTS_FILE.read_text())
+def update_stats(project_slug: str, feedback_items: list, stats: dict, project_info: dict, now_iso: str) -> None:
+    """Update the loaded statistics and the project's feedback count in place."""
+    type_counts = Counter(item.get("type", "improvement") for item in feedback_items)
+    for feedback_type in type_counts.keys() - _FEEDBACK_TYPE_SET:
+        del type_counts[feedback_type]
 
-    for item in feedback_items:
-        feedback_type = item.get("type", "improvement")
-        if feedback_type in FEEDBACK_TYPES:
-            stats["total_feedback"] += 1
-            stats["by_type"][feedback_type] = stats["by_type"].get(feedback_type, 0) + 1
-            stats["by_project"][project_slug] = stats["by_project"].get(project_slug, 0) + 1
+    total = sum(type_counts.values())
+    if total:
+        stats["total_feedback"] += total
+        for feedback_type, count in type_counts.items():
+            stats["by_type"][feedback_type] = stats["by_type"].get(feedback_type, 0) + count
+        stats["by_project"][project_slug] = stats["by_project"].get(project_slug, 0) + total
 
-    stats["last_updated"] = datetime.now().isoformat()
-    STATS_FILE.write_text(json.dumps(stats, indent=2))
+    stats["last_updated"] = now_iso
 
     # Update project feedback count
-    if project_slug in projects["projects"]:
-        projects["projects"][project_slug]["feedback_count"] = stats["by_project"].get(project_slug, 0)
-        PROJECTS_FILE.write_text(json.dumps(projects, indent=2))
+    project_info["feedback_count"] = stats["by_project"].get(project_slug, 0)
 
 
 def parse_hook_input() -> dict:
@@ -188,6 +285,35 @@ def parse_hook_input() -> dict:
         return {}
 
 
+def find_feedback_in_text(text: str) -> Optional[list]:
+    """
+    Return the feedback list of the first JSON object in text that has one.
+
+    The whole string is tried first. Otherwise each '"feedback"' occurrence
+    is decoded from its nearest preceding '{', so the work is bounded by the
+    number of occurrences rather than every brace in the text.
+    """
+    try:
+        parsed = json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    else:
+        return parsed.get("feedback", []) if isinstance(parsed, dict) and "feedback" in parsed else None
+
+    pos = text.find('"feedback"')
+    while pos != -1:
+        start = text.rfind("{", 0, pos)
+        if start != -1:
+            try:
+                parsed, _ = _JSON_DECODER.raw_decode(text, start)
+            except json.JSONDecodeError:
+                parsed = None
+            if isinstance(parsed, dict) and "feedback" in parsed:
+                return parsed.get("feedback", [])
+        pos = text.find('"feedback"', pos + 1)
+    return None
+
+
 def extract_feedback_from_prompt_output(hook_data: dict) -> list:
     """
     Extract feedback items from the prompt hook's output.
@@ -209,21 +335,11 @@ def extract_feedback_from_prompt_output(hook_data: dict) -> list:
 
     # Try to find feedback in string content (prompt hook might return text)
     for key in ["result", "output", "response", "content"]:
-        if key in hook_data and isinstance(hook_data[key], str):
-            try:
-                parsed = json.loads(hook_data[key])
-                if "feedback" in parsed:
-                    return parsed.get("feedback", [])
-            except json.JSONDecodeError:
-                # Try to extract JSON from the string
-                match = re.search(r'\{[^{}]*"feedback"[^{}]*\}', hook_data[key])
-                if match:
-                    try:
-                        parsed = json.loads(match.group())
-                        if "feedback" in parsed:
-                            return parsed.get("feedback", [])
-                    except json.JSONDecodeError:
-                        pass
+        text = hook_data.get(key)
+        if isinstance(text, str) and '"feedback"' in text:
+            feedback = find_feedback_in_text(text)
+            if feedback is not None:
+                return feedback
 
     return []
 
@@ -259,25 +375,42 @@ def main() -> int:
 
     log(f"Found {len(feedback_items)} feedback items")
 
-    # Ensure learnings directory exists
-    ensure_learnings_dir()
+    # One timestamp for everything written by this invocation
+    now = datetime.now()
+    now_iso = now.isoformat()
+    date_str = now.strftime("%Y%m%d-%H%M%S")
+
+    # Load the learnings JSON files once, creating them on first use
+    projects, stats = load_learnings(now_iso)
+    known_projects = set(projects["projects"])
 
     # Register project
-    project_slug = register_project(cwd)
+    project_slug = register_project(cwd, projects, now_iso)
+    project_info = projects["projects"][project_slug]
+
+    # Create each feedback type directory once (unknown types are saved as improvements)
+    feedback_items = [item for item in feedback_items if isinstance(item, dict)]
+    item_types = {item.get("type", "improvement") for item in feedback_items}
+    for feedback_type in {t if t in _FEEDBACK_TYPE_SET else "improvement" for t in item_types}:
+        os.makedirs(os.path.join(PROJECTS_ROOT, project_slug, "feedback", feedback_type), exist_ok=True)
 
     # Save each feedback item
     saved_files = []
     for item in feedback_items:
-        if not isinstance(item, dict):
-            continue
-        filepath = save_feedback_item(item, project_slug, session_id, cwd)
+        filepath = save_feedback_item(
+            item, project_slug, session_id, cwd, project_info, now_iso, date_str
+        )
         if filepath:
             saved_files.append(filepath)
 
-    # Update statistics
+    # Update statistics and write each file at most once
     if saved_files:
-        update_stats(project_slug, feedback_items)
+        update_stats(project_slug, feedback_items, stats, project_info, now_iso)
+        write_json(STATS_FILE, stats)
+        write_json(PROJECTS_FILE, projects)
         log(f"Saved {len(saved_files)} feedback items for project '{project_slug}'")
+    elif project_slug not in known_projects:
+        write_json(PROJECTS_FILE, projects)
 
     return 0
 
@@ -293,3 +426,5 @@ if __name__ == "__main__":
     except Exception as e:
         log(f"Error: {e}")
         sys.exit(1)
+    finally:
+        flush_log()
@@ -2,6 +2,7 @@
 """Validate marketplace.json against the Claude Code marketplace schema."""
 
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Optional
@@ -16,20 +17,82 @@ except ImportError:
 SCHEMA_URL = "https://anthropic.com/claude-code/marketplace.schema.json"
 MARKETPLACE_PATH = Path(__file__).parent.parent / ".claude-plugin" / "marketplace.json"
 
+# Last fetched schema plus the ETag/Last-Modified headers used to revalidate it
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "product-forge"
+SCHEMA_CACHE = CACHE_DIR / "marketplace.schema.json"
+SCHEMA_META_CACHE = CACHE_DIR / "marketplace.schema.meta.json"
+
+
+def load_cached_schema() -> tuple[Optional[dict], dict]:
+    """Return the cached schema (or None) and its validator headers."""
+    try:
+        schema = json.loads(SCHEMA_CACHE.read_text())
+    except (OSError, ValueError):
+        return None, {}
+    try:
+        meta = json.loads(SCHEMA_META_CACHE.read_text())
+    except (OSError, ValueError):
+        meta = {}
+    return schema, meta
+
+
+def save_cached_schema(body: str, response_headers) -> None:
+    """Store a freshly fetched schema; failing to cache is not an error."""
+    meta = {
+        header: response_headers[header]
+        for header in ("ETag", "Last-Modified")
+        if header in response_headers
+    }
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        SCHEMA_CACHE.write_text(body)
+        SCHEMA_META_CACHE.write_text(json.dumps(meta))
+    except OSError:
+        pass
+
 
 def fetch_schema() -> Optional[dict]:
-    """Fetch the JSON schema from Anthropic."""
+    """
+    Fetch the JSON schema from Anthropic.
+
+    A cached copy is revalidated with a conditional GET, so an unchanged
+    schema costs a 304 instead of a full download. If the request fails,
+    the cached copy is used when there is one.
+    """
+    cached_schema, meta = load_cached_schema()
+    headers = {}
+    if cached_schema is not None:
+        if "ETag" in meta:
+            headers["If-None-Match"] = meta["ETag"]
+        if "Last-Modified" in meta:
+            headers["If-Modified-Since"] = meta["Last-Modified"]
+
     try:
-        response = requests.get(SCHEMA_URL, timeout=10)
+        response = requests.get(SCHEMA_URL, headers=headers, timeout=10)
+        if response.status_code == 304 and cached_schema is not None:
+            return cached_schema
         response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
+        schema = response.json()
+    except (requests.RequestException, ValueError) as e:
         print(f"Warning: Could not fetch schema from {SCHEMA_URL}: {e}")
+        if cached_schema is not None:
+            print(f"Using cached schema from {SCHEMA_CACHE}")
+            return cached_schema
         print("Falling back to basic JSON validation only.")
         return None
 
+    save_cached_schema(response.text, response.headers)
+    return schema
+
+
+def build_validator(schema: dict):
+    """Check the schema and compile a validator for it once, for any number of files."""
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
 
-def validate_marketplace(marketplace_path: Path, schema) -> bool:
+
+def validate_marketplace(marketplace_path: Path, validator) -> bool:
     """Validate the marketplace.json file."""
     try:
         with open(marketplace_path) as f:
@@ -41,18 +104,18 @@ def validate_marketplace(marketplace_path: Path, schema) -> bool:
         print(f"Marketplace file not found: {marketplace_path}")
         return False
 
-    if schema is None:
+    if validator is None:
         print(f"JSON is valid (schema validation skipped)")
         return True
 
-    try:
-        jsonschema.validate(instance=marketplace, schema=schema)
+    # Same error selection as jsonschema.validate, without rebuilding the validator
+    e = jsonschema.exceptions.best_match(validator.iter_errors(marketplace))
+    if e is None:
         print(f"Marketplace validation passed")
         return True
-    except jsonschema.ValidationError as e:
-        print(f"Validation error: {e.message}")
-        print(f"  Path: {' -> '.join(str(p) for p in e.absolute_path)}")
-        return False
+    print(f"Validation error: {e.message}")
+    print(f"  Path: {' -> '.join(str(p) for p in e.absolute_path)}")
+    return False
 
 
 def main() -> int:
@@ -60,8 +123,9 @@ def main() -> int:
 
     print(f"Validating: {marketplace_path}")
     schema = fetch_schema()
+    validator = build_validator(schema) if schema is not None else None
 
-    if validate_marketplace(marketplace_path, schema):
+    if validate_marketplace(marketplace_path, validator):
         return 0
     return 1
 
@@ -1,33 +1,103 @@
 """CLI interface for Product Forge."""
 
 import json
+import logging
 import os
 import sys
-from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import click
 
 from .common.hook_io import output_result
-from .common.logging_config import (
-    log_hook_execution,
-    log_validation,
-    setup_logging,
+
+# Key under which _get_logger() keeps the configured logger in the click context meta
+_LOGGER_META_KEY = "forge_hooks.logger"
+
+
+# Layout printed by `forge feedback init`, below the learnings directory itself
+_LEARNINGS_TREE = "\n".join(
+    [
+        "  ├── projects.json       # Registry of opted-in projects",
+        "  ├── stats.json          # Global feedback statistics",
+        "  ├── projects/           # Per-project feedback",
+        "  │   └── {project-slug}/",
+        "  │       └── feedback/",
+        "  │           ├── improvement/",
+        "  │           ├── skill-idea/",
+        "  │           ├── command-idea/",
+        "  │           ├── bug-report/",
+        "  │           └── pattern/",
+        "  ├── cross-project/      # Cross-project patterns",
+        "  └── synced/             # Archived after sync",
+    ]
 )
-from .validators import FileContainsValidator, FileOwnershipValidator, NewFileValidator
 
-# Setup logging (file-based with rotation)
-# Skip logging setup if we're just viewing logs (to avoid polluting the output)
-_skip_logging = len(sys.argv) > 1 and sys.argv[1] == "logs"
-if not _skip_logging:
-    log_level = os.environ.get("FORGE_LOG_LEVEL", "INFO")
-    logger = setup_logging(log_level=log_level)
-else:
-    # Create a dummy logger that doesn't log anything
-    import logging
 
-    logger = logging.getLogger("forge_hooks")
-    logger.addHandler(logging.NullHandler())
+def _get_logger() -> logging.Logger:
+    """
+    Set up file-based logging (with rotation) on first use.
+
+    Commands call this instead of logging being configured at import, so
+    commands that never log (like `forge logs`, which would otherwise pollute
+    the file it is showing) skip loading and configuring it entirely. The
+    logger is kept in the click context meta, which is shared by the whole
+    command chain, so it is set up once per invocation.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None and _LOGGER_META_KEY in ctx.meta:
+        return ctx.meta[_LOGGER_META_KEY]
+
+    from .common.logging_config import setup_logging
+
+    logger = setup_logging(log_level=os.environ.get("FORGE_LOG_LEVEL", "INFO"))
+    if ctx is not None:
+        ctx.meta[_LOGGER_META_KEY] = logger
+    return logger
+
+
+def _tail_bytes(path: os.PathLike, n: int) -> bytes:
+    """
+    Return the last n lines of a file, like `tail -n`.
+
+    Reads backwards from the end in growing blocks, so only about n lines'
+    worth of the file is read however large it is.
+    """
+    if n <= 0:
+        return b""
+
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        block = n * 256
+        while True:
+            start = max(0, size - block)
+            f.seek(start)
+            data = f.read(size - start)
+            # A trailing newline ends the last line rather than starting a new one
+            end = len(data) - 1 if data.endswith(b"\n") else len(data)
+            if start == 0 or data.count(b"\n", 0, end) >= n:
+                break
+            block *= 2
+
+    pos = end
+    for _ in range(n):
+        pos = data.rfind(b"\n", 0, pos)
+        if pos == -1:
+            return data
+    return data[pos + 1 :]
+
+
+def _loads_json(raw: bytes) -> Any:
+    """
+    Parse JSON from raw bytes, using orjson when it is installed.
+
+    Both parsers decode the UTF-8 themselves, and orjson's JSONDecodeError
+    subclasses json.JSONDecodeError, so callers handle errors the same way.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(raw)
+    return orjson.loads(raw)
 
 
 @click.group()
@@ -69,8 +139,6 @@ def logs_command(lines: Optional[int], follow: bool, log_file: Optional[str]) ->
 
       forge logs -f -n 100    # Follow with 100 initial lines
     """
-    import subprocess
-
     from .common.logging_config import get_log_directory
 
     # Get log file path
@@ -85,36 +153,54 @@ def logs_command(lines: Optional[int], follow: bool, log_file: Optional[str]) ->
         click.echo(f"\nLog directory: {log_dir}", err=True)
         click.echo("\nAvailable log files:", err=True)
         if log_dir.exists():
-            log_files = sorted(log_dir.glob("*.log*"))
-            if log_files:
-                for f in log_files:
-                    click.echo(f"  - {f.name}", err=True)
+            # Names matching *.log* (current and rotated logs)
+            with os.scandir(log_dir) as entries:
+                log_names = sorted(
+                    entry.name
+                    for entry in entries
+                    if ".log" in entry.name and entry.is_file(follow_symlinks=False)
+                )
+            if log_names:
+                for name in log_names:
+                    click.echo(f"  - {name}", err=True)
             else:
                 click.echo("  (none)", err=True)
         sys.exit(1)
 
-    # Build tail command
-    cmd = ["tail"]
+    if not follow:
+        # Print the last lines ourselves instead of spawning tail
+        try:
+            click.echo(_tail_bytes(log_path, 10 if lines is None else lines), nl=False)
+        except OSError as e:
+            click.echo(f"Error reading log file: {e}", err=True)
+            sys.exit(1)
+        return
 
-    # Add follow flag if requested
-    if follow:
-        cmd.append("-f")
+    import subprocess
+
+    # Build tail command
+    cmd = ["tail", "-f"]
 
     # Add lines option
     if lines is not None:
         cmd.extend(["-n", str(lines)])
-    elif not follow:
-        # Default to 10 lines if not following
-        cmd.extend(["-n", "10"])
 
     # Add log file path
     cmd.append(str(log_path))
 
+    # Hand the process over to tail; Ctrl+C then goes straight to it
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        os.execvp(cmd[0], cmd)
+    except FileNotFoundError:
+        pass
+
     # Execute tail command
     try:
         subprocess.run(cmd)
     except KeyboardInterrupt:
-        # Clean exit on Ctrl+C (when following)
+        # Clean exit on Ctrl+C
         sys.exit(0)
     except Exception as e:
         click.echo(f"Error running tail: {e}", err=True)
@@ -178,14 +264,22 @@ def validate():
 )
 @click.option("-e", "--extension", default=".md", help="File extension to match (default: .md)")
 @click.option("--max-age", default=5, type=int, help="Maximum file age in minutes (default: 5)")
-def validate_new_file(directory: str, extension: str, max_age: int):
+@click.pass_context
+def validate_new_file(ctx: click.Context, directory: str, extension: str, max_age: int):
     """
     Validate that a new file was created.
 
     Checks git status for untracked/new files and file modification times
     to verify a new file matching the pattern was created.
     """
-    logger.info(f"Running new-file validation: dir={directory}, ext={extension}, max_age={max_age}")
+    from .common.logging_config import log_validation
+    from .validators import NewFileValidator
+
+    logger = _get_logger()
+
+    logger.info(
+        "Running new-file validation: dir=%s, ext=%s, max_age=%s", directory, extension, max_age
+    )
 
     validator = NewFileValidator(directory, extension, max_age)
     result = validator.validate()
@@ -198,7 +292,7 @@ def validate_new_file(directory: str, extension: str, max_age: int):
     )
 
     output_result(result)
-    sys.exit(result.exit_code)
+    ctx.exit(result.exit_code)
 
 
 @validate.command(name="contains")
@@ -213,16 +307,27 @@ def validate_new_file(directory: str, extension: str, max_age: int):
     help="Required string that must be in the file (can be used multiple times)",
 )
 @click.option("--max-age", default=5, type=int, help="Maximum file age in minutes (default: 5)")
-def validate_contains(directory: str, extension: str, contains: tuple, max_age: int):
+@click.pass_context
+def validate_contains(
+    ctx: click.Context, directory: str, extension: str, contains: tuple, max_age: int
+):
     """
     Validate that a file contains required content.
 
     Finds the newest file in the directory and checks that it contains
     all specified strings (case-sensitive).
     """
+    from .common.logging_config import log_validation
+    from .validators import FileContainsValidator
+
+    logger = _get_logger()
+
     logger.info(
-        f"Running contains validation: dir={directory}, ext={extension}, "
-        f"requires={list(contains)}, max_age={max_age}"
+        "Running contains validation: dir=%s, ext=%s, requires=%s, max_age=%s",
+        directory,
+        extension,
+        list(contains),
+        max_age,
     )
 
     validator = FileContainsValidator(directory, extension, list(contains), max_age)
@@ -236,7 +341,7 @@ def validate_contains(directory: str, extension: str, contains: tuple, max_age:
     )
 
     output_result(result)
-    sys.exit(result.exit_code)
+    ctx.exit(result.exit_code)
 
 
 @validate.command(name="ownership")
@@ -245,7 +350,8 @@ def validate_contains(directory: str, extension: str, contains: tuple, max_age:
 )
 @click.option("-e", "--extension", default=".md", help="File extension to match (default: .md)")
 @click.option("--max-age", default=5, type=int, help="Maximum file age in minutes (default: 5)")
-def validate_ownership(directory: str, extension: str, max_age: int):
+@click.pass_context
+def validate_ownership(ctx: click.Context, directory: str, extension: str, max_age: int):
     """
     Validate file ownership rules in task orchestration plans.
 
@@ -255,8 +361,13 @@ def validate_ownership(directory: str, extension: str, max_age: int):
     3. Parallel tasks with scoped MODIFY have non-overlapping scopes
     4. No task modifies files in its BOUNDARY list
     """
+    from .common.logging_config import log_validation
+    from .validators import FileOwnershipValidator
+
+    logger = _get_logger()
+
     logger.info(
-        f"Running ownership validation: dir={directory}, ext={extension}, max_age={max_age}"
+        "Running ownership validation: dir=%s, ext=%s, max_age=%s", directory, extension, max_age
     )
 
     validator = FileOwnershipValidator(directory, extension, max_age)
@@ -270,7 +381,7 @@ def validate_ownership(directory: str, extension: str, max_age: int):
     )
 
     output_result(result)
-    sys.exit(result.exit_code)
+    ctx.exit(result.exit_code)
 
 
 @validate.command(name="django")
@@ -290,7 +401,9 @@ def validate_ownership(directory: str, extension: str, max_age: int):
     default=80,
     help="Minimum coverage percentage (default: 80)",
 )
+@click.pass_context
 def validate_django(
+    ctx: click.Context,
     files: Optional[str],
     skip_mypy: bool,
     skip_ruff: bool,
@@ -313,9 +426,12 @@ def validate_django(
 
       forge validate django --coverage 90
     """
+    from .common.logging_config import log_validation
     from .validators import DjangoValidator
 
-    logger.info(f"Running Django validation: files={files or '.'}")
+    logger = _get_logger()
+
+    logger.info("Running Django validation: files=%s", files or ".")
 
     validator = DjangoValidator(
         files=files,
@@ -335,7 +451,7 @@ def validate_django(
     )
 
     output_result(result)
-    sys.exit(result.exit_code)
+    ctx.exit(result.exit_code)
 
 
 @validate.command(name="ruff")
@@ -346,7 +462,8 @@ def validate_django(
     help="Files or directory to validate (default: current directory)",
 )
 @click.option("--fix", is_flag=True, help="Automatically fix issues when possible")
-def validate_ruff(files: Optional[str], fix: bool):
+@click.pass_context
+def validate_ruff(ctx: click.Context, files: Optional[str], fix: bool):
     """
     Validate Python code with ruff linting.
 
@@ -360,9 +477,12 @@ def validate_ruff(files: Optional[str], fix: bool):
 
       forge validate ruff --fix
     """
+    from .common.logging_config import log_validation
     from .validators import RuffValidator
 
-    logger.info(f"Running ruff validation: files={files or '.'}, fix={fix}")
+    logger = _get_logger()
+
+    logger.info("Running ruff validation: files=%s, fix=%s", files or ".", fix)
 
     validator = RuffValidator(files=files, fix=fix)
     result = validator.validate()
@@ -375,7 +495,7 @@ def validate_ruff(files: Optional[str], fix: bool):
     )
 
     output_result(result)
-    sys.exit(result.exit_code)
+    ctx.exit(result.exit_code)
 
 
 @validate.command(name="ty")
@@ -386,7 +506,8 @@ def validate_ruff(files: Optional[str], fix: bool):
     help="Files or directory to validate (default: current directory)",
 )
 @click.option("--strict", is_flag=True, help="Use strict type checking mode")
-def validate_type(files: Optional[str], strict: bool):
+@click.pass_context
+def validate_type(ctx: click.Context, files: Optional[str], strict: bool):
     """
     Validate Python code with mypy type checking.
 
@@ -400,9 +521,12 @@ def validate_type(files: Optional[str], strict: bool):
 
       forge validate ty --strict
     """
+    from .common.logging_config import log_validation
     from .validators import TypeValidator
 
-    logger.info(f"Running type validation: files={files or '.'}, strict={strict}")
+    logger = _get_logger()
+
+    logger.info("Running type validation: files=%s, strict=%s", files or ".", strict)
 
     validator = TypeValidator(files=files, strict=strict)
     result = validator.validate()
@@ -415,7 +539,7 @@ def validate_type(files: Optional[str], strict: bool):
     )
 
     output_result(result)
-    sys.exit(result.exit_code)
+    ctx.exit(result.exit_code)
 
 
 # === YOUTUBE COMMAND ===
@@ -426,7 +550,8 @@ def validate_type(files: Optional[str], strict: bool):
 @click.option(
     "--output", "-o", type=click.Path(), default=".work/transcripts", help="Output directory"
 )
-def youtube(url: str, output: str) -> None:
+@click.pass_context
+def youtube(ctx: click.Context, url: str, output: str) -> None:
     """
     Fetch YouTube video transcript.
 
@@ -441,9 +566,14 @@ def youtube(url: str, output: str) -> None:
 
       forge youtube dQw4w9WgXcQ
     """
+    from pathlib import Path
+
+    from .common.logging_config import log_hook_execution
     from .utils.youtube import YouTubeFetcher
 
-    logger.info(f"Fetching YouTube transcript: url={url}, output={output}")
+    logger = _get_logger()
+
+    logger.info("Fetching YouTube transcript: url=%s, output=%s", url, output)
 
     fetcher = YouTubeFetcher()
 
@@ -451,7 +581,7 @@ def youtube(url: str, output: str) -> None:
     if not fetcher.check_dependency():
         fetcher.print_install_instructions()
         logger.error("YouTube dependency not installed")
-        sys.exit(1)
+        ctx.exit(1)
 
     # Extract video ID
     video_id = fetcher.extract_video_id(url)
@@ -461,8 +591,8 @@ def youtube(url: str, output: str) -> None:
         click.echo("  - https://www.youtube.com/watch?v=VIDEO_ID", err=True)
         click.echo("  - https://youtu.be/VIDEO_ID", err=True)
         click.echo("  - VIDEO_ID (11 characters)", err=True)
-        logger.error(f"Invalid YouTube URL: {url}")
-        sys.exit(1)
+        logger.error("Invalid YouTube URL: %s", url)
+        ctx.exit(1)
 
     click.echo(f"Fetching transcript for video: {video_id}", err=True)
 
@@ -470,24 +600,23 @@ def youtube(url: str, output: str) -> None:
     try:
         output_path = fetcher.save_transcript(url, Path(output))
         click.echo(f"Success! Transcript saved to: {output_path}", err=True)
-        logger.info(f"YouTube transcript saved: {output_path}")
+        logger.info("YouTube transcript saved: %s", output_path)
         log_hook_execution(
             hook_type="youtube",
             operation="fetch-transcript",
             success=True,
             details={"video_id": video_id, "output": str(output_path)},
         )
-        sys.exit(0)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
-        logger.error(f"Failed to fetch YouTube transcript: {e}")
+        logger.error("Failed to fetch YouTube transcript: %s", e)
         log_hook_execution(
             hook_type="youtube",
             operation="fetch-transcript",
             success=False,
             details={"video_id": video_id, "error": str(e)},
         )
-        sys.exit(1)
+        ctx.exit(1)
 
 
 # === FEEDBACK COMMANDS ===
@@ -508,52 +637,49 @@ def feedback_init(force: bool) -> None:
     manager = FeedbackManager()
 
     if manager.initialize(force=force):
-        click.echo(f"Learnings directory initialized at {manager.learnings_dir}")
-        click.echo("")
-        click.echo("Directory structure:")
-        click.echo(f"  {manager.learnings_dir}/")
-        click.echo("  ├── projects.json       # Registry of opted-in projects")
-        click.echo("  ├── stats.json          # Global feedback statistics")
-        click.echo("  ├── projects/           # Per-project feedback")
-        click.echo("  │   └── {project-slug}/")
-        click.echo("  │       └── feedback/")
-        click.echo("  │           ├── improvement/")
-        click.echo("  │           ├── skill-idea/")
-        click.echo("  │           ├── command-idea/")
-        click.echo("  │           ├── bug-report/")
-        click.echo("  │           └── pattern/")
-        click.echo("  ├── cross-project/      # Cross-project patterns")
-        click.echo("  └── synced/             # Archived after sync")
+        learnings_dir = manager.learnings_dir
+        click.echo(
+            f"Learnings directory initialized at {learnings_dir}\n"
+            "\n"
+            "Directory structure:\n"
+            f"  {learnings_dir}/\n" + _LEARNINGS_TREE
+        )
     else:
-        click.echo(f"Learnings directory already exists at {manager.learnings_dir}")
-        click.echo("Use --force to reinitialize")
+        click.echo(
+            f"Learnings directory already exists at {manager.learnings_dir}\n"
+            "Use --force to reinitialize"
+        )
 
 
 @feedback.command("save")
-def feedback_save() -> None:
+@click.pass_context
+def feedback_save(ctx: click.Context) -> None:
     """Save feedback from stdin (used by hooks)."""
+    from .common.logging_config import log_hook_execution
     from .feedback import FeedbackManager
 
+    logger = _get_logger()
+
     manager = FeedbackManager()
 
     # Parse input from stdin
     try:
-        raw_input = sys.stdin.read()
+        raw_input = click.get_binary_stream("stdin").read()
         if not raw_input.strip():
             click.echo("No input received", err=True)
             logger.warning("Feedback save called with no input")
-            sys.exit(0)
-        feedback_data = json.loads(raw_input)
+            ctx.exit(0)
+        feedback_data = _loads_json(raw_input)
     except json.JSONDecodeError as e:
         click.echo(f"Failed to parse input JSON: {e}", err=True)
-        logger.error(f"Invalid JSON in feedback input: {e}")
-        sys.exit(1)
+        logger.error("Invalid JSON in feedback input: %s", e)
+        ctx.exit(1)
 
     # Check for stop_hook_active to prevent loops
     if feedback_data.get("stop_hook_active"):
         click.echo("Stop hook already active, skipping to prevent loop", err=True)
         logger.warning("Feedback save skipped: stop_hook_active=true")
-        sys.exit(0)
+        ctx.exit(0)
 
     # Save feedback
     logger.info("Saving feedback from hook")
@@ -561,7 +687,7 @@ def feedback_save() -> None:
 
     if saved_count > 0:
         click.echo(f"Saved {saved_count} feedback items", err=True)
-        logger.info(f"Saved {saved_count} feedback items")
+        logger.info("Saved %d feedback items", saved_count)
         log_hook_execution(
             hook_type="feedback",
             operation="save",
@@ -585,26 +711,37 @@ def feedback_save() -> None:
 )
 def feedback_list(project: Optional[str], feedback_type: Optional[str], output_format: str) -> None:
     """List feedback items."""
+    import textwrap
+
     from .feedback import FeedbackManager
 
     manager = FeedbackManager()
-    items = manager.list_feedback(project=project, feedback_type=feedback_type)
+    items = manager.iter_feedback(project=project, feedback_type=feedback_type)
 
+    # Items are printed as they are read rather than collected first
     if output_format == "json":
-        click.echo(json.dumps(items, indent=2))
+        # Same layout as json.dumps(list_of_items, indent=2), one item at a time
+        separator = "[\n"
+        for item in items:
+            click.echo(separator + textwrap.indent(json.dumps(item, indent=2), "  "), nl=False)
+            separator = ",\n"
+        click.echo("[]" if separator == "[\n" else "\n]")
     else:
-        if not items:
-            click.echo("No feedback items found")
-            return
-
-        click.echo(f"Found {len(items)} feedback items:\n")
+        count = 0
         for item in items:
-            click.echo(f"  [{item['type']}] {item.get('title', 'Untitled')}")
-            click.echo(f"    Project: {item['project']}")
-            click.echo(f"    Status: {item.get('status', 'unknown')}")
-            click.echo(f"    Captured: {item.get('captured', 'unknown')}")
-            click.echo(f"    File: {item['file']}")
-            click.echo("")
+            count += 1
+            click.echo(
+                f"  [{item['type']}] {item.get('title', 'Untitled')}\n"
+                f"    Project: {item['project']}\n"
+                f"    Status: {item.get('status', 'unknown')}\n"
+                f"    Captured: {item.get('captured', 'unknown')}\n"
+                f"    File: {item['file']}\n"
+            )
+
+        if count:
+            click.echo(f"Found {count} feedback items")
+        else:
+            click.echo("No feedback items found")
 
 
 @feedback.command("stats")
@@ -617,6 +754,8 @@ def feedback_list(project: Optional[str], feedback_type: Optional[str], output_f
 )
 def feedback_stats(output_format: str) -> None:
     """Show feedback statistics."""
+    from pathlib import Path
+
     from .feedback import FeedbackStats
 
     learnings_dir = Path.home() / ".claude" / "learnings"
@@ -625,17 +764,7 @@ def feedback_stats(output_format: str) -> None:
     stats = FeedbackStats.load(stats_file)
 
     if output_format == "json":
-        click.echo(
-            json.dumps(
-                {
-                    "total": stats.total,
-                    "by_type": stats.by_type,
-                    "by_project": stats.by_project,
-                    "last_updated": stats.last_updated,
-                },
-                indent=2,
-            )
-        )
+        click.echo(stats.to_json())
     else:
         click.echo("Feedback Statistics")
         click.echo("=" * 40)
@@ -671,21 +800,24 @@ def session():
 @session.command("save")
 def session_save() -> None:
     """Save session from stdin (used by hooks)."""
+    from .common.logging_config import log_hook_execution
     from .session import SessionManager
 
+    logger = _get_logger()
+
     manager = SessionManager()
 
     # Parse input from stdin
     try:
-        raw_input = sys.stdin.read()
+        raw_input = click.get_binary_stream("stdin").read()
         if not raw_input.strip():
             click.echo("No input received", err=True)
             logger.warning("Session save called with no input")
             sys.exit(0)
-        session_data = json.loads(raw_input)
+        session_data = _loads_json(raw_input)
     except json.JSONDecodeError as e:
         click.echo(f"Failed to parse input JSON: {e}", err=True)
-        logger.error(f"Invalid JSON in session input: {e}")
+        logger.error("Invalid JSON in session input: %s", e)
         sys.exit(1)
 
     # Check for stop_hook_active to prevent loops
@@ -700,7 +832,7 @@ def session_save() -> None:
 
     if filepath:
         click.echo(f"Session saved: {filepath.name}", err=True)
-        logger.info(f"Session saved: {filepath}")
+        logger.info("Session saved: %s", filepath)
         log_hook_execution(
             hook_type="session",
             operation="save",
@@ -786,6 +918,8 @@ def session_view(session_file: str) -> None:
 )
 def session_stats(output_format: str) -> None:
     """Show session statistics."""
+    from pathlib import Path
+
     from .session import SessionStats
 
     learnings_dir = Path.home() / ".claude" / "learnings"
@@ -990,7 +1124,7 @@ def webhook_init(skip_deps: bool, skip_shell: bool, force: bool):
 
     except Exception as e:
         click.echo(f"Error during installation: {e}", err=True)
-        logger.error(f"Webhook installation failed: {e}")
+        _get_logger().error("Webhook installation failed: %s", e)
         sys.exit(1)
 
 
@@ -1287,9 +1421,12 @@ def browser_capture(
 
       forge browser-capture --network --exclude-static
     """
+    from .common.logging_config import log_hook_execution
     from .utils.browser_capture import BrowserLogCapture
 
-    logger.info(f"Starting browser log capture: page={page}, output={output}")
+    logger = _get_logger()
+
+    logger.info("Starting browser log capture: page=%s, output=%s", page, output)
 
     try:
         # Initialize capture manager
@@ -1329,7 +1466,7 @@ def browser_capture(
 
         click.echo(f"\n💡 Use browser-debug skill for automated analysis")
 
-        logger.info(f"Browser log capture completed: {session_dir}")
+        logger.info("Browser log capture completed: %s", session_dir)
         log_hook_execution(
             hook_type="browser-capture",
             operation="capture-logs",
@@ -1340,7 +1477,7 @@ def browser_capture(
 
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
-        logger.error(f"Browser log capture failed: {e}")
+        logger.error("Browser log capture failed: %s", e)
         log_hook_execution(
             hook_type="browser-capture",
             operation="capture-logs",
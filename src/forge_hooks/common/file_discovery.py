@@ -1,6 +1,7 @@
 """File discovery utilities for finding recent and new files."""
 
 import logging
+import os
 import time
 from pathlib import Path
 from typing import Optional
@@ -22,28 +23,30 @@ def get_recent_files(directory: str, extension: str, max_age_minutes: int) -> li
     Returns:
         List of file paths matching criteria.
     """
-    target_dir = Path(directory)
-    if not target_dir.exists():
-        logger.warning(f"Directory does not exist: {directory}")
-        return []
-
-    recent = []
-    now = time.time()
-    max_age_seconds = max_age_minutes * 60
-
     # Handle extension with or without leading dot
     ext = extension if extension.startswith(".") else f".{extension}"
-    pattern = f"*{ext}"
+    cutoff = time.time() - max_age_minutes * 60
 
-    for filepath in target_dir.glob(pattern):
-        try:
-            mtime = filepath.stat().st_mtime
-            age = now - mtime
-            if age <= max_age_seconds:
-                recent.append(str(filepath))
-        except OSError as e:
-            logger.warning(f"Failed to stat file {filepath}: {e}")
-            continue
+    # DirEntry caches d_type and stat results, so each entry costs at most one stat()
+    recent = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(ext) or not entry.is_file():
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError as e:
+                    logger.warning(f"Failed to stat file {entry.path}: {e}")
+                    continue
+                if mtime >= cutoff:
+                    recent.append(str(Path(directory) / entry.name))
+    except FileNotFoundError:
+        logger.warning(f"Directory does not exist: {directory}")
+        return []
+    except OSError as e:
+        logger.warning(f"Failed to scan directory {directory}: {e}")
+        return []
 
     logger.info(f"Recent files in {directory}: {len(recent)} files")
     return recent
@@ -53,8 +56,9 @@ def find_newest_file(directory: str, extension: str, max_age_minutes: int) -> Op
     """
     Find the most recently created/modified file in directory.
 
-    Combines git untracked files and recently modified files, then returns
-    the one with the newest modification time.
+    A single scandir pass tracks the newest recent file with the extension,
+    which is then compared against git untracked files. Git also reports
+    untracked files in subdirectories, so it is always consulted.
 
     Args:
         directory: Directory to check for files.
@@ -64,34 +68,44 @@ def find_newest_file(directory: str, extension: str, max_age_minutes: int) -> Op
     Returns:
         Path to the newest file, or None if no recent files found.
     """
-    # Check git for untracked/new files
-    git_new = get_git_untracked_files(directory, extension)
-
-    # Check for recently modified files
-    recent_files = get_recent_files(directory, extension, max_age_minutes)
-
-    # Combine and deduplicate
-    all_files = list(set(git_new + recent_files))
-
-    if not all_files:
-        logger.info(f"No files found in {directory} with extension {extension}")
-        return None
+    # Handle extension with or without leading dot
+    ext = extension if extension.startswith(".") else f".{extension}"
+    cutoff = time.time() - max_age_minutes * 60
+
+    newest_name = None
+    newest_mtime = 0.0
+
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(ext) or not entry.is_file():
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError as e:
+                    logger.warning(f"Failed to stat file {entry.path}: {e}")
+                    continue
+                if mtime >= cutoff and mtime > newest_mtime:
+                    newest_mtime = mtime
+                    newest_name = entry.name
+    except OSError as e:
+        logger.warning(f"Failed to scan directory {directory}: {e}")
 
-    # Find the newest file by modification time
-    newest = None
-    newest_mtime = 0
+    newest = None if newest_name is None else str(Path(directory) / newest_name)
 
-    for filepath in all_files:
+    # Merge in git untracked files, which may be older or in subdirectories
+    for filepath in get_git_untracked_files(directory, extension):
         try:
-            path = Path(filepath)
-            if path.exists():
-                mtime = path.stat().st_mtime
-                if mtime > newest_mtime:
-                    newest_mtime = mtime
-                    newest = str(path)
+            mtime = Path(filepath).stat().st_mtime
         except OSError as e:
             logger.warning(f"Failed to stat file {filepath}: {e}")
             continue
+        if mtime > newest_mtime:
+            newest_mtime = mtime
+            newest = str(Path(filepath))
 
-    logger.info(f"Newest file: {newest}")
+    if newest is None:
+        logger.info(f"No files found in {directory} with extension {extension}")
+    else:
+        logger.info(f"Newest file: {newest}")
     return newest
@@ -131,17 +131,27 @@ def log_hook_execution(
         details: Additional details to log
     """
     logger = get_logger("forge_hooks.audit")
-
-    status = "SUCCESS" if success else "FAILURE"
-    message = f"Hook execution: {hook_type}.{operation} - {status}"
+    level = logging.INFO if success else logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
 
     if details:
-        message += f" | Details: {details}"
-
-    if success:
-        logger.info(message)
+        logger.log(
+            level,
+            "Hook execution: %s.%s - %s | Details: %s",
+            hook_type,
+            operation,
+            "SUCCESS" if success else "FAILURE",
+            details,
+        )
     else:
-        logger.error(message)
+        logger.log(
+            level,
+            "Hook execution: %s.%s - %s",
+            hook_type,
+            operation,
+            "SUCCESS" if success else "FAILURE",
+        )
 
 
 def log_validation(
@@ -160,17 +170,19 @@ def log_validation(
         files: Files involved in validation
     """
     logger = get_logger("forge_hooks.audit")
+    level = logging.INFO if passed else logging.WARNING
+    if not logger.isEnabledFor(level):
+        return
 
-    status = "PASSED" if passed else "FAILED"
-    message = f"Validation: {validator} - {status}"
+    fmt = "Validation: %s - %s"
+    args: list = [validator, "PASSED" if passed else "FAILED"]
 
     if files:
-        message += f" | Files: {', '.join(files)}"
+        fmt += " | Files: %s"
+        args.append(", ".join(files))
 
     if reason:
-        message += f" | Reason: {reason}"
+        fmt += " | Reason: %s"
+        args.append(reason)
 
-    if passed:
-        logger.info(message)
-    else:
-        logger.warning(message)
+    logger.log(level, fmt, *args)
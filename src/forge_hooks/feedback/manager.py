@@ -4,6 +4,7 @@ import json
 import os
 import re
 import subprocess
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -108,23 +109,26 @@ class FeedbackManager:
         slug = slug.strip("-")
         return slug or "unknown-project"
 
-    def register_project(self, cwd: str) -> str:
+    def register_project(self, cwd: str, projects: Optional[dict[str, Any]] = None) -> str:
         """
         Register a project if not already registered.
 
         Args:
             cwd: Project directory
+            projects: Already loaded projects.json data to update in place
+                (default: read it from disk)
 
         Returns:
             Project slug
         """
         slug = self.get_project_slug(cwd)
 
-        # Ensure directory exists
-        if not self.projects_file.exists():
-            self.initialize()
+        if projects is None:
+            # Ensure directory exists
+            if not self.projects_file.exists():
+                self.initialize()
 
-        projects = json.loads(self.projects_file.read_text())
+            projects = json.loads(self.projects_file.read_text())
 
         if slug not in projects["projects"]:
             projects["projects"][slug] = {
@@ -138,7 +142,12 @@ class FeedbackManager:
         return slug
 
     def save_feedback_item(
-        self, item: dict[str, Any], project_slug: str, session_id: str, cwd: str
+        self,
+        item: dict[str, Any],
+        project_slug: str,
+        session_id: str,
+        cwd: str,
+        project_info: Optional[dict[str, Any]] = None,
     ) -> Optional[Path]:
         """
         Save a single feedback item to the appropriate directory.
@@ -148,6 +157,7 @@ class FeedbackManager:
             project_slug: Project identifier
             session_id: Session identifier
             cwd: Current working directory
+            project_info: The project's projects.json entry (default: read it from disk)
 
         Returns:
             Path to saved feedback file, or None if failed
@@ -171,8 +181,9 @@ class FeedbackManager:
         filepath = feedback_dir / filename
 
         # Get project info
-        projects = json.loads(self.projects_file.read_text())
-        project_info = projects["projects"].get(project_slug, {})
+        if project_info is None:
+            projects = json.loads(self.projects_file.read_text())
+            project_info = projects["projects"].get(project_slug, {})
 
         # Build the markdown content
         content = f"""---
@@ -217,15 +228,19 @@ target: {target}
         if not self.learnings_dir.exists():
             self.initialize()
 
+        # Load projects.json once for registration, every item and the count update
+        projects = json.loads(self.projects_file.read_text())
+
         # Register project
-        project_slug = self.register_project(cwd)
+        project_slug = self.register_project(cwd, projects)
+        project_info = projects["projects"][project_slug]
 
         # Save each feedback item
         saved_count = 0
         for item in feedback_items:
             if not isinstance(item, dict):
                 continue
-            filepath = self.save_feedback_item(item, project_slug, session_id, cwd)
+            filepath = self.save_feedback_item(item, project_slug, session_id, cwd, project_info)
             if filepath:
                 saved_count += 1
 
@@ -239,12 +254,8 @@ target: {target}
             stats.save(self.stats_file)
 
             # Update project feedback count
-            projects = json.loads(self.projects_file.read_text())
-            if project_slug in projects["projects"]:
-                projects["projects"][project_slug]["feedback_count"] = stats.by_project.get(
-                    project_slug, 0
-                )
-                self.projects_file.write_text(json.dumps(projects, indent=2))
+            project_info["feedback_count"] = stats.by_project.get(project_slug, 0)
+            self.projects_file.write_text(json.dumps(projects, indent=2))
 
         return saved_count
 
@@ -288,24 +299,22 @@ target: {target}
 
         return []
 
-    def list_feedback(
+    def iter_feedback(
         self, project: Optional[str] = None, feedback_type: Optional[str] = None
-    ) -> list[dict[str, Any]]:
+    ) -> Iterator[dict[str, Any]]:
         """
-        List feedback items with optional filters.
+        Yield feedback items with optional filters as they are read.
 
         Args:
             project: Filter by project slug
             feedback_type: Filter by feedback type
 
-        Returns:
-            List of feedback items with metadata
+        Yields:
+            Feedback items with metadata
         """
-        feedback_items = []
-
         projects_dir = self.learnings_dir / "projects"
         if not projects_dir.exists():
-            return feedback_items
+            return
 
         # Iterate through projects
         for project_dir in projects_dir.iterdir():
@@ -333,26 +342,37 @@ target: {target}
                 for feedback_file in type_dir.glob("*.md"):
                     try:
                         content = feedback_file.read_text()
-                        # Extract frontmatter
-                        if content.startswith("---"):
-                            parts = content.split("---", 2)
-                            if len(parts) >= 3:
-                                # Parse YAML-like frontmatter (simple key: value)
-                                frontmatter = {}
-                                for line in parts[1].strip().split("\n"):
-                                    if ":" in line:
-                                        key, value = line.split(":", 1)
-                                        frontmatter[key.strip()] = value.strip()
-
-                                feedback_items.append(
-                                    {
-                                        "file": str(feedback_file),
-                                        "project": project_dir.name,
-                                        "type": type_dir.name,
-                                        **frontmatter,
-                                    }
-                                )
                     except Exception:
                         continue
+                    # Extract frontmatter
+                    if content.startswith("---"):
+                        parts = content.split("---", 2)
+                        if len(parts) >= 3:
+                            # Parse YAML-like frontmatter (simple key: value)
+                            frontmatter = {}
+                            for line in parts[1].strip().split("\n"):
+                                if ":" in line:
+                                    key, value = line.split(":", 1)
+                                    frontmatter[key.strip()] = value.strip()
+
+                            yield {
+                                "file": str(feedback_file),
+                                "project": project_dir.name,
+                                "type": type_dir.name,
+                                **frontmatter,
+                            }
+
+    def list_feedback(
+        self, project: Optional[str] = None, feedback_type: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """
+        List feedback items with optional filters.
 
-        return feedback_items
+        Args:
+            project: Filter by project slug
+            feedback_type: Filter by feedback type
+
+        Returns:
+            List of feedback items with metadata
+        """
+        return list(self.iter_feedback(project=project, feedback_type=feedback_type))
@@ -61,6 +61,25 @@ class FeedbackStats:
         }
         stats_file.write_text(json.dumps(data, indent=2))
 
+    def to_json(self) -> bytes:
+        """
+        Serialize the stats for display, using orjson when it is installed.
+
+        Returns:
+            UTF-8 encoded JSON, indented by two spaces
+        """
+        data = {
+            "total": self.total,
+            "by_type": self.by_type,
+            "by_project": self.by_project,
+            "last_updated": self.last_updated,
+        }
+        try:
+            import orjson
+        except ImportError:
+            return json.dumps(data, indent=2).encode()
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
     def update(self, feedback_type: str, project: str) -> None:
         """
         Update stats with new feedback.
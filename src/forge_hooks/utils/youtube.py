@@ -24,6 +24,10 @@ except ImportError:
     CouldNotRetrieveTranscript = Exception
 
 
+_VIDEO_ID_RE = re.compile(r"[a-zA-Z0-9_-]{11}")
+_URL_VIDEO_ID_RE = re.compile(r"(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})")
+
+
 class YouTubeFetcher:
     """Fetches transcripts from YouTube videos."""
 
@@ -59,22 +63,14 @@ class YouTubeFetcher:
         Returns:
             Video ID if found, None otherwise
         """
-        # Pattern for youtube.com URLs
-        watch_pattern = r"(?:youtube\.com/watch\?v=)([a-zA-Z0-9_-]{11})"
-        match = re.search(watch_pattern, url)
-        if match:
-            return match.group(1)
+        # A bare video ID needs no URL parsing
+        if len(url) == 11 and _VIDEO_ID_RE.fullmatch(url):
+            return url
 
-        # Pattern for youtu.be URLs
-        short_pattern = r"(?:youtu\.be/)([a-zA-Z0-9_-]{11})"
-        match = re.search(short_pattern, url)
+        match = _URL_VIDEO_ID_RE.search(url)
         if match:
             return match.group(1)
 
-        # If it looks like a video ID directly (11 characters)
-        if re.match(r"^[a-zA-Z0-9_-]{11}$", url):
-            return url
-
         return None
 
     def format_timestamp(self, seconds: float) -> str:
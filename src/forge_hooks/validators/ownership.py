@@ -1,8 +1,10 @@
 """Validator for file ownership rules in task orchestration plans."""
 
 import re
+from collections import defaultdict
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from ..common.file_discovery import find_newest_file
 from ..common.hook_io import HookResult
@@ -21,6 +23,121 @@ OWNERSHIP_CONFLICT_ERROR = (
     "and no task modifies files in its BOUNDARY list."
 )
 
+# Task section parsing: anchored per-line patterns, no DOTALL scanning
+TASK_ID_RE = re.compile(r"\*\*Task ID:\*\* (task-\d+)")
+WAVE_RE = re.compile(r"\*\*Wave:\*\* (\d+|W\d+)")
+# Plain-text markers checked before running the regexes above on a line
+TASK_ID_MARKER = "**Task ID:**"
+WAVE_MARKER = "**Wave:**"
+OWNERSHIP_MARKER = "**File Ownership:**"
+OWNERSHIP_PREFIXES = (("- CREATE:", "create"), ("- MODIFY:", "modify"), ("- BOUNDARY:", "boundary"))
+
+# File Ownership section states within a task
+OUTSIDE_OWNERSHIP, IN_OWNERSHIP, AFTER_OWNERSHIP = range(3)
+
+
+class TaskOwnership(NamedTuple):
+    """Wave and file ownership lists parsed from one task section."""
+
+    wave: int
+    create: list[str]
+    modify: list[str]
+    boundary: list[str]
+
+
+def _iter_task_blocks(lines: list[str]) -> Iterator[list[str]]:
+    """Yield the lines of each ###/#### section, heading line included."""
+    block = None
+    for line in lines:
+        if line.startswith("###"):
+            if block is not None:
+                yield block
+            block = [line]
+        elif block is not None:
+            block.append(line)
+    if block is not None:
+        yield block
+
+
+def _split_file_list(text: str) -> list[str]:
+    """Split a comma-separated ownership value; '-' or empty means none."""
+    text = text.strip()
+    if not text or text == "-":
+        return []
+    return [f.strip() for f in text.split(",") if f.strip()]
+
+
+def _parse_task_block(block: list[str]) -> Optional[tuple[str, TaskOwnership]]:
+    """
+    Parse one task section line by line.
+
+    Args:
+        block: Lines of a ###/#### section, heading included.
+
+    Returns:
+        Tuple of (task_id, TaskOwnership), or None when the
+        section has no Task ID followed by a Wave.
+    """
+    task_id = None
+    wave_str = None
+    values: dict[str, list[str]] = {}
+    current = None  # ownership key whose value is being continued
+    ownership = OUTSIDE_OWNERSHIP
+
+    for line in block:
+        if task_id is None and line.startswith(TASK_ID_MARKER):
+            match = TASK_ID_RE.match(line)
+            if match:
+                task_id = match.group(1)
+        if task_id is not None and wave_str is None and WAVE_MARKER in line:
+            match = WAVE_RE.search(line)
+            if match:
+                wave_str = match.group(1)
+
+        if ownership == OUTSIDE_OWNERSHIP:
+            idx = line.find(OWNERSHIP_MARKER)
+            if idx == -1:
+                continue
+            ownership = IN_OWNERSHIP
+            line = line[idx + len(OWNERSHIP_MARKER) :]
+        elif ownership == IN_OWNERSHIP:
+            # Only the first File Ownership section counts; the next **Field** ends it
+            if line.startswith("**") and line[2:3].isupper():
+                ownership = AFTER_OWNERSHIP
+                continue
+        elif wave_str is not None:
+            break  # ID, wave and ownership all read; the rest of the section is prose
+        else:
+            continue
+
+        stripped = line.strip()
+        for prefix, key in OWNERSHIP_PREFIXES:
+            if stripped.startswith(prefix):
+                current = key if key not in values else None
+                if current is not None:
+                    values[key] = [stripped[len(prefix) :]]
+                break
+        else:
+            if stripped.startswith(("-", "**")):
+                current = None
+            elif current is not None:
+                values[current].append(stripped)
+
+    if task_id is None or wave_str is None:
+        return None
+
+    try:
+        wave = int(wave_str.replace("W", ""))  # Handle both "1" and "W1"
+    except ValueError:
+        wave = 0
+
+    return task_id, TaskOwnership(
+        wave=wave,
+        create=_split_file_list("\n".join(values.get("create", []))),
+        modify=_split_file_list("\n".join(values.get("modify", []))),
+        boundary=_split_file_list("\n".join(values.get("boundary", []))),
+    )
+
 
 def parse_scope(file_str: str) -> tuple[str, Optional[str]]:
     """
@@ -37,10 +154,8 @@ def parse_scope(file_str: str) -> tuple[str, Optional[str]]:
         "file.py::ClassName" -> ("file.py", "ClassName")
         "file.py::ClassName.method" -> ("file.py", "ClassName.method")
     """
-    if "::" in file_str:
-        parts = file_str.split("::", 1)
-        return parts[0].strip(), parts[1].strip()
-    return file_str.strip(), None
+    filename, sep, scope = file_str.partition("::")
+    return filename.strip(), (scope.strip() if sep else None)
 
 
 def scopes_overlap(scope1: Optional[str], scope2: Optional[str]) -> bool:
@@ -73,84 +188,78 @@ def scopes_overlap(scope1: Optional[str], scope2: Optional[str]) -> bool:
     return False
 
 
+def _overlapping_pairs(modifiers: list[tuple[str, Optional[str]]]) -> list[tuple[int, int]]:
+    """
+    Find every pair of (task_id, scope) modifiers whose scopes overlap.
+
+    Unscoped entries overlap everything. Scoped entries are sorted by their
+    dotted parts so each scope directly follows its ancestors, and a stack of
+    the current ancestor chain yields the nested pairs without comparing
+    unrelated scopes.
+
+    Args:
+        modifiers: (task_id, scope) entries for one file within one wave.
+
+    Returns:
+        Sorted (i, j) index pairs with i < j, in the same order a pairwise
+        scan would report them.
+    """
+    pairs: list[tuple[int, int]] = []
+    unscoped: set[int] = set()
+    scoped: list[tuple[int, str]] = []
+    for i, (_, scope) in enumerate(modifiers):
+        if scope is None:
+            unscoped.add(i)
+        else:
+            scoped.append((i, scope))
+
+    for i in unscoped:
+        for j in range(len(modifiers)):
+            if j != i and not (j in unscoped and j < i):
+                pairs.append((min(i, j), max(i, j)))
+
+    scoped.sort(key=lambda entry: entry[1].split("."))
+    # (index, scope, scope + ".") for each scope containing the current one; this
+    # is the root-to-node path a trie over the dotted parts would walk
+    chain: list[tuple[int, str, str]] = []
+    for i, scope in scoped:
+        while chain and not (scope == chain[-1][1] or scope.startswith(chain[-1][2])):
+            chain.pop()
+        pairs.extend((min(i, j), max(i, j)) for j, _, _ in chain)
+        chain.append((i, scope, scope + "."))
+
+    pairs.sort()
+    return pairs
+
+
 class FileOwnershipValidator(BaseValidator):
     """Validates file ownership rules in task orchestration plans."""
 
-    def _parse_task_metadata(self, content: str) -> dict[str, dict]:
+    def _parse_task_metadata(self, content: str) -> dict[str, TaskOwnership]:
         """
         Parse task sections to extract Wave numbers and file ownership.
 
+        Single pass over the lines: each ###/#### heading starts a section, and
+        values continue onto following lines until the next "-" item.
+
         Args:
             content: Plan file content.
 
         Returns:
-            Dict mapping task_id -> {wave, create, modify, boundary}.
+            Dict mapping task_id -> TaskOwnership.
         """
         tasks = {}
 
-        # Find all task sections
-        # Pattern: #### or ### followed by Task ID
-        task_pattern = r"###[#]?\s+.*?\n\*\*Task ID:\*\* (task-\d+).*?\*\*Wave:\*\* (\d+|W\d+).*?(?=###[#]?|\Z)"
-        matches = re.finditer(task_pattern, content, re.DOTALL)
-
-        for match in matches:
-            task_id = match.group(1)
-            wave_str = match.group(2).replace("W", "")  # Handle both "1" and "W1"
-            task_content = match.group(0)
-
-            # Extract File Ownership section
-            create_files = []
-            modify_files = []
-            boundary_files = []
-
-            ownership_pattern = r"\*\*File Ownership:\*\*(.*?)(?=\n\*\*[A-Z]|\Z)"
-            ownership_match = re.search(ownership_pattern, task_content, re.DOTALL)
-            if ownership_match:
-                ownership_text = ownership_match.group(1)
-
-                # Parse CREATE
-                create_match = re.search(
-                    r"- CREATE:\s*(.*?)(?=\n\s*-|\Z)", ownership_text, re.DOTALL
-                )
-                if create_match:
-                    create_text = create_match.group(1).strip()
-                    if create_text and create_text != "-":
-                        create_files = [f.strip() for f in create_text.split(",") if f.strip()]
-
-                # Parse MODIFY
-                modify_match = re.search(
-                    r"- MODIFY:\s*(.*?)(?=\n\s*-|\Z)", ownership_text, re.DOTALL
-                )
-                if modify_match:
-                    modify_text = modify_match.group(1).strip()
-                    if modify_text and modify_text != "-":
-                        modify_files = [f.strip() for f in modify_text.split(",") if f.strip()]
-
-                # Parse BOUNDARY
-                boundary_match = re.search(
-                    r"- BOUNDARY:\s*(.*?)(?=\n\s*-|\n\*\*|\Z)", ownership_text, re.DOTALL
-                )
-                if boundary_match:
-                    boundary_text = boundary_match.group(1).strip()
-                    if boundary_text and boundary_text != "-":
-                        boundary_files = [f.strip() for f in boundary_text.split(",") if f.strip()]
-
-            try:
-                wave = int(wave_str)
-            except ValueError:
-                wave = 0
-
-            tasks[task_id] = {
-                "wave": wave,
-                "create": create_files,
-                "modify": modify_files,
-                "boundary": boundary_files,
-            }
+        for block in _iter_task_blocks(content.splitlines()):
+            parsed = _parse_task_block(block)
+            if parsed is not None:
+                task_id, task = parsed
+                tasks[task_id] = task
 
         self.logger.info(f"Parsed {len(tasks)} tasks from plan")
         return tasks
 
-    def _validate_ownership_rules(self, tasks: dict[str, dict]) -> tuple[bool, list[str]]:
+    def _validate_ownership_rules(self, tasks: dict[str, TaskOwnership]) -> tuple[bool, list[str]]:
         """
         Validate the four ownership rules.
 
@@ -161,48 +270,53 @@ class FileOwnershipValidator(BaseValidator):
         4. No task modifies files in its BOUNDARY list
 
         Args:
-            tasks: Dict mapping task_id -> task metadata.
+            tasks: Dict mapping task_id -> TaskOwnership.
 
         Returns:
             Tuple of (success, list of conflict messages).
         """
         conflicts = []
 
-        # Rule 1: Each file appears in CREATE for at most ONE task (across all waves)
-        create_map = {}  # file -> list of task_ids that CREATE it
+        # One pass over the tasks: parse every file::scope entry once, collect
+        # CREATE owners and wave membership, and check Rule 4 while the task's
+        # MODIFY filenames are at hand
+        create_map = defaultdict(list)  # file -> list of task_ids that CREATE it
+        waves = defaultdict(list)  # wave -> list of task_ids
+        modify_scopes = {}  # task_id -> list of (filename, scope) it MODIFYs
+        boundary_conflicts = []
         for task_id, task_data in tasks.items():
-            for file in task_data["create"]:
-                filename, _ = parse_scope(file)
-                if filename not in create_map:
-                    create_map[filename] = []
+            for filename in dict.fromkeys(parse_scope(f)[0] for f in task_data.create):
                 create_map[filename].append(task_id)
 
+            waves[task_data.wave].append(task_id)
+
+            modify_scopes[task_id] = [parse_scope(f) for f in task_data.modify]
+
+            # Rule 4: No task modifies files in its BOUNDARY list
+            if task_data.boundary:
+                boundary_files = {parse_scope(f)[0] for f in task_data.boundary}
+                violations = {filename for filename, _ in modify_scopes[task_id]} & boundary_files
+                if violations:
+                    boundary_conflicts.append(
+                        f"Rule 4 violation: Task {task_id} modifies files in its BOUNDARY: {', '.join(violations)}"
+                    )
+
+        # Rule 1: Each file appears in CREATE for at most ONE task (across all waves)
         for file, task_ids in create_map.items():
             if len(task_ids) > 1:
                 conflicts.append(
                     f"Rule 1 violation: File '{file}' is CREATEd by multiple tasks: {', '.join(task_ids)}"
                 )
 
-        # Group tasks by wave for Rules 2 and 3
-        waves = {}  # wave -> list of task_ids
-        for task_id, task_data in tasks.items():
-            wave = task_data["wave"]
-            if wave not in waves:
-                waves[wave] = []
-            waves[wave].append(task_id)
-
         # Rules 2 & 3: Check parallel tasks (same wave) for MODIFY conflicts
         for wave, task_ids in waves.items():
             if len(task_ids) < 2:
                 continue  # No conflicts possible with single task
 
             # Build modify map for this wave: file -> list of (task_id, scope)
-            modify_map = {}
+            modify_map = defaultdict(list)
             for task_id in task_ids:
-                for file_str in tasks[task_id]["modify"]:
-                    filename, scope = parse_scope(file_str)
-                    if filename not in modify_map:
-                        modify_map[filename] = []
+                for filename, scope in modify_scopes[task_id]:
                     modify_map[filename].append((task_id, scope))
 
             # Check for conflicts
@@ -210,31 +324,18 @@ class FileOwnershipValidator(BaseValidator):
                 if len(modifiers) < 2:
                     continue
 
-                # Check all pairs for scope overlap
-                for i in range(len(modifiers)):
-                    for j in range(i + 1, len(modifiers)):
-                        task1, scope1 = modifiers[i]
-                        task2, scope2 = modifiers[j]
-
-                        if scopes_overlap(scope1, scope2):
-                            scope1_str = f"::{scope1}" if scope1 else " (unscoped)"
-                            scope2_str = f"::{scope2}" if scope2 else " (unscoped)"
-                            conflicts.append(
-                                f"Rule 2/3 violation: Tasks {task1} and {task2} in Wave {wave} "
-                                f"both MODIFY '{filename}' with overlapping scopes: "
-                                f"{scope1_str} vs {scope2_str}"
-                            )
-
-        # Rule 4: No task modifies files in its BOUNDARY list
-        for task_id, task_data in tasks.items():
-            modify_files = {parse_scope(f)[0] for f in task_data["modify"]}
-            boundary_files = {parse_scope(f)[0] for f in task_data["boundary"]}
-
-            violations = modify_files & boundary_files
-            if violations:
-                conflicts.append(
-                    f"Rule 4 violation: Task {task_id} modifies files in its BOUNDARY: {', '.join(violations)}"
-                )
+                for i, j in _overlapping_pairs(modifiers):
+                    task1, scope1 = modifiers[i]
+                    task2, scope2 = modifiers[j]
+                    scope1_str = f"::{scope1}" if scope1 else " (unscoped)"
+                    scope2_str = f"::{scope2}" if scope2 else " (unscoped)"
+                    conflicts.append(
+                        f"Rule 2/3 violation: Tasks {task1} and {task2} in Wave {wave} "
+                        f"both MODIFY '{filename}' with overlapping scopes: "
+                        f"{scope1_str} vs {scope2_str}"
+                    )
+
+        conflicts.extend(boundary_conflicts)
 
         return len(conflicts) == 0, conflicts
 
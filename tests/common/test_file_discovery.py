@@ -1,7 +1,9 @@
 """Tests for file discovery utilities."""
 
+import os
 import time
 from pathlib import Path
+from unittest.mock import patch
 
 from forge_hooks.common.file_discovery import find_newest_file, get_recent_files
 
@@ -50,6 +52,19 @@ def test_get_recent_files_extension_filtering(temp_dir: Path):
     assert all(f.endswith(".md") for f in files)
 
 
+def test_get_recent_files_skips_directories(temp_dir: Path):
+    """Test that a directory whose name has the extension is not returned."""
+    spec_dir = temp_dir / "specs"
+    spec_dir.mkdir()
+
+    (spec_dir / "drafts.md").mkdir()
+    (spec_dir / "plan.md").write_text("# Plan")
+
+    files = get_recent_files(str(spec_dir), ".md", 5)
+    assert files == [str(spec_dir / "plan.md")]
+    assert find_newest_file(str(spec_dir), ".md", 5) == str(spec_dir / "plan.md")
+
+
 def test_get_recent_files_extension_without_dot(temp_dir: Path):
     """Test extension matching works with or without leading dot."""
     spec_dir = temp_dir / "specs"
@@ -117,3 +132,44 @@ def test_find_newest_file_multiple_files(temp_dir: Path):
     newest = find_newest_file(str(spec_dir), ".md", 5)
     # file2 should be newer
     assert newest == str(file2)
+
+
+def test_find_newest_file_prefers_newer_untracked_file_in_subdirectory(temp_dir: Path):
+    """Test a newer untracked file from git beats an older recent top-level file."""
+    spec_dir = temp_dir / "specs"
+    (spec_dir / "sub").mkdir(parents=True)
+
+    top_file = spec_dir / "top.md"
+    top_file.write_text("# Top")
+    top_mtime = time.time() - 2 * 60
+    os.utime(top_file, (top_mtime, top_mtime))
+
+    sub_file = spec_dir / "sub" / "new.md"
+    sub_file.write_text("# New")
+
+    with patch(
+        "forge_hooks.common.file_discovery.get_git_untracked_files",
+        return_value=[str(sub_file)],
+    ):
+        newest = find_newest_file(str(spec_dir), ".md", 5)
+
+    assert newest == str(sub_file)
+
+
+def test_find_newest_file_falls_back_to_git(temp_dir: Path):
+    """Test an old untracked file from git is used when nothing is recent."""
+    spec_dir = temp_dir / "specs"
+    spec_dir.mkdir()
+
+    old_file = spec_dir / "old.md"
+    old_file.write_text("# Old")
+    old_mtime = time.time() - 60 * 60
+    os.utime(old_file, (old_mtime, old_mtime))
+
+    with patch(
+        "forge_hooks.common.file_discovery.get_git_untracked_files",
+        return_value=[str(old_file)],
+    ):
+        newest = find_newest_file(str(spec_dir), ".md", 5)
+
+    assert newest == str(old_file)
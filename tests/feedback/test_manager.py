@@ -232,3 +232,46 @@ class TestFeedbackManager:
 
         assert len(items) == 1
         assert items[0]["type"] == "improvement"
+
+    def test_iter_feedback_yields_same_items_as_list_feedback(self, tmp_path):
+        """Test that iter_feedback lazily yields what list_feedback returns."""
+        learnings_dir = tmp_path / "learnings"
+        manager = FeedbackManager(learnings_dir)
+        manager.initialize()
+
+        feedback_data = {
+            "session_id": "test-session",
+            "cwd": str(tmp_path),
+            "feedback": [
+                {"type": "improvement", "title": "Improvement Item", "description": "Test"},
+                {"type": "bug-report", "title": "Bug Item", "description": "Test"},
+            ],
+        }
+        manager.save_feedback(feedback_data)
+
+        items = manager.iter_feedback()
+
+        assert not isinstance(items, list)
+        assert list(items) == manager.list_feedback()
+        assert list(manager.iter_feedback(feedback_type="bug-report"))[0]["type"] == "bug-report"
+
+    def test_save_feedback_updates_project_feedback_count(self, tmp_path):
+        """Test that save_feedback records the project's feedback count."""
+        learnings_dir = tmp_path / "learnings"
+        manager = FeedbackManager(learnings_dir)
+        manager.initialize()
+
+        feedback_data = {
+            "session_id": "test-session",
+            "cwd": str(tmp_path),
+            "feedback": [
+                {"type": "improvement", "title": "Item 1", "description": "Test"},
+                {"type": "pattern", "title": "Item 2", "description": "Test"},
+            ],
+        }
+        manager.save_feedback(feedback_data)
+        manager.save_feedback(feedback_data)
+
+        projects = json.loads(manager.projects_file.read_text())
+        slug = manager.get_project_slug(str(tmp_path))
+        assert projects["projects"][slug]["feedback_count"] == 4
@@ -102,3 +102,20 @@ class TestFeedbackStats:
 
         assert stats_file.exists()
         assert stats_file.parent.exists()
+
+    def test_to_json_matches_json_dumps(self):
+        """Test that to_json produces the same document as json.dumps."""
+        stats = FeedbackStats(
+            total=3,
+            by_type={"improvement": 2, "bug-report": 1},
+            by_project={"project1": 3},
+            last_updated="2024-01-01T00:00:00",
+        )
+
+        expected = {
+            "total": 3,
+            "by_type": {"improvement": 2, "bug-report": 1},
+            "by_project": {"project1": 3},
+            "last_updated": "2024-01-01T00:00:00",
+        }
+        assert stats.to_json().decode() == json.dumps(expected, indent=2)
@@ -56,6 +56,14 @@ class TestYouTubeFetcher:
 
         assert video_id == "dQw4w9WgXcQ"
 
+    def test_extract_video_id_rejects_malformed_direct_id(self):
+        """Test that near-miss video IDs are not returned as-is."""
+        fetcher = YouTubeFetcher()
+
+        assert fetcher.extract_video_id("a-b_c1234XY") == "a-b_c1234XY"
+        assert fetcher.extract_video_id("dQw4w9WgXc!") is None
+        assert fetcher.extract_video_id("dQw4w9WgXcQQ") is None
+
     def test_extract_video_id_returns_none_for_invalid_url(self):
         """Test that invalid URL returns None."""
         fetcher = YouTubeFetcher()
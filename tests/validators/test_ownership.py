@@ -4,6 +4,8 @@ from pathlib import Path
 
 from forge_hooks.validators.ownership import (
     FileOwnershipValidator,
+    TaskOwnership,
+    _overlapping_pairs,
     parse_scope,
     scopes_overlap,
 )
@@ -66,6 +68,27 @@ def test_scopes_no_overlap():
     assert not scopes_overlap("ClassA.method1", "ClassA.method2")
 
 
+def test_overlapping_pairs_matches_pairwise_scan():
+    """Test sorted sweep finds non-adjacent nested scopes and unscoped pairs."""
+    modifiers = [
+        ("task-1", "ClassA.method"),
+        ("task-2", "ClassA-x"),
+        ("task-3", "ClassA"),
+        ("task-4", "ClassA.other"),
+        ("task-5", None),
+        ("task-6", "ClassB"),
+    ]
+    expected = [
+        (i, j)
+        for i in range(len(modifiers))
+        for j in range(i + 1, len(modifiers))
+        if scopes_overlap(modifiers[i][1], modifiers[j][1])
+    ]
+
+    assert _overlapping_pairs(modifiers) == expected
+    assert (0, 2) in expected and (2, 3) in expected
+
+
 def test_ownership_validator_no_file(temp_dir: Path):
     """Test validator fails when no plan file exists."""
     spec_dir = temp_dir / "specs"
@@ -121,6 +144,29 @@ def test_ownership_validator_rule1_violation(temp_dir: Path):
     assert "src/foo.py" in result.reason
 
 
+def test_ownership_validator_rule1_same_task_listed_twice(temp_dir: Path):
+    """Test Rule 1: A task naming the same file twice in CREATE is not a conflict."""
+    spec_dir = temp_dir / "specs"
+    spec_dir.mkdir()
+
+    plan_file = spec_dir / "plan.md"
+    plan_file.write_text("""# Plan
+
+### Task 1
+**Task ID:** task-1
+**Wave:** 1
+**File Ownership:**
+- CREATE: src/foo.py, src/foo.py::Helper
+- MODIFY: -
+- BOUNDARY: -
+""")
+
+    validator = FileOwnershipValidator(str(spec_dir), ".md", 5)
+    result = validator.validate()
+
+    assert result.is_success
+
+
 def test_ownership_validator_rule23_violation_unscoped(temp_dir: Path):
     """Test Rule 2/3: Parallel tasks modify same file (unscoped)."""
     spec_dir = temp_dir / "specs"
@@ -225,3 +271,51 @@ def test_ownership_validator_empty_plan(temp_dir: Path):
     # Should succeed - nothing to validate
     assert result.is_success
     assert "No tasks found" in result.message
+
+
+def test_parse_task_metadata_continuation_and_empty_values():
+    """Test multi-line values continue until the next item and empty items stay empty."""
+    validator = FileOwnershipValidator("specs", ".md", 5)
+    tasks = validator._parse_task_metadata("""# Plan
+
+### Task 1
+**Task ID:** task-1
+**Wave:** W2
+**File Ownership:**
+- CREATE:
+- MODIFY: src/foo.py::ClassA,
+  src/bar.py
+- BOUNDARY: src/baz.py
+**Acceptance Criteria:**
+- Tests pass
+""")
+
+    assert tasks == {
+        "task-1": TaskOwnership(
+            wave=2,
+            create=[],
+            modify=["src/foo.py::ClassA", "src/bar.py"],
+            boundary=["src/baz.py"],
+        )
+    }
+
+
+def test_parse_task_metadata_task_without_wave_is_skipped():
+    """Test a task missing its Wave doesn't absorb the following task."""
+    validator = FileOwnershipValidator("specs", ".md", 5)
+    tasks = validator._parse_task_metadata("""# Plan
+
+### Task 1
+**Task ID:** task-1
+**File Ownership:**
+- CREATE: src/foo.py
+
+### Task 2
+**Task ID:** task-2
+**Wave:** 1
+**File Ownership:**
+- CREATE: src/bar.py
+""")
+
+    assert list(tasks) == ["task-2"]
+    assert tasks["task-2"].create == ["src/bar.py"]